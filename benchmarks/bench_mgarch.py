@@ -0,0 +1,67 @@
+"""BEKK, CCC and DCC fit time and peak memory as the number of assets grows.
+
+Uses the simulated portfolio of ``bench_dcc.py``. Every model streams its
+``T x N x N`` covariance path to a memory-mapped ``.npy`` file in time
+blocks, so the traced peak is set by the block size rather than by ``T``.
+Full BEKK has ``2 N^2`` parameters and is only run up to ``--full-max``
+assets.
+
+    python benchmarks/bench_mgarch.py
+    python benchmarks/bench_mgarch.py --assets 2 5 10 20 --nobs 20000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bench_dcc import simulate  # noqa: E402
+from course.engines.dcc import dcc  # noqa: E402
+from course.engines.mgarch import bekk, ccc, from_dcc  # noqa: E402
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--assets", type=int, nargs="+", default=[2, 5, 10])
+    parser.add_argument("--nobs", type=int, default=2_500)
+    parser.add_argument("--full-max", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"T={args.nobs:,}")
+    print(f"{'N':>4}  {'model':15}{'params':>8}{'seconds':>10}{'peak MB':>10}{'H_t MB':>10}{'log-lik':>16}")
+    for n in args.assets:
+        returns = simulate(args.nobs, n, np.random.default_rng(0))
+        models = {
+            "bekk-diagonal": lambda: bekk(returns, kind="diagonal"),
+            "bekk-full": lambda: bekk(returns, kind="full"),
+            "ccc": lambda: ccc(returns, workers=args.workers),
+            "dcc": lambda: from_dcc(dcc(returns, workers=args.workers)),
+        }
+        if n > args.full_max:
+            del models["bekk-full"]
+        for name, function in models.items():
+            result, elapsed, peak = measure(function)
+            size = os.path.getsize(result.path) / 2 ** 20
+            print(f"{n:>4}  {name:15}{result.nparams:>8}{elapsed:>10.2f}{peak / 2 ** 20:>10.1f}{size:>10.1f}"
+                  f"{result.loglik:>16,.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Partial and multiple wavelet coherence for a growing number of series.
+
+Compares :func:`course.engines.partial_coherence.partial_coherence`, which
+transforms each series once, with a pairwise approach that recomputes both
+CWTs for every one of the ``k(k+1)/2`` cross-spectra. The two give the same
+spectra; the report shows the time each spends on transforms and in total.
+
+    python benchmarks/bench_partial_coherence.py
+    python benchmarks/bench_partial_coherence.py --series 4 8 10 --nobs 20000 --scales 100
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from course.engines.cwt import cwt  # noqa: E402
+from course.engines.partial_coherence import partial_coherence  # noqa: E402
+
+
+def pairwise_transforms(series, dj, count):
+    """Seconds spent transforming when each pair gets its own two CWTs."""
+    k = series.shape[0]
+    start = time.perf_counter()
+    for i in range(k):
+        for j in range(i, k):
+            cwt(series[i], dj=dj, count=count)
+            cwt(series[j], dj=dj, count=count)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, nargs="+", default=[3, 6, 10])
+    parser.add_argument("--nobs", type=int, default=5_000)
+    parser.add_argument("--scales", type=int, default=80)
+    parser.add_argument("--voices", type=int, default=8)
+    args = parser.parse_args()
+
+    dj = 1.0 / args.voices
+    rng = np.random.default_rng(0)
+    print(f"n={args.nobs:,}  scales={args.scales}")
+    print(f"{'k':>4}{'spectra':>9}{'shared CWT (s)':>16}{'pairwise CWT (s)':>18}{'partial total (s)':>19}")
+    for k in args.series:
+        common = rng.standard_normal(args.nobs)
+        series = common + rng.standard_normal((k, args.nobs))
+        start = time.perf_counter()
+        cwt(series, dj=dj, count=args.scales)
+        shared = time.perf_counter() - start
+        pairwise = pairwise_transforms(series, dj, args.scales)
+        start = time.perf_counter()
+        partial_coherence(series, dj=dj, count=args.scales)
+        total = time.perf_counter() - start
+        print(f"{k:>4}{k * (k + 1) // 2:>9}{shared:>16.2f}{pairwise:>18.2f}{total:>19.2f}")
+
+
+if __name__ == "__main__":
+    main()
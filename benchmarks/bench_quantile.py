@@ -0,0 +1,52 @@
+"""Warm-started quantile profile versus independent cold solves.
+
+Times :func:`course.engines.quantile.quantile_profile` on the 19-quantile
+grid 0.05..0.95 and the same grid solved quantile by quantile with the full
+Frisch–Newton solver, and reports the largest check-loss difference.
+
+    python benchmarks/bench_quantile.py
+    python benchmarks/bench_quantile.py --nobs 200000 --regressors 8
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from course.engines.quantile import check_loss, frisch_newton, quantile_profile  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nobs", type=int, default=50_000)
+    parser.add_argument("--regressors", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n, k = args.nobs, args.regressors
+    X = np.column_stack([np.ones(n), rng.standard_normal((n, k - 1))])
+    y = X @ rng.standard_normal(k) + (1.0 + 0.5 * np.abs(X[:, 1])) * rng.standard_t(3, n)
+
+    start = time.perf_counter()
+    profile = quantile_profile(y, X)
+    warm = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cold = np.array([frisch_newton(X, y, tau) for tau in profile.taus])
+    cold_time = time.perf_counter() - start
+
+    loss = np.array([check_loss(y - X @ beta, tau) for beta, tau in zip(cold, profile.taus)])
+    print(f"n={n:,}  k={k}  quantiles={profile.taus.shape[0]}")
+    print(f"{'warm-started grid (s)':28}{warm:>10.3f}")
+    print(f"{'cold solves (s)':28}{cold_time:>10.3f}")
+    print(f"{'speed-up':28}{cold_time / warm:>10.1f}x")
+    print(f"{'max rel. check-loss gap':28}{np.max(np.abs(profile.objective - loss) / loss):>10.2e}")
+    print(f"{'median reduced problem':28}{int(np.median(profile.reduced)):>10,}")
+
+
+if __name__ == "__main__":
+    main()
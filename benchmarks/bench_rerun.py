@@ -0,0 +1,71 @@
+"""Startup and per-rerun cost of the course app.
+
+Drives the app headlessly with ``streamlit.testing`` and reports, for every
+sidebar page, the mean wall time of a rerun after the page is selected.
+Pass ``--compare OTHER_SCRIPT`` (for example a checkout of the old single-file
+``crs.py``) to print both entry scripts side by side.
+
+    python benchmarks/bench_rerun.py --reruns 20
+    python benchmarks/bench_rerun.py --compare /tmp/crs_monolithic.py
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from course.registry import PAGES  # noqa: E402
+
+
+def parse_cost(script, repeat=50):
+    """Mean seconds to compile the entry script, paid on every rerun."""
+    source = Path(script).read_text(encoding="utf-8")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        compile(source, str(script), "exec")
+    return (time.perf_counter() - start) / repeat
+
+
+def rerun_costs(script, reruns):
+    """Startup time and mean rerun time per page for one entry script."""
+    start = time.perf_counter()
+    at = AppTest.from_file(str(script), default_timeout=60).run()
+    startup = time.perf_counter() - start
+
+    costs = {}
+    for label in PAGES:
+        at.sidebar.radio[0].set_value(label).run()
+        start = time.perf_counter()
+        for _ in range(reruns):
+            at.run()
+        costs[label] = (time.perf_counter() - start) / reruns
+    return startup, costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default=ROOT / "crs.py", type=Path)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args()
+
+    scripts = [args.script] + ([args.compare] if args.compare else [])
+    results = {s: (parse_cost(s),) + rerun_costs(s, args.reruns) for s in scripts}
+
+    header = f"{'':32}" + "".join(f"{s.name:>20}" for s in scripts)
+    print(header)
+    print(f"{'compile (ms)':32}" + "".join(f"{r[0] * 1e3:>20.2f}" for r in results.values()))
+    print(f"{'startup (ms)':32}" + "".join(f"{r[1] * 1e3:>20.1f}" for r in results.values()))
+    for label in PAGES:
+        row = "".join(f"{r[2][label] * 1e3:>20.1f}" for r in results.values())
+        print(f"{label:32}{row}")
+    means = "".join(f"{sum(r[2].values()) / len(PAGES) * 1e3:>20.1f}" for r in results.values())
+    print(f"{'mean rerun (ms)':32}{means}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Rolling OLS by moment updates versus refitting every window.
+
+Times :func:`course.engines.rolling.rolling_ols` on ``n`` observations
+(default: 30 years of daily data with 5-year windows) and extrapolates the
+cost of refitting each window from scratch from a sample of windows.
+
+    python benchmarks/bench_rolling.py
+    python benchmarks/bench_rolling.py --nobs 1000000 --regressors 8
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from course.engines.rolling import rolling_ols  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nobs", type=int, default=30 * 252)
+    parser.add_argument("--window", type=int, default=5 * 252)
+    parser.add_argument("--regressors", type=int, default=4)
+    parser.add_argument("--sample", type=int, default=500, help="windows refitted to estimate the naive cost")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    n, w, k = args.nobs, args.window, args.regressors
+    X = np.column_stack([np.ones(n), rng.standard_normal((n, k - 1))])
+    y = X @ rng.standard_normal(k) + rng.standard_normal(n)
+
+    start = time.perf_counter()
+    result = rolling_ols(y, X, w)
+    updating = time.perf_counter() - start
+
+    windows = result.ends.shape[0]
+    ends = result.ends[np.linspace(0, windows - 1, min(args.sample, windows)).astype(int)]
+    start = time.perf_counter()
+    worst = 0.0
+    for i, end in zip(np.searchsorted(result.ends, ends), ends):
+        beta = np.linalg.lstsq(X[end - w + 1:end + 1], y[end - w + 1:end + 1], rcond=None)[0]
+        worst = max(worst, np.abs(beta - result.params[i]).max())
+    refit = (time.perf_counter() - start) / ends.shape[0] * windows
+
+    print(f"n={n:,}  window={w:,}  k={k}  windows={windows:,}")
+    print(f"{'updating moments (s)':28}{updating:>10.3f}")
+    print(f"{'refit every window (s, est.)':28}{refit:>10.3f}")
+    print(f"{'speed-up':28}{refit / updating:>10.1f}x")
+    print(f"{'max |beta difference|':28}{worst:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
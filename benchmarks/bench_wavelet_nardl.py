@@ -0,0 +1,64 @@
+"""Wavelet-NARDL-GARCH pipeline: serial versus one pool task per scale.
+
+Runs :func:`course.engines.wavelet_nardl.wavelet_nardl` with one worker and
+with ``--workers`` processes, and reports the bytes pickled per task. A
+task carries a shared-memory handle, not its components. The pickled size
+of one scale's components is shown for comparison.
+
+    python benchmarks/bench_wavelet_nardl.py
+    python benchmarks/bench_wavelet_nardl.py --nobs 200000 --levels 6 --workers 4
+"""
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from course.engines import wavelet_nardl as engine  # noqa: E402
+from course.engines.parallel import default_workers, shared_array  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nobs", type=int, default=50_000)
+    parser.add_argument("--levels", type=int, default=5)
+    parser.add_argument("--regressors", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = 50.0 + np.cumsum(rng.standard_normal((args.nobs, args.regressors)), axis=0)
+    dX = np.diff(X, axis=0, prepend=X[:1])
+    y = 10.0 + np.cumsum(np.where(dX > 0, 1.0, 0.4) * dX, axis=0).sum(axis=1) + rng.standard_normal(args.nobs)
+
+    # The smallest serial threshold forces the pool for the parallel run.
+    engine.SERIAL_CELLS = 0
+    timings = {}
+    for workers in sorted({1, args.workers}):
+        start = time.perf_counter()
+        result = engine.wavelet_nardl(y, X, args.levels, workers=workers)
+        timings[workers] = time.perf_counter() - start
+
+    scale = np.zeros((1 + args.regressors, args.nobs))
+    with shared_array(scale) as handle:
+        task = (handle, 0, "D1", 2, 2, "aic", "gjr", "normal", 20)
+        print(f"pickled task: {len(pickle.dumps(task)):,} bytes with a shared-memory handle, "
+              f"{len(pickle.dumps(scale)):,} bytes for one scale's components")
+    print(f"n={args.nobs:,}  levels={args.levels}  tasks={len(result.labels)}")
+    for fit in result.fits:
+        if fit.error is None:
+            print(f"{fit.label:>9}  L+={fit.long_run[0, 0]:8.3f}  L-={fit.long_run[0, 1]:8.3f}  "
+                  f"p(L+=L-)={fit.long_run_test[0][1]:.3f}  persistence={fit.persistence:.3f}")
+        else:
+            print(f"{fit.label:>9}  {fit.error}")
+    for workers, seconds in timings.items():
+        print(f"{workers:>3} worker(s): {seconds:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
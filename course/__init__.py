@@ -0,0 +1 @@
+"""Advanced Econometric Methods course application."""
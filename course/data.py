@@ -0,0 +1,157 @@
+"""Sample datasets and the data picker shared by the labs."""
+import io
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy.signal import lfilter
+
+
+def _fourier_break_series(n, rng):
+    t = np.arange(1, n + 1)
+    smooth_break = 2.0 * np.sin(2 * np.pi * t / n) + 1.5 * np.cos(2 * np.pi * 2 * t / n)
+    shocks = rng.standard_normal((n, 2))
+    stationary = lfilter([1.0], [1.0, -0.5], shocks[:, 1])
+    return pd.DataFrame({
+        "random_walk": np.cumsum(shocks[:, 0]) + smooth_break,
+        "break_stationary": stationary + smooth_break,
+    })
+
+
+def _time_varying_regression(n, rng):
+    t = np.arange(1, n + 1)
+    x = rng.standard_normal((n, 2))
+    beta1 = 1.0 + np.sin(2 * np.pi * t / n)
+    beta2 = np.where(t > n // 2, -0.5, 0.5)
+    return pd.DataFrame({
+        "y": 0.5 + beta1 * x[:, 0] + beta2 * x[:, 1] + rng.standard_normal(n),
+        "x1": x[:, 0],
+        "x2": x[:, 1],
+    })
+
+
+def _cointegrated_system(n, rng):
+    shocks = rng.standard_normal((n, 3))
+    x = np.cumsum(shocks[:, :2], axis=0)
+    u = lfilter([1.0], [1.0, -0.6], shocks[:, 2])
+    return pd.DataFrame({
+        "y": 1.0 + 0.8 * x[:, 0] - 0.5 * x[:, 1] + u,
+        "x1": x[:, 0],
+        "x2": x[:, 1],
+    })
+
+
+def _asymmetric_pass_through(n, rng):
+    shocks = rng.standard_normal((n, 2))
+    oil = np.cumsum(shocks[:, 0])
+    rises = np.cumsum(np.maximum(np.diff(oil, prepend=oil[0]), 0.0))
+    falls = oil - oil[0] - rises
+    # Prices follow increases fully but only 40% of decreases ("rockets and feathers").
+    target = 1.0 * rises + 0.4 * falls
+    price = lfilter([0.3], [1.0, -0.7], target) + lfilter([1.0], [1.0, -0.5], shocks[:, 1])
+    return pd.DataFrame({"price": 10.0 + price, "oil": 50.0 + oil})
+
+
+def _heteroskedastic_regression(n, rng):
+    x1 = rng.uniform(0.0, 4.0, n)
+    x2 = rng.standard_normal(n)
+    # The noise scale grows with x1, so the x1 slope differs across quantiles.
+    noise = (0.5 + 0.5 * x1) * rng.standard_t(5, n)
+    return pd.DataFrame({"y": 1.0 + x1 + 0.5 * x2 + noise, "x1": x1, "x2": x2})
+
+
+def _tail_spillover(n, rng):
+    x = 0.8 * rng.standard_t(5, n)
+    # Large moves in x widen the next y shock: no effect at the median, but
+    # causality in both tails and in variance.
+    scale = 0.5 + 0.8 * np.abs(np.r_[0.0, x[:-1]])
+    y = lfilter([1.0], [1.0, -0.2], scale * rng.standard_normal(n))
+    return pd.DataFrame({"y": y, "x": x})
+
+
+def _asset_returns(n, rng):
+    # GJR-GARCH(1,1) percent returns with Student t shocks. A common factor
+    # gives the assets a correlation that drifts between about 0.2 and 0.8.
+    omega = np.array([0.02, 0.01, 0.05])
+    alpha = np.array([0.03, 0.04, 0.05])
+    gamma = np.array([0.09, 0.02, 0.06])
+    beta = np.array([0.90, 0.93, 0.89])
+    rho = 0.5 + 0.3 * np.sin(4 * np.pi * np.arange(n) / n)
+    shocks = rng.standard_t(6, (n, 4)) / np.sqrt(1.5)
+    z = np.sqrt(rho)[:, None] * shocks[:, :1] + np.sqrt(1.0 - rho)[:, None] * shocks[:, 1:]
+    returns = np.empty((n, 3))
+    s2 = omega / (1.0 - alpha - gamma / 2 - beta)
+    for t in range(n):
+        returns[t] = np.sqrt(s2) * z[t]
+        s2 = omega + (alpha + gamma * (returns[t] < 0)) * returns[t] ** 2 + beta * s2
+    return pd.DataFrame(returns + 0.03, columns=["equity", "bond", "commodity"])
+
+
+SAMPLES = {
+    "Smooth structural breaks": _fourier_break_series,
+    "Time-varying regression": _time_varying_regression,
+    "Cointegrated system": _cointegrated_system,
+    "Asymmetric pass-through": _asymmetric_pass_through,
+    "Heteroskedastic regression": _heteroskedastic_regression,
+    "Tail spillover": _tail_spillover,
+    "Asset returns": _asset_returns,
+}
+
+
+@st.cache_data(show_spinner=False)
+def load_sample(name, n, seed):
+    """Simulated sample dataset ``name`` with ``n`` observations."""
+    frame = SAMPLES[name](n, np.random.default_rng(seed))
+    frame.index.name = "t"
+    return frame
+
+
+@st.cache_data(show_spinner=False)
+def read_csv(data):
+    """Numeric columns of an uploaded CSV file, with missing rows dropped."""
+    frame = pd.read_csv(io.BytesIO(data))
+    return frame.select_dtypes("number").dropna()
+
+
+def dataset_input(key, default_sample=None, default_n=500):
+    """Let the user pick a sample dataset or upload a CSV.
+
+    Returns a DataFrame of numeric columns, or ``None`` while no file has been
+    uploaded.
+    """
+    source = st.radio("Data source", ["Sample data", "Upload CSV"], horizontal=True, key=f"{key}-source")
+    if source == "Upload CSV":
+        upload = st.file_uploader("CSV file with one column per series", type="csv", key=f"{key}-upload")
+        if upload is None:
+            st.info("Upload a CSV file to run the analysis.")
+            return None
+        frame = read_csv(upload.getvalue())
+        if frame.empty:
+            st.error("The uploaded file has no numeric columns.")
+            return None
+        return frame
+
+    names = list(SAMPLES)
+    col1, col2, col3 = st.columns([2, 1, 1])
+    name = col1.selectbox(
+        "Sample dataset", names,
+        index=names.index(default_sample) if default_sample in names else 0,
+        key=f"{key}-sample",
+    )
+    n = col2.number_input("Observations", 100, 1_000_000, default_n, step=100, key=f"{key}-n")
+    seed = col3.number_input("Seed", 0, 2 ** 31 - 1, 42, key=f"{key}-seed")
+    return load_sample(name, int(n), int(seed))
+
+
+def series_input(key, default_sample=None, default_column=None, default_n=500):
+    """Pick a single series from :func:`dataset_input`, or ``None``."""
+    frame = dataset_input(key, default_sample, default_n)
+    if frame is None:
+        return None
+    columns = list(frame.columns)
+    column = st.selectbox(
+        "Series", columns,
+        index=columns.index(default_column) if default_column in columns else 0,
+        key=f"{key}-column",
+    )
+    return frame[column]
@@ -0,0 +1,5 @@
+"""Numerical engines behind the interactive labs.
+
+Engines are plain NumPy/SciPy code with no Streamlit imports, so they can be
+used from scripts and benchmarks as well as from ``course.labs``.
+"""
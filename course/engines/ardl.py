@@ -0,0 +1,236 @@
+"""ARDL models and the Pesaran–Shin–Smith (2001) bounds test.
+
+The ARDL(p, q_1, ..., q_k) model
+
+    y_t = d_t + sum_{i=1..p} phi_i y_{t-i} + sum_j sum_{l=0..q_j} b_jl x_{j,t-l} + e_t
+
+is selected by AIC/BIC over ``p = 1..pmax`` and ``q_j = 0..qmax`` on one
+common sample. The lagged design ``[d_t, x_1 lags 0..qmax, ..., y lags
+1..pmax]`` and its Gram matrix are built once. A specification is a column
+mask over that Gram matrix: masked-out regressors become identity rows, so a
+whole chunk of ``(q_1, ..., q_k)`` candidates is factorised in one batched
+Cholesky. With the ``y`` lags last, the SSR of every ``p`` falls out of each
+factorisation as a cumulative sum (see :func:`course.engines.design.nested_ssr`).
+
+The bounds test uses the conditional error-correction form of the selected
+model. Its I(0)/I(1) critical values are simulated for the sample's own size
+and number of regressors under PSS's null DGP, then cached.
+"""
+import functools
+import itertools
+from dataclasses import dataclass
+
+import numpy as np
+
+from course.engines.design import deterministic_terms, information_criterion, lag_matrix, nested_ssr, ols
+
+# PSS cases: III unrestricted intercept, V unrestricted intercept and trend.
+CASES = {"c": "III", "ct": "V"}
+# Samples longer than this are simulated at this size; the bounds have converged.
+SIMULATION_NOBS = 1000
+
+
+@dataclass
+class ARDLResult:
+    order: tuple            # (p, q_1, ..., q_k)
+    names: list
+    params: np.ndarray      # levels ARDL coefficients, in ``names`` order
+    bse: np.ndarray
+    cov: np.ndarray
+    f_stat: float           # PSS F on the lagged levels
+    t_stat: float           # PSS t on y_{t-1}
+    long_run: np.ndarray    # long-run coefficients of the x's
+    long_run_se: np.ndarray
+    ect: float              # speed of adjustment (coefficient on y_{t-1} in the ECM)
+    nobs: int
+    trend: str
+    ic: str
+    specifications: np.ndarray  # (candidates, k + 1) orders, best first
+    criterion: np.ndarray       # (candidates,) matching ``specifications``
+
+
+def ardl_design(y, X, pmax, qmax, trend="c"):
+    """Target and the full lagged design over the common sample.
+
+    Columns are ``[d_t, x_1 lags 0..qmax, ..., x_k lags 0..qmax, y lags 1..pmax]``.
+    """
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float).reshape(y.shape[0], -1)
+    start = max(pmax, qmax, 1)
+    n = y.shape[0]
+    blocks = [deterministic_terms(n, trend)[start:]]
+    for x in X.T:
+        blocks.append(x[start:, None])
+        blocks.append(lag_matrix(x, start)[:, :qmax])
+    blocks.append(lag_matrix(y, start)[:, :pmax])
+    return y[start:], np.hstack(blocks)
+
+
+def _orders(k, qmax):
+    return np.array(list(itertools.product(range(qmax + 1), repeat=k)), dtype=int).reshape(-1, k)
+
+
+def grid_criterion(y, X, pmax=4, qmax=4, trend="c", ic="aic", chunk=512):
+    """Information criterion of every ARDL order on the common sample.
+
+    Returns ``orders`` of shape ``(candidates, k + 1)`` as ``(p, q_1..q_k)``
+    and the matching criterion values.
+    """
+    y = np.asarray(y, dtype=float)
+    k = np.asarray(X, dtype=float).reshape(y.shape[0], -1).shape[1]
+    target, Z = ardl_design(y, X, pmax, qmax, trend)
+    nobs, m = Z.shape
+    base = m - pmax - k * (qmax + 1)
+    Z = Z / np.linalg.norm(Z, axis=0)
+    gram, xty, yty = Z.T @ Z, Z.T @ target, target @ target
+
+    q = _orders(k, qmax)
+    keep_x = (np.arange(qmax + 1) <= q[:, :, None]).reshape(len(q), -1)
+    mask = np.hstack([np.ones((len(q), base), bool), keep_x, np.ones((len(q), pmax), bool)])
+    p = np.arange(1, pmax + 1)
+    values = np.empty((len(q), pmax))
+    for lo in range(0, len(q), chunk):
+        keep = mask[lo:lo + chunk].astype(float)
+        masked = gram * keep[:, :, None] * keep[:, None, :]
+        masked[:, np.arange(m), np.arange(m)] += 1.0 - keep
+        ssr = nested_ssr(masked, xty * keep, yty)[:, m - pmax:]
+        nparams = base + keep_x[lo:lo + chunk].sum(axis=1)[:, None] + p
+        values[lo:lo + chunk] = information_criterion(ssr, nobs, nparams, ic)
+
+    orders = np.column_stack([np.repeat(p[None], len(q), 0).ravel(), np.repeat(q, pmax, axis=0)])
+    return orders, values.ravel()
+
+
+def order_columns(order, qmax, trend="c"):
+    """Columns of :func:`ardl_design` used by ARDL ``order = (p, q_1..q_k)``.
+
+    The levels coefficients come out as ``[d_t, x_1 lags 0..q_1, ...,
+    y lags 1..p]``.
+    """
+    det = 2 if trend == "ct" else 1
+    k = len(order) - 1
+    columns = list(range(det))
+    for j, qj in enumerate(order[1:]):
+        columns += [det + j * (qmax + 1) + lag for lag in range(qj + 1)]
+    columns += [det + k * (qmax + 1) + i for i in range(order[0])]
+    return columns
+
+
+def _ecm_design(y, X, order, trend, start):
+    """Conditional ECM regressors: deterministics, levels, then differences."""
+    p, q = order[0], order[1:]
+    n = y.shape[0]
+    dy = np.diff(y)
+    levels = [y[start - 1:-1]]
+    diffs = [lag_matrix(dy, start - 1)[:, :p - 1]]
+    for x, qj in zip(X.T, q):
+        dx = np.diff(x)
+        # Levels enter at t-1, as in the simulated bounds design. With q_j = 0
+        # the contemporaneous difference stays in, since x_t = x_{t-1} + dx_t.
+        levels.append(x[start - 1:-1])
+        diffs.append(np.column_stack([dx[start - 1:], lag_matrix(dx, start - 1)])[:, :max(qj, 1)])
+    D = deterministic_terms(n, trend)[start:]
+    return dy[start - 1:], D, np.column_stack(levels), np.hstack(diffs)
+
+
+def _fit(target, Z):
+    gram_inv = np.linalg.inv(Z.T @ Z)
+    params = gram_inv @ (Z.T @ target)
+    resid = target - Z @ params
+    ssr = resid @ resid
+    return params, ssr * gram_inv / (Z.shape[0] - Z.shape[1]), ssr
+
+
+def ardl(y, X, pmax=4, qmax=4, trend="c", ic="aic", names=None):
+    """Select, estimate and bounds-test an ARDL model of ``y`` on ``X``."""
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float).reshape(y.shape[0], -1)
+    k = X.shape[1]
+    names = [f"x{j + 1}" for j in range(k)] if names is None else list(names)
+    orders, values = grid_criterion(y, X, pmax, qmax, trend, ic)
+    rank = np.argsort(values, kind="stable")
+    order = tuple(int(v) for v in orders[rank[0]])
+    start = max(pmax, qmax, 1)
+
+    # Levels ARDL on the common sample used for selection.
+    target, Z = ardl_design(y, X, pmax, qmax, trend)
+    det = 2 if trend == "ct" else 1
+    labels = ["const", "trend"][:det]
+    for j, qj in enumerate(order[1:]):
+        labels += [f"{names[j]}(t)" if lag == 0 else f"{names[j]}(t-{lag})" for lag in range(qj + 1)]
+    labels += [f"y(t-{i + 1})" for i in range(order[0])]
+    params, cov, _ = _fit(target, Z[:, order_columns(order, qmax, trend)])
+
+    # Bounds test on the equivalent conditional ECM.
+    dy, D, levels, diffs = _ecm_design(y, X, order, trend, start)
+    ecm_params, ecm_cov, ssr_u = _fit(dy, np.hstack([D, levels, diffs]))
+    ssr_r = _fit(dy, np.hstack([D, diffs]))[2]
+    nobs = dy.shape[0]
+    dof = nobs - D.shape[1] - levels.shape[1] - diffs.shape[1]
+    f_stat = (ssr_r - ssr_u) / (k + 1) / (ssr_u / dof)
+    pi = ecm_params[det:det + k + 1]
+    pi_cov = ecm_cov[det:det + k + 1, det:det + k + 1]
+
+    # Long-run coefficients -pi_x / pi_y with delta-method standard errors.
+    long_run = -pi[1:] / pi[0]
+    grad = np.column_stack([pi[1:] / pi[0] ** 2, -np.eye(k) / pi[0]])
+    long_run_se = np.sqrt(np.einsum("ij,jk,ik->i", grad, pi_cov, grad))
+
+    return ARDLResult(
+        order=order,
+        names=labels,
+        params=params,
+        bse=np.sqrt(np.diag(cov)),
+        cov=cov,
+        f_stat=float(f_stat),
+        t_stat=float(pi[0] / np.sqrt(pi_cov[0, 0])),
+        long_run=long_run,
+        long_run_se=long_run_se,
+        ect=float(pi[0]),
+        nobs=nobs,
+        trend=trend,
+        ic=ic,
+        specifications=orders[rank],
+        criterion=values[rank],
+    )
+
+
+def bounds_critical_values(k, nobs, trend="c", levels=(0.10, 0.05, 0.025, 0.01), reps=20_000, seed=2001):
+    """Simulated PSS I(0) and I(1) bounds for the F and t statistics.
+
+    Follows the PSS (2001) design: ``y`` is a random walk, and the ``k``
+    regressors are white noise (lower bound) or random walks (upper bound).
+    Returns ``{"F": (lower, upper), "t": (lower, upper)}``, each an array
+    over ``levels``. F rejects above the bounds, t below them. Samples
+    longer than 1000 are simulated at 1000, where the bounds have converged.
+    """
+    return _simulated_bounds(k, min(nobs, SIMULATION_NOBS), trend, tuple(levels), reps, seed)
+
+
+@functools.lru_cache(maxsize=64)
+def _simulated_bounds(k, nobs, trend, levels, reps, seed):
+    rng = np.random.default_rng(seed)
+    T = nobs + 1
+    D = deterministic_terms(T, trend)[1:]
+    out = {"F": [], "t": []}
+    for integrated in (False, True):
+        f_draws, t_draws = [], []
+        for done in range(0, reps, 2_000):
+            size = min(2_000, reps - done)
+            y = np.cumsum(rng.standard_normal((size, T)), axis=1)
+            x = rng.standard_normal((size, T, k))
+            if integrated:
+                x = np.cumsum(x, axis=1)
+            dy = np.diff(y, axis=1)
+            lagged = np.concatenate([y[:, :-1, None], x[:, :-1]], axis=2)
+            Z = np.concatenate([np.broadcast_to(D, (size,) + D.shape), lagged], axis=2)
+            beta, se, resid = ols(dy, Z)
+            resid_r = ols(dy, Z[:, :, :D.shape[1]])[2]
+            ssr_u = np.einsum("bn,bn->b", resid, resid)
+            ssr_r = np.einsum("bn,bn->b", resid_r, resid_r)
+            dof = dy.shape[1] - Z.shape[2]
+            f_draws.append((ssr_r - ssr_u) / (k + 1) / (ssr_u / dof))
+            t_draws.append(beta[:, D.shape[1]] / se[:, D.shape[1]])
+        out["F"].append(np.quantile(np.concatenate(f_draws), 1.0 - np.asarray(levels)))
+        out["t"].append(np.quantile(np.concatenate(t_draws), levels))
+    return {name: tuple(bounds) for name, bounds in out.items()}
@@ -0,0 +1,105 @@
+"""Parallel bootstrap driver shared by the bootstrap-based tests.
+
+A bootstrap is described by a picklable *replicator*: a callable
+``replicator(rng, size)`` that returns ``size`` bootstrap statistics drawn
+with the given ``numpy.random.Generator``. ``run_bootstrap`` splits the
+``B`` replications into batches, seeds every batch from one
+``SeedSequence`` and runs the batches on a shared process pool.
+
+Seeds belong to fixed-size batches rather than to workers, so a given
+``(B, seed, batch_size)`` reproduces the same draws whatever the number of
+workers or the order in which batches finish.
+"""
+import concurrent.futures as cf
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from course.engines.parallel import default_workers, process_pool
+
+
+def _run_batch(replicator, seed, size):
+    return np.asarray(replicator(np.random.default_rng(seed), size), dtype=float)
+
+
+def run_bootstrap(replicator, B, seed=0, workers=None, batch_size=32, progress=None):
+    """Draw ``B`` bootstrap statistics from ``replicator``.
+
+    Parameters
+    ----------
+    replicator : callable
+        Picklable ``replicator(rng, size) -> array`` of ``size`` statistics.
+    B : int
+        Number of replications.
+    seed : int
+        Root seed; batch ``i`` uses the ``i``-th child of ``SeedSequence(seed)``.
+    workers : int, optional
+        Process count; ``1`` runs in the calling process. Defaults to
+        :func:`default_workers`.
+    batch_size : int
+        Replications per task. Small enough to balance load over many cores
+        and keep progress updates frequent; independent of ``workers`` so
+        results do not depend on the machine.
+    progress : callable, optional
+        Called as ``progress(done, B)`` in the calling thread after each batch.
+    """
+    if B < 1:
+        raise ValueError("B must be positive")
+    workers = workers or default_workers()
+    sizes = [batch_size] * (B // batch_size)
+    if B % batch_size:
+        sizes.append(B % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    batches = [None] * len(sizes)
+    done = 0
+    if workers == 1:
+        for i, (child, size) in enumerate(zip(seeds, sizes)):
+            batches[i] = _run_batch(replicator, child, size)
+            done += size
+            if progress is not None:
+                progress(done, B)
+        return np.concatenate(batches)
+
+    pool = process_pool(workers)
+    try:
+        futures = {
+            pool.submit(_run_batch, replicator, child, size): i
+            for i, (child, size) in enumerate(zip(seeds, sizes))
+        }
+        for future in cf.as_completed(futures):
+            i = futures[future]
+            batches[i] = future.result()
+            done += sizes[i]
+            if progress is not None:
+                progress(done, B)
+    except BrokenProcessPool:
+        process_pool.cache_clear()
+        raise
+    return np.concatenate(batches)
+
+
+def critical_values(stats, levels=(0.01, 0.05, 0.10), tail="left"):
+    """Bootstrap critical values at the given significance ``levels``.
+
+    ``tail="left"`` rejects for small statistics (unit root t-ratios),
+    ``"right"`` for large ones (F and Wald statistics).
+    """
+    levels = np.asarray(levels, dtype=float)
+    if tail == "left":
+        return np.quantile(stats, levels)
+    if tail == "right":
+        return np.quantile(stats, 1.0 - levels)
+    raise ValueError(f"tail must be 'left' or 'right', got {tail!r}")
+
+
+def bootstrap_pvalue(stat, stats, tail="left"):
+    """Share of bootstrap statistics at least as extreme as ``stat``."""
+    stats = np.asarray(stats)
+    if tail == "left":
+        extreme = np.count_nonzero(stats <= stat)
+    elif tail == "right":
+        extreme = np.count_nonzero(stats >= stat)
+    else:
+        raise ValueError(f"tail must be 'left' or 'right', got {tail!r}")
+    return (extreme + 1) / (stats.shape[0] + 1)
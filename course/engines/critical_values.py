@@ -0,0 +1,152 @@
+"""Response-surface critical values and p-values for the unit root tests.
+
+For every test, deterministic specification and Fourier frequency the table
+holds MacKinnon-style response-surface coefficients
+
+    q_p(T) = b0 + b1 / T + b2 / T**2
+
+for a fixed grid of probabilities ``p``, fitted to simulated null quantiles
+at several sample sizes. A lookup evaluates one row of the table at ``T``
+and interpolates on the probability grid, so reporting a p-value costs the
+same whatever the sample size and needs no simulation.
+
+The table is a single ``.npy`` file, opened with ``mmap_mode="r"`` on the
+first lookup, so it is neither read at import nor copied into each process.
+Regenerate it with ``python -m course.engines.critical_values``.
+"""
+import argparse
+import functools
+import time
+from pathlib import Path
+
+import numpy as np
+
+from course.engines import unit_root
+
+TABLE_PATH = Path(__file__).resolve().parent.parent / "tables" / "unit_root_cv.npy"
+
+PROBABILITIES = np.r_[0.001, 0.0025, 0.005, np.arange(1, 100) / 100.0, 0.995, 0.9975, 0.999]
+SAMPLE_SIZES = (50, 100, 200, 400, 800)
+FOURIER_FREQUENCIES = (1, 2, 3, 4, 5)
+
+# test name: (rejection tail, deterministic specifications, Fourier frequencies)
+TESTS = {
+    "adf": ("left", ("c", "ct"), (0,)),
+    "adf_alpha": ("left", ("c", "ct"), (0,)),
+    "kpss": ("right", ("c", "ct"), (0,)),
+    "dfgls": ("left", ("c", "ct"), (0,)),
+    "MZa": ("left", ("c", "ct"), (0,)),
+    "MZt": ("left", ("c", "ct"), (0,)),
+    "MSB": ("left", ("c", "ct"), (0,)),
+    "MPT": ("left", ("c", "ct"), (0,)),
+    "za": ("left", ("c", "t", "ct"), (0,)),
+    "fourier_adf": ("left", ("c", "ct"), FOURIER_FREQUENCIES),
+    "fourier_kpss": ("right", ("c", "ct"), FOURIER_FREQUENCIES),
+}
+
+ENTRIES = [
+    (test, trend, k)
+    for test, (_, trends, frequencies) in TESTS.items()
+    for trend in trends
+    for k in frequencies
+]
+INDEX = {entry: i for i, entry in enumerate(ENTRIES)}
+
+
+@functools.lru_cache(maxsize=None)
+def _table():
+    table = np.load(TABLE_PATH, mmap_mode="r")
+    if table.shape != (len(ENTRIES), PROBABILITIES.shape[0], 3):
+        raise RuntimeError(f"{TABLE_PATH} does not match the table layout; rebuild it")
+    return table
+
+
+def quantile_curve(test, trend, nobs, frequency=0):
+    """Null quantiles at :data:`PROBABILITIES` for a sample of ``nobs``.
+
+    The surfaces are fitted on :data:`SAMPLE_SIZES` and extrapolate badly
+    below the smallest of them, so shorter samples raise ``ValueError``.
+    """
+    if nobs < SAMPLE_SIZES[0]:
+        raise ValueError(
+            f"the critical value tables start at T = {SAMPLE_SIZES[0]}; {nobs} observations are too few"
+        )
+    try:
+        row = INDEX[(test, trend, frequency)]
+    except KeyError:
+        raise ValueError(f"no critical values for test={test!r}, trend={trend!r}, frequency={frequency}") from None
+    curve = _table()[row] @ np.array([1.0, 1.0 / nobs, 1.0 / nobs ** 2])
+    return np.maximum.accumulate(curve)
+
+
+def critical_values(test, trend, nobs, frequency=0, levels=(0.01, 0.05, 0.10)):
+    """Critical values at significance ``levels`` in the test's rejection tail."""
+    levels = np.asarray(levels, dtype=float)
+    probs = levels if TESTS[test][0] == "left" else 1.0 - levels
+    return np.interp(probs, PROBABILITIES, quantile_curve(test, trend, nobs, frequency))
+
+
+def pvalue(stat, test, trend, nobs, frequency=0):
+    """p-value of ``stat``, clipped to the table's range ``[0.001, 0.999]``."""
+    cdf = np.interp(stat, quantile_curve(test, trend, nobs, frequency), PROBABILITIES)
+    return cdf if TESTS[test][0] == "left" else 1.0 - cdf
+
+
+def _null_statistics(walks, noise):
+    """Every table statistic on one chunk of simulated null paths."""
+    T = walks.shape[-1]
+    stats = {}
+    for trend in ("c", "ct"):
+        tau, alpha = unit_root.adf(walks, trend)
+        stats["adf", trend, 0] = tau
+        stats["adf_alpha", trend, 0] = alpha
+        stats["kpss", trend, 0] = unit_root.kpss(noise, trend, bandwidth=0)
+        stats["dfgls", trend, 0] = unit_root.dfgls(walks, trend)
+        for name, values in unit_root.ng_perron(walks, trend).items():
+            stats[name, trend, 0] = values
+        for k in FOURIER_FREQUENCIES:
+            stats["fourier_adf", trend, k] = unit_root.adf(walks, trend, frequency=k)[0]
+            stats["fourier_kpss", trend, k] = unit_root.kpss(noise, trend, bandwidth=0, frequency=k)
+    # Break dates on a grid of at most ~100 points keep the simulation tractable.
+    for model in ("c", "t", "ct"):
+        stats["za", model, 0] = unit_root.zivot_andrews(walks, model, step=unit_root.za_step(T))[0]
+    return stats
+
+
+def build_table(reps=10_000, seed=20240501, chunk=1_000, verbose=True):
+    """Simulate null quantiles and fit the response surfaces."""
+    rng = np.random.default_rng(seed)
+    quantiles = np.empty((len(ENTRIES), len(SAMPLE_SIZES), PROBABILITIES.shape[0]))
+    for j, T in enumerate(SAMPLE_SIZES):
+        start = time.perf_counter()
+        draws = {entry: [] for entry in ENTRIES}
+        for done in range(0, reps, chunk):
+            size = min(chunk, reps - done)
+            noise = rng.standard_normal((size, T))
+            walks = np.cumsum(rng.standard_normal((size, T)), axis=1)
+            for entry, values in _null_statistics(walks, noise).items():
+                draws[entry].append(values)
+        for i, entry in enumerate(ENTRIES):
+            quantiles[i, j] = np.quantile(np.concatenate(draws[entry]), PROBABILITIES)
+        if verbose:
+            print(f"T={T}: {reps} replications in {time.perf_counter() - start:.1f}s")
+
+    inv_T = 1.0 / np.asarray(SAMPLE_SIZES, dtype=float)
+    design = np.column_stack([np.ones_like(inv_T), inv_T, inv_T ** 2])
+    coef = np.linalg.lstsq(design, quantiles.transpose(1, 0, 2).reshape(len(SAMPLE_SIZES), -1), rcond=None)[0]
+    return coef.reshape(3, len(ENTRIES), -1).transpose(1, 2, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the unit root critical value table.")
+    parser.add_argument("--reps", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=20240501)
+    args = parser.parse_args()
+    table = build_table(args.reps, args.seed)
+    TABLE_PATH.parent.mkdir(exist_ok=True)
+    np.save(TABLE_PATH, table)
+    print(f"wrote {TABLE_PATH} {table.shape}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Monte Carlo significance of wavelet coherence against AR(1) red noise.
+
+Following Grinsted, Moore & Jevrejeva (2004), the null is two independent
+AR(1) series with the lag-1 autocorrelations of the data. Coherence is
+recomputed for ``B`` surrogate pairs, and the significance level at each
+scale is a quantile of the surrogate coherence over all draws and the
+dates inside the cone of influence. Outside it, zero padding drags the
+coherence down; counting those dates would lower the levels, most at
+coarse scales. Data points outside the cone are never marked significant.
+
+Keeping ``B`` full ``(scales x N)`` coherence maps is not feasible, so each
+task reduces its surrogates to a per-scale histogram of coherence over
+``BINS`` bins. Histograms add across tasks, and any level can be read off
+the sum. Tasks run on the shared process pool. Their seeds are children
+of one ``SeedSequence`` per fixed-size batch, as in
+:mod:`course.engines.bootstrap`, so the null does not depend on the number
+of workers.
+
+The null depends on the data only through ``N``, the two AR(1)
+coefficients, the scales and the wavelet. The coefficients are rounded to
+``AR_STEP`` and the surrogates use the rounded values, so a null
+distribution is an exact function of that key. It is saved in the cache
+directory under it, and similarly shaped series reuse it instead of
+drawing new surrogates.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import signal
+
+from course.engines.cwt import OMEGA0, CWTResult, coherence_from, cwt, scales
+from course.engines.parallel import parallel_map
+from course.engines.storage import cache_dir, content_key, save_array
+
+# Resolution of the AR(1) coefficients in the cache key.
+AR_STEP = 0.01
+# Bins of the per-scale coherence histogram over [0, 1].
+BINS = 200
+# Surrogate pairs per pool task.
+BATCH = 25
+# Bytes of complex transforms per chunk of surrogate pairs inside a task.
+SURROGATE_BYTES = 256 * 2 ** 20
+# Burn-in dropped from each simulated AR(1) series.
+BURN = 200
+LEVELS = (0.90, 0.95, 0.99)
+
+
+@dataclass
+class CoherenceSignificance:
+    levels: dict          # quantile -> (S,) coherence level per scale
+    ar: tuple             # rounded AR(1) coefficients of x and y
+    replications: int
+    reused: bool          # True when the null came from the disk cache
+    path: str
+
+    def significant(self, result, quantile=0.95):
+        """``(S, N)`` mask of coherence above the level at ``quantile``, inside the cone."""
+        return (result.coherence > self.levels[quantile][:, None]) & result.inside()
+
+
+def ar1(x):
+    """Lag-1 autocorrelation of ``x`` rounded to ``AR_STEP``, within (-1, 1)."""
+    x = np.asarray(x, dtype=float) - np.mean(x)
+    rho = float(x[1:] @ x[:-1] / (x @ x))
+    return round(round(float(np.clip(rho, -0.99, 0.99)) / AR_STEP) * AR_STEP, 10)
+
+
+def _surrogate_histogram(nobs, ar, dt, dj, s0, count, seed, size):
+    """Per-scale coherence histogram of ``size`` AR(1) surrogate pairs."""
+    rng = np.random.default_rng(seed)
+    count = scales(nobs, dt, dj, s0, count).shape[0]
+    # Two series per pair; the transform is padded to about 2N.
+    pairs = max(1, SURROGATE_BYTES // (2 * count * 2 * nobs * 16))
+    offsets = np.arange(count)[:, None] * BINS
+    counts = np.zeros(count * BINS, dtype=np.int64)
+    for done in range(0, size, pairs):
+        k = min(pairs, size - done)
+        shocks = rng.standard_normal((2, k, nobs + BURN))
+        series = np.stack([
+            signal.lfilter([1.0], [1.0, -a], z, axis=-1)[:, BURN:] for a, z in zip(ar, shocks)
+        ])
+        waves = cwt(series, dt, dj, s0, count)
+        wx, wy = (CWTResult(wave, waves.scales, waves.periods, waves.coi, dt, dj) for wave in waves.wave)
+        bins = np.minimum((coherence_from(wx, wy).coherence * BINS).astype(np.int64), BINS - 1)
+        inside = np.broadcast_to(wx.inside(), bins.shape)
+        counts += np.bincount((bins + offsets)[inside], minlength=count * BINS)
+    return counts.reshape(count, BINS)
+
+
+def null_path(nobs, ar, dt, dj, s0, count, replications, seed):
+    """Cache file of the null histogram for this key."""
+    key = content_key("morlet-coi", OMEGA0, nobs, ar, dt, dj, s0, count, BINS, replications, seed)
+    return cache_dir("coherence-null") / f"{key}.npy"
+
+
+def _levels(histogram):
+    """Per-scale coherence quantiles; NaN at scales with no date inside the cone."""
+    total = histogram.sum(axis=1, keepdims=True)
+    cdf = np.cumsum(histogram, axis=1) / np.maximum(total, 1)
+    edges = np.arange(1, BINS + 1) / BINS
+    empty = total[:, 0] == 0
+    return {q: np.where(empty, np.nan, edges[np.argmax(cdf >= q, axis=1)]) for q in LEVELS}
+
+
+def cached_significance(x, y, dt=1.0, dj=1 / 12, s0=None, count=None, replications=1000, seed=0):
+    """The significance levels for this key if already on disk, else ``None``."""
+    ar = (ar1(x), ar1(y))
+    path = null_path(len(x), ar, dt, dj, s0, count, replications, seed)
+    if not path.exists():
+        return None
+    return CoherenceSignificance(_levels(np.load(path)), ar, replications, True, str(path))
+
+
+def coherence_significance(x, y, dt=1.0, dj=1 / 12, s0=None, count=None, replications=1000, seed=0,
+                           workers=None, progress=None):
+    """Red-noise significance levels of the coherence of ``x`` and ``y``.
+
+    Arguments after ``y`` must match those given to
+    :func:`course.engines.cwt.coherence`. ``progress(done, total)``
+    reports finished batches of surrogates.
+    """
+    if replications < 1:
+        raise ValueError("replications must be positive")
+    cached = cached_significance(x, y, dt, dj, s0, count, replications, seed)
+    if cached is not None:
+        return cached
+    nobs = len(x)
+    ar = (ar1(x), ar1(y))
+    sizes = [BATCH] * (replications // BATCH) + ([replications % BATCH] if replications % BATCH else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(nobs, ar, dt, dj, s0, count, child, size) for child, size in zip(seeds, sizes)]
+    histogram = sum(parallel_map(_surrogate_histogram, tasks, workers, progress))
+    path = null_path(nobs, ar, dt, dj, s0, count, replications, seed)
+    save_array(path, histogram)
+    return CoherenceSignificance(_levels(histogram), ar, replications, False, str(path))
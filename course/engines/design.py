@@ -0,0 +1,72 @@
+"""Shared regressor builders: lags, differences and Fourier terms."""
+import numpy as np
+
+
+def lag_matrix(x, maxlag):
+    """Columns ``x[t-1], ..., x[t-maxlag]`` for ``t = maxlag .. n-1``.
+
+    ``x`` has shape ``(..., n)``; the result has shape
+    ``(..., n - maxlag, maxlag)`` and is a strided view, so no per-lag copies
+    are made.
+    """
+    x = np.asarray(x, dtype=float)
+    if maxlag == 0:
+        return np.empty(x.shape + (0,))
+    windows = np.lib.stride_tricks.sliding_window_view(x[..., :-1], maxlag, axis=-1)
+    return windows[..., ::-1]
+
+
+def fourier_terms(n, k):
+    """``sin(2*pi*k*t/n)`` and ``cos(2*pi*k*t/n)`` for ``t = 1..n``.
+
+    ``k`` may be a scalar (shape ``(n, 2)``) or a sequence of frequencies
+    (shape ``(len(k), n, 2)``).
+    """
+    t = np.arange(1, n + 1)
+    angle = 2.0 * np.pi * np.multiply.outer(np.asarray(k, dtype=float), t) / n
+    return np.stack([np.sin(angle), np.cos(angle)], axis=-1)
+
+
+def deterministic_terms(n, trend):
+    """Constant (``trend="c"``) or constant and linear trend (``"ct"``)."""
+    if trend == "c":
+        return np.ones((n, 1))
+    if trend == "ct":
+        return np.column_stack([np.ones(n), np.arange(1, n + 1) / n])
+    raise ValueError(f"trend must be 'c' or 'ct', got {trend!r}")
+
+
+def information_criterion(ssr, nobs, nparams, ic):
+    """AIC or BIC from the residual sum of squares (broadcasts over arrays)."""
+    penalty = {"aic": 2.0, "bic": np.log(nobs)}
+    if ic not in penalty:
+        raise ValueError(f"ic must be 'aic' or 'bic', got {ic!r}")
+    return nobs * np.log(ssr / nobs) + penalty[ic] * nparams
+
+
+def nested_ssr(gram, xty, yty):
+    """SSR of every leading-block regression for a stack of Gram matrices.
+
+    ``gram`` has shape ``(..., m, m)`` and ``xty`` shape ``(..., m)``. Entry
+    ``j`` of the result is the SSR using the first ``j + 1`` regressors, all
+    from one Cholesky factorisation.
+    """
+    chol = np.linalg.cholesky(gram)
+    z = np.linalg.solve(chol, xty[..., None])[..., 0]
+    return yty - np.cumsum(z ** 2, axis=-1)
+
+
+def ols(target, X):
+    """Batched least squares over any leading axes.
+
+    ``target`` has shape ``(..., n)`` and ``X`` shape ``(..., n, m)``. Returns
+    coefficients, standard errors and residuals.
+    """
+    gram = np.einsum("...ni,...nj->...ij", X, X)
+    xty = np.einsum("...ni,...n->...i", X, target)
+    gram_inv = np.linalg.inv(gram)
+    beta = np.einsum("...ij,...j->...i", gram_inv, xty)
+    resid = target - np.einsum("...ni,...i->...n", X, beta)
+    sigma2 = np.einsum("...n,...n->...", resid, resid) / (X.shape[-2] - X.shape[-1])
+    se = np.sqrt(sigma2[..., None] * np.diagonal(gram_inv, axis1=-2, axis2=-1))
+    return beta, se, resid
@@ -0,0 +1,205 @@
+"""Enders–Lee Fourier ADF unit root test.
+
+The test regression is
+
+    dy_t = rho*y_{t-1} + d_t + g1*sin(2*pi*k*t/T) + g2*cos(2*pi*k*t/T)
+           + sum_{i=1..p} c_i*dy_{t-i} + e_t
+
+where ``d_t`` is a constant or a constant and trend. The unit root statistic
+is the t-ratio on ``rho``. The lag order is chosen per frequency by AIC/BIC
+and the frequency ``k`` by minimum SSR, as in Enders & Lee (2012).
+
+The whole ``(k, p)`` grid is solved at once. Every candidate uses the same
+effective sample, so all models are leading blocks of one design ordered as
+``[y_{t-1}, d_t, sin_k, cos_k, dy_{t-1}, ..., dy_{t-pmax}]``. One batched
+Cholesky factorisation of the ``kmax`` Gram matrices gives the SSR of every
+nested lag order via a cumulative sum, with no Python loop over ``(k, p)``.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.signal import lfilter
+
+from course.engines.design import (
+    deterministic_terms,
+    fourier_terms,
+    information_criterion,
+    lag_matrix,
+    nested_ssr,
+)
+
+
+@dataclass
+class FourierADFResult:
+    stat: float
+    frequency: int
+    lags: int
+    max_lags: int
+    f_stat: float
+    nobs: int
+    trend: str
+    ssr: np.ndarray
+    criterion: np.ndarray
+    fourier_trend: np.ndarray
+
+
+def _test_design(y, kmax, pmax, trend):
+    """Scaled regressor blocks shared by every ``(k, p)`` candidate."""
+    T = y.shape[0]
+    dy = np.diff(y)
+    target = dy[pmax:]
+    base = np.column_stack([y[pmax:-1], deterministic_terms(T, trend)[pmax + 1:]])
+    lags = lag_matrix(dy, pmax)
+    fourier = fourier_terms(T, np.arange(1, kmax + 1))[:, pmax + 1:, :]
+    return target, base, lags, fourier
+
+
+def _fixed_design(y, frequency, lags, trend, trim):
+    """Target and unscaled regressors of one ``(k, p)`` test regression."""
+    T = y.shape[0]
+    dy = np.diff(y)
+    X = np.column_stack([
+        y[trim:-1],
+        deterministic_terms(T, trend)[trim + 1:],
+        fourier_terms(T, frequency)[trim + 1:],
+        lag_matrix(dy, trim)[:, :lags],
+    ])
+    return dy[trim:], X
+
+
+def fourier_adf_stat(y, frequency, lags, trend="c", trim=None):
+    """τ statistic for a fixed frequency and lag order.
+
+    ``trim`` is the number of leading differences dropped from the sample
+    (``pmax`` in :func:`fourier_adf`); it defaults to ``lags``.
+    """
+    y = np.asarray(y, dtype=float)
+    trim = lags if trim is None else trim
+    target, X = _fixed_design(y, frequency, lags, trend, trim)
+    beta, *_ = np.linalg.lstsq(X, target, rcond=None)
+    resid = target - X @ beta
+    sigma2 = resid @ resid / (X.shape[0] - X.shape[1])
+    xtx_inv = np.linalg.inv(X.T @ X)
+    return beta[0] / np.sqrt(sigma2 * xtx_inv[0, 0])
+
+
+class FourierADFBootstrap:
+    """Sieve bootstrap of the τ statistic under the unit root null.
+
+    Fits the restricted (``rho = 0``) test regression, rebuilds ``dy`` from
+    resampled residuals through the fitted AR filter and recomputes τ with the
+    same frequency, lag order and sample trim. τ is invariant to the level
+    deterministics (constant, trend and Fourier terms are all spanned by the
+    test regression), so bootstrap paths are generated without them. Instances
+    are picklable replicators for :func:`course.engines.bootstrap.run_bootstrap`.
+    """
+
+    def __init__(self, y, frequency, lags, trend="c", trim=None):
+        y = np.asarray(y, dtype=float)
+        self.frequency = frequency
+        self.lags = lags
+        self.trend = trend
+        self.trim = lags if trim is None else trim
+
+        target, X = _fixed_design(y, frequency, lags, trend, self.trim)
+        X = X[:, 1:]
+        beta, *_ = np.linalg.lstsq(X, target, rcond=None)
+        resid = target - X @ beta
+        self.resid = resid - resid.mean()
+
+        self.nobs = y.shape[0]
+        self.ar = np.r_[1.0, -beta[X.shape[1] - lags:]]
+
+    def __call__(self, rng, size):
+        shocks = rng.choice(self.resid, size=(size, self.nobs))
+        dy = lfilter([1.0], self.ar, shocks, axis=1)
+        paths = np.cumsum(dy, axis=1)
+        return np.array([
+            fourier_adf_stat(path, self.frequency, self.lags, self.trend, self.trim)
+            for path in paths
+        ])
+
+
+def fourier_adf(y, kmax=5, pmax=12, trend="c", ic="aic"):
+    """Run the Fourier ADF test with joint frequency and lag selection.
+
+    Parameters
+    ----------
+    y : array_like
+        Series in levels.
+    kmax : int
+        Largest single frequency searched (``k = 1..kmax``).
+    pmax : int
+        Largest number of lagged differences searched (``p = 0..pmax``).
+    trend : {"c", "ct"}
+        Constant, or constant and linear trend.
+    ic : {"aic", "bic"}
+        Criterion used to pick the lag order for each frequency.
+    """
+    y = np.asarray(y, dtype=float)
+    if kmax < 1 or pmax < 0:
+        raise ValueError("kmax must be >= 1 and pmax >= 0")
+    if y.shape[0] < 3 * (pmax + 2 * kmax + 5):
+        raise ValueError(f"series of length {y.shape[0]} is too short for kmax={kmax}, pmax={pmax}")
+
+    target, base, lags, fourier = _test_design(y, kmax, pmax, trend)
+    n, a = base.shape
+
+    # Column scaling leaves every SSR unchanged but keeps the Gram matrices
+    # well conditioned (levels, trend and differences differ by orders of
+    # magnitude).
+    shared = np.column_stack([base, lags])
+    shared = shared / np.linalg.norm(shared, axis=0)
+    fourier = fourier / np.linalg.norm(fourier, axis=1, keepdims=True)
+
+    shared_gram = shared.T @ shared
+    shared_xty = shared.T @ target
+    cross = np.einsum("knj,nm->kjm", fourier, shared)
+    fourier_gram = np.einsum("knj,kni->kji", fourier, fourier)
+    fourier_xty = np.einsum("knj,n->kj", fourier, target)
+    yty = target @ target
+
+    # Order each Gram as [base, sin, cos, lags] so every lag order is a
+    # leading block.
+    m = a + 2 + pmax
+    order = np.r_[np.arange(a), np.arange(a + 2, m)]
+    gram = np.empty((kmax, m, m))
+    gram[np.ix_(np.arange(kmax), order, order)] = shared_gram
+    gram[:, a:a + 2, a:a + 2] = fourier_gram
+    gram[:, a:a + 2, order] = cross
+    gram[:, order, a:a + 2] = cross.transpose(0, 2, 1)
+    xty = np.empty((kmax, m))
+    xty[:, order] = shared_xty
+    xty[:, a:a + 2] = fourier_xty
+
+    ssr = nested_ssr(gram, xty, yty)[:, a + 1:]
+    nparams = a + 2 + np.arange(pmax + 1)
+    criterion = information_criterion(ssr, n, nparams, ic)
+    best_lags = criterion.argmin(axis=1)
+    best_ssr = ssr[np.arange(kmax), best_lags]
+    k_index = int(best_ssr.argmin())
+    k, p = k_index + 1, int(best_lags[k_index])
+
+    restricted_ssr = nested_ssr(shared_gram, shared_xty, yty)[a - 1 + p]
+    unrestricted_ssr = ssr[k_index, p]
+    dof = n - (a + 2 + p)
+    f_stat = ((restricted_ssr - unrestricted_ssr) / 2.0) / (unrestricted_ssr / dof)
+
+    stat = fourier_adf_stat(y, k, p, trend, trim=pmax)
+
+    T = y.shape[0]
+    level_design = np.column_stack([deterministic_terms(T, trend), fourier_terms(T, k)])
+    level_beta, *_ = np.linalg.lstsq(level_design, y, rcond=None)
+
+    return FourierADFResult(
+        stat=float(stat),
+        frequency=k,
+        lags=p,
+        max_lags=pmax,
+        f_stat=float(f_stat),
+        nobs=n,
+        trend=trend,
+        ssr=ssr,
+        criterion=criterion,
+        fourier_trend=level_design @ level_beta,
+    )
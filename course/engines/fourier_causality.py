@@ -0,0 +1,178 @@
+"""Fourier Toda–Yamamoto causality (Nazlioglu, Gormus & Soytas, 2016).
+
+Both equations of the bivariate VAR in levels
+
+    z_t = a0 + a1 sin(2 pi k t / T) + a2 cos(2 pi k t / T) + sum_{i=1..p+dmax} A_i z_{t-i} + e_t
+
+are fitted with ``dmax`` extra lags, and the first ``p`` lags of the other
+variable are tested by a Wald test with ``p`` degrees of freedom. The extra
+lags keep the statistic chi-squared whatever the order of integration
+(Toda & Yamamoto, 1995). The Fourier pair absorbs smooth breaks in the
+intercept that would otherwise distort the test.
+
+Every ``(k, p)`` candidate uses the sample ``t = pmax + dmax..T-1``. For a
+lag order, the designs of all frequencies differ only in two columns. They
+are stacked into one ``(kmax, T, q)`` array and factorised by one batched
+QR, which gives both equations and both restricted regressions of every
+frequency at once. The frequency and lag order minimise AIC/BIC of the VAR.
+
+Bootstrap critical values use a fixed-design residual bootstrap. Joint
+resampled rows of the restricted residuals are added to the restricted fit
+as new dependent variables, while the regressors stay as observed. The
+restricted fit lies in both column spaces, so each Wald statistic depends
+on the new dependent variable only through the resampled residuals. The
+replicator keeps the QR factors of the selected design and never
+refactorises: a replication is two projections of a ``(T, size)`` block.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+from course.engines.design import fourier_terms, lag_matrix
+
+# Bootstrap replications per pool task; each is cheap, so tasks are large.
+BOOTSTRAP_BATCH = 250
+
+
+@dataclass
+class FourierCausalityResult:
+    names: list              # [y, x]
+    frequencies: np.ndarray  # 1..kmax
+    lags: np.ndarray         # 1..pmax
+    dmax: int
+    stat_xy: np.ndarray      # (pmax, kmax) Wald statistics, x -> y
+    stat_yx: np.ndarray      # (pmax, kmax) Wald statistics, y -> x
+    criterion: np.ndarray    # (pmax, kmax) information criterion of the VAR
+    frequency: int
+    lag: int
+    wald_xy: float           # at the selected (k, p)
+    pvalue_xy: float         # asymptotic chi-squared p-value
+    wald_yx: float
+    pvalue_yx: float
+    nobs: int
+    ic: str
+
+
+def _designs(y, x, frequencies, lag, dmax, trim):
+    """Targets and the ``(len(frequencies), T, q)`` stacked designs of one lag order.
+
+    Columns are ``[1, sin_k, cos_k, y_{t-1}, x_{t-1}, ..., y_{t-L}, x_{t-L}]``
+    with ``L = lag + dmax``; the sample starts at ``trim``.
+    """
+    n = y.shape[0]
+    order = lag + dmax
+    target = np.column_stack([y, x])[trim:]
+    T = target.shape[0]
+    lags = np.stack([lag_matrix(y, trim)[:, :order], lag_matrix(x, trim)[:, :order]], axis=-1).reshape(T, 2 * order)
+    K = len(frequencies)
+    Z = np.concatenate([
+        np.ones((K, T, 1)),
+        fourier_terms(n, frequencies)[:, trim:],
+        np.broadcast_to(lags, (K,) + lags.shape),
+    ], axis=2)
+    return target, Z
+
+
+def _restrictions(lag, dmax):
+    """Columns kept without the first ``lag`` lags of x (y equation) and of y (x equation)."""
+    q = 3 + 2 * (lag + dmax)
+    y_lags = [3 + 2 * i for i in range(lag)]
+    x_lags = [4 + 2 * i for i in range(lag)]
+    return [c for c in range(q) if c not in x_lags], [c for c in range(q) if c not in y_lags]
+
+
+def _residual_ssr(Q, target):
+    """``||M target||^2`` column by column for orthonormal bases ``Q`` of shape ``(..., T, q)``."""
+    fitted = np.swapaxes(Q, -1, -2) @ target
+    return np.einsum("...ti,...ti->...i", target, target) - np.einsum("...qi,...qi->...i", fitted, fitted)
+
+
+def fourier_causality(y, x, kmax=3, pmax=4, dmax=1, ic="aic", names=None):
+    """Fourier Toda–Yamamoto tests of ``x -> y`` and ``y -> x`` over ``k = 1..kmax``, ``p = 1..pmax``."""
+    y = np.asarray(y, dtype=float)
+    x = np.asarray(x, dtype=float)
+    if y.shape != x.shape or y.ndim != 1:
+        raise ValueError("y and x must be one-dimensional and of the same length")
+    if kmax < 1 or pmax < 1 or dmax < 0:
+        raise ValueError("kmax and pmax must be positive and dmax non-negative")
+    if ic not in ("aic", "bic"):
+        raise ValueError(f"ic must be 'aic' or 'bic', got {ic!r}")
+    trim = pmax + dmax
+    n = y.shape[0]
+    if n - trim <= 4 * (3 + 2 * trim):
+        raise ValueError(f"{n} observations are too few for {trim} lags")
+    frequencies = np.arange(1, kmax + 1)
+    T = n - trim
+    penalty = 2.0 if ic == "aic" else np.log(T)
+
+    stat_xy = np.empty((pmax, kmax))
+    stat_yx = np.empty((pmax, kmax))
+    criterion = np.empty((pmax, kmax))
+    for p in range(1, pmax + 1):
+        target, Z = _designs(y, x, frequencies, p, dmax, trim)
+        keep_y, keep_x = _restrictions(p, dmax)
+        Q = np.linalg.qr(Z)[0]
+        fitted = np.swapaxes(Q, -1, -2) @ target
+        resid = target - Q @ fitted
+        cov = np.swapaxes(resid, -1, -2) @ resid / T
+        ssr = np.diagonal(cov, axis1=-2, axis2=-1) * T
+        dof = T - Z.shape[2]
+        ssr_y = _residual_ssr(np.linalg.qr(Z[..., keep_y])[0], target[:, :1])[..., 0]
+        ssr_x = _residual_ssr(np.linalg.qr(Z[..., keep_x])[0], target[:, 1:])[..., 0]
+        stat_xy[p - 1] = (ssr_y - ssr[:, 0]) / (ssr[:, 0] / dof)
+        stat_yx[p - 1] = (ssr_x - ssr[:, 1]) / (ssr[:, 1] / dof)
+        criterion[p - 1] = T * np.linalg.slogdet(cov)[1] + penalty * 2 * Z.shape[2]
+    p, k = np.unravel_index(np.argmin(criterion), criterion.shape)
+    return FourierCausalityResult(
+        names=list(names) if names is not None else ["y", "x"],
+        frequencies=frequencies,
+        lags=np.arange(1, pmax + 1),
+        dmax=dmax,
+        stat_xy=stat_xy,
+        stat_yx=stat_yx,
+        criterion=criterion,
+        frequency=int(k) + 1,
+        lag=int(p) + 1,
+        wald_xy=float(stat_xy[p, k]),
+        pvalue_xy=float(stats.chi2.sf(stat_xy[p, k], p + 1)),
+        wald_yx=float(stat_yx[p, k]),
+        pvalue_yx=float(stats.chi2.sf(stat_yx[p, k], p + 1)),
+        nobs=T,
+        ic=ic,
+    )
+
+
+class FourierCausalityBootstrap:
+    """Fixed-design residual bootstrap of both Wald statistics under non-causality.
+
+    Factorises the selected design and both restricted designs once. A call
+    resamples rows of the two restricted residual series jointly and returns
+    ``(size, 2)`` statistics, ``x -> y`` then ``y -> x``. Instances are
+    picklable replicators for :func:`course.engines.bootstrap.run_bootstrap`;
+    run them with ``batch_size=BOOTSTRAP_BATCH``.
+    """
+
+    def __init__(self, y, x, frequency, lag, dmax, trim):
+        y = np.asarray(y, dtype=float)
+        x = np.asarray(x, dtype=float)
+        target, Z = _designs(y, x, [frequency], lag, dmax, trim)
+        Z = Z[0]
+        keep_y, keep_x = _restrictions(lag, dmax)
+        self.full = np.linalg.qr(Z)[0]
+        self.restricted = [np.linalg.qr(Z[:, keep_y])[0], np.linalg.qr(Z[:, keep_x])[0]]
+        resid = np.column_stack([
+            target[:, i] - Q @ (Q.T @ target[:, i]) for i, Q in enumerate(self.restricted)
+        ])
+        self.resid = resid - resid.mean(axis=0)
+        self.dof = Z.shape[0] - Z.shape[1]
+
+    def __call__(self, rng, size):
+        T = self.resid.shape[0]
+        rows = rng.integers(0, T, size=(T, size))
+        out = np.empty((size, 2))
+        for i, Q in enumerate(self.restricted):
+            shocks = self.resid[rows, i]
+            ssr_u = _residual_ssr(self.full, shocks)
+            out[:, i] = (_residual_ssr(Q, shocks) - ssr_u) / (ssr_u / self.dof)
+        return out
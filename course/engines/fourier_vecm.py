@@ -0,0 +1,227 @@
+"""Johansen cointegration and VECM estimation with Fourier deterministic terms.
+
+The VECM of order ``p`` for an ``m``-variable system is
+
+    dY_t = alpha beta' Y_{t-1} + mu + g1 sin(2 pi k t / T) + g2 cos(2 pi k t / T)
+           + sum_{i=1..p-1} G_i dY_{t-i} + e_t,
+
+with the constant and the Fourier pair unrestricted. Johansen's reduced
+rank regression concentrates out everything except ``Y_{t-1}``. With ``R0``
+and ``R1`` the residuals of ``dY_t`` and ``Y_{t-1}`` on the other
+regressors and ``S_ij = R_i' R_j / T``, the eigenvalues of
+
+    S10 S00^{-1} S01 v = lambda S11 v
+
+give the trace statistic ``-T sum_{i>r} log(1 - lambda_i)`` and the
+maximum-eigenvalue statistic ``-T log(1 - lambda_{r+1})``.
+
+Every ``(k, p)`` candidate uses the same sample, ``t = pmax..T-1``. The
+moment matrix of ``[dY_t, Y_{t-1}, 1, dY_{t-1..t-pmax+1}, Fourier terms
+of every k]`` is formed once. A candidate is an index set into it, and its
+``S_ij`` are a Schur complement of that matrix. Within a lag order the
+conditioning sets differ only in their two Fourier columns, so the
+complements of all frequencies are one batched solve. The eigenproblems of
+the whole grid are then reduced, through a Cholesky factor of ``S11``, to
+one batched symmetric eigendecomposition. The regressions are never
+re-estimated per candidate.
+
+The frequency and lag order minimise AIC/BIC of the unrestricted VAR over
+the grid. At a fixed ``p``, every frequency has the same number of
+parameters, so this picks the minimum-SSR frequency, as in Enders & Lee
+(2012). The rank is chosen by the sequential trace test. Testing at a
+frequency picked by the data shifts the null distribution: with fixed
+``k = 1`` critical values, a two-variable system without cointegration
+rejected rank 0 in about 13% of samples at 5%. The critical values are
+therefore simulated with the same selection step, taking in each draw the
+minimum-SSR frequency over ``k = 1..kmax``, and cached for the sample as
+for the ARDL bounds.
+"""
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from course.engines.design import fourier_terms, lag_matrix
+
+LEVELS = (0.10, 0.05, 0.01)
+# Samples longer than this are simulated at this size; the quantiles have converged.
+SIMULATION_NOBS = 500
+# Replications simulated per batch of the critical-value simulation.
+SIMULATION_CHUNK = 1_000
+
+
+@dataclass
+class FourierVECMResult:
+    names: list
+    frequencies: np.ndarray  # 1..kmax
+    lags: np.ndarray         # VAR orders 1..pmax (p - 1 lagged differences)
+    eigenvalues: np.ndarray  # (pmax, kmax, m), descending
+    trace: np.ndarray        # (pmax, kmax, m) trace statistic for H0: rank <= r, r = 0..m-1
+    max_eigen: np.ndarray    # (pmax, kmax, m)
+    criterion: np.ndarray    # (pmax, kmax) information criterion of the unrestricted VAR
+    frequency: int           # selected k
+    lag: int                 # selected p
+    rank: int                # selected by the sequential trace test at 5%
+    trace_cv: np.ndarray     # (m, len(LEVELS)) critical values with k selected over 1..kmax
+    max_eigen_cv: np.ndarray
+    beta: np.ndarray         # (m, rank) cointegrating vectors, first block normalised to I
+    alpha: np.ndarray        # (m, rank) adjustment coefficients
+    nobs: int
+    ic: str
+
+
+def _moments(Y, kmax, pmax):
+    """Moment matrix of ``[dY_t, Y_{t-1}, 1, dY lags 1..pmax-1, sin_1, cos_1, ..., sin_kmax, cos_kmax]``."""
+    n, m = Y.shape
+    dY = np.diff(Y, axis=0)
+    lags = lag_matrix(dY.T, pmax - 1)             # (m, T, pmax - 1)
+    W = np.column_stack([
+        dY[pmax - 1:],
+        Y[pmax - 1:-1],
+        np.ones(n - pmax),
+        np.moveaxis(lags, 0, -1).reshape(n - pmax, -1),   # lag l of series j at 2m + 1 + (l - 1) m + j
+        fourier_terms(n, np.arange(1, kmax + 1))[:, pmax:].transpose(1, 0, 2).reshape(n - pmax, -1),
+    ])
+    return W.T @ W, n - pmax
+
+
+def _conditioning(m, pmax, kmax, p):
+    """``(kmax, q)`` indices of the regressors concentrated out at lag order ``p``."""
+    base = np.arange(2 * m, 2 * m + 1 + m * (p - 1))
+    fourier = 2 * m + 1 + m * (pmax - 1) + 2 * np.arange(kmax)[:, None] + np.arange(2)
+    return np.concatenate([np.broadcast_to(base, (kmax, base.shape[0])), fourier], axis=1)
+
+
+def concentrated_moments(M, m, index, nobs):
+    """``S_ij`` blocks, as one ``(..., 2m, 2m)`` array, after partialling out ``index``.
+
+    ``M`` is a ``(..., w, w)`` moment matrix whose first ``2m`` columns are
+    ``dY_t`` and ``Y_{t-1}``; ``index`` is ``(..., q)``; their leading
+    axes broadcast.
+    """
+    batch = np.broadcast_shapes(M.shape[:-2], index.shape[:-1])
+    M = np.broadcast_to(M, batch + M.shape[-2:])
+    index = np.broadcast_to(index, batch + index.shape[-1:])
+    M22 = np.take_along_axis(np.take_along_axis(M, index[..., :, None], -2), index[..., None, :], -1)
+    M2a = np.take_along_axis(M[..., :, :2 * m], index[..., :, None], -2)
+    return (M[..., :2 * m, :2 * m] - np.swapaxes(M2a, -1, -2) @ np.linalg.solve(M22, M2a)) / nobs
+
+
+def _eigen(S, m):
+    """Batched generalised eigenproblem; eigenvalues descending, vectors ``S11``-orthonormal."""
+    S00, S01, S11 = S[..., :m, :m], S[..., :m, m:], S[..., m:, m:]
+    L = np.linalg.cholesky(S11)
+    B = np.linalg.solve(L, np.swapaxes(S01, -1, -2))         # L^{-1} S10
+    A = B @ np.linalg.solve(S00, np.swapaxes(B, -1, -2))      # L^{-1} S10 S00^{-1} S01 L^{-T}
+    values, vectors = np.linalg.eigh(A)
+    vectors = np.linalg.solve(np.swapaxes(L, -1, -2), vectors)
+    return np.clip(values[..., ::-1], 0.0, 1.0 - 1e-12), vectors[..., ::-1]
+
+
+def rank_statistics(eigenvalues, nobs):
+    """Trace and maximum-eigenvalue statistics for ``r = 0..m-1`` along the last axis."""
+    log_one_minus = np.log1p(-eigenvalues)
+    trace = -nobs * np.cumsum(log_one_minus[..., ::-1], axis=-1)[..., ::-1]
+    return trace, -nobs * log_one_minus
+
+
+@functools.lru_cache(maxsize=64)
+def rank_critical_values(dimension, kmax, nobs, levels=LEVELS, reps=5_000, seed=1996):
+    """Simulated trace and maximum-eigenvalue critical values for ``dimension`` common trends.
+
+    ``dimension`` is ``m - r``: under the null the system has that many
+    independent random walks and no cointegration. The VECM with an
+    unrestricted constant and a Fourier pair is fitted with no lagged
+    differences at every frequency ``1..kmax``, and each draw keeps the
+    statistics at the frequency with the smallest residual determinant, as
+    :func:`fourier_vecm` selects it. Returns ``(trace, max_eigen)`` arrays
+    over ``levels``.
+    """
+    rng = np.random.default_rng(seed)
+    n = min(nobs, SIMULATION_NOBS) + 1
+    index = _conditioning(dimension, 1, kmax, 1)
+    fourier = fourier_terms(n, np.arange(1, kmax + 1))[:, 1:].transpose(1, 0, 2).reshape(n - 1, -1)
+    trace, max_eigen = [], []
+    for done in range(0, reps, SIMULATION_CHUNK):
+        size = min(SIMULATION_CHUNK, reps - done)
+        Y = np.cumsum(rng.standard_normal((size, n, dimension)), axis=1)
+        W = np.concatenate([
+            np.diff(Y, axis=1),
+            Y[:, :-1],
+            np.broadcast_to(np.ones((n - 1, 1)), (size, n - 1, 1)),
+            np.broadcast_to(fourier, (size, n - 1, 2 * kmax)),
+        ], axis=2)
+        M = np.swapaxes(W, 1, 2) @ W
+        S = concentrated_moments(M[:, None], dimension, index, n - 1)        # (size, kmax, 2d, 2d)
+        values = _eigen(S, dimension)[0]
+        logdet = np.linalg.slogdet(S[..., :dimension, :dimension])[1] + np.log1p(-values).sum(axis=-1)
+        selected = np.argmin(logdet, axis=1)
+        tr, mx = rank_statistics(values[np.arange(size), selected], n - 1)
+        trace.append(tr[:, 0])
+        max_eigen.append(mx[:, 0])
+    quantiles = 1.0 - np.asarray(levels)
+    return np.quantile(np.concatenate(trace), quantiles), np.quantile(np.concatenate(max_eigen), quantiles)
+
+
+def fourier_vecm(Y, kmax=3, pmax=4, ic="aic", names=None):
+    """Rank tests over every ``(k, p)`` and the VECM at the selected candidate.
+
+    ``Y`` is ``(T, m)`` with ``m >= 2`` series in levels.
+    """
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim != 2 or Y.shape[1] < 2:
+        raise ValueError("the VECM needs a (T, m) array with at least two series")
+    if kmax < 1 or pmax < 1:
+        raise ValueError("kmax and pmax must be positive")
+    n, m = Y.shape
+    names = list(names) if names is not None else [f"y{i}" for i in range(m)]
+    if n - pmax <= m * (pmax + 1) + 3 + 10:
+        raise ValueError(f"{n} observations are too few for {m} series and {pmax} lags")
+    M, T = _moments(Y, kmax, pmax)
+
+    S = np.stack([
+        concentrated_moments(M, m, _conditioning(m, pmax, kmax, p), T) for p in range(1, pmax + 1)
+    ])                                                                     # (pmax, kmax, 2m, 2m)
+    eigenvalues, vectors = _eigen(S, m)
+    trace, max_eigen = rank_statistics(eigenvalues, T)
+
+    penalty = {"aic": 2.0, "bic": np.log(T)}
+    if ic not in penalty:
+        raise ValueError(f"ic must be 'aic' or 'bic', got {ic!r}")
+    # log det of the unrestricted residual covariance: log det S00 + sum log(1 - lambda).
+    logdet = np.linalg.slogdet(S[..., :m, :m])[1] + np.log1p(-eigenvalues).sum(axis=-1)
+    nparams = m * (m + 3 + m * (np.arange(1, pmax + 1) - 1))
+    criterion = T * logdet + penalty[ic] * nparams[:, None]
+    p, k = np.unravel_index(np.argmin(criterion), criterion.shape)
+
+    cv = [rank_critical_values(m - r, kmax, T) for r in range(m)]
+    trace_cv = np.array([c[0] for c in cv])
+    max_eigen_cv = np.array([c[1] for c in cv])
+    five = LEVELS.index(0.05)
+    rejected = trace[p, k] > trace_cv[:, five]
+    rank = int(np.argmin(rejected)) if not rejected.all() else m
+
+    # Cointegrating space of the selected candidate, normalised on the first ``rank`` series.
+    beta = vectors[p, k][:, :rank]
+    if rank:
+        beta = beta @ np.linalg.inv(beta[:rank])
+    S01, S11 = S[p, k, :m, m:], S[p, k, m:, m:]
+    alpha = S01 @ beta @ np.linalg.inv(beta.T @ S11 @ beta) if rank else np.empty((m, 0))
+    return FourierVECMResult(
+        names=names,
+        frequencies=np.arange(1, kmax + 1),
+        lags=np.arange(1, pmax + 1),
+        eigenvalues=eigenvalues,
+        trace=trace,
+        max_eigen=max_eigen,
+        criterion=criterion,
+        frequency=int(k) + 1,
+        lag=int(p) + 1,
+        rank=rank,
+        trace_cv=trace_cv,
+        max_eigen_cv=max_eigen_cv,
+        beta=beta,
+        alpha=alpha,
+        nobs=T,
+        ic=ic,
+    )
@@ -0,0 +1,412 @@
+"""Univariate GARCH-family estimation by (quasi-)maximum likelihood.
+
+Models, with ``e_t = r_t - mu`` and ``s2_t`` the conditional variance:
+
+* ``garch``:   s2_t = omega + alpha e2_{t-1} + beta s2_{t-1}
+* ``gjr``:     s2_t = omega + (alpha + gamma 1{e_{t-1} < 0}) e2_{t-1} + beta s2_{t-1}
+* ``egarch``:  h_t = omega + alpha (|z_{t-1}| - E|z|) + gamma z_{t-1} + beta h_{t-1},
+  with ``h = log s2`` and ``z = e / s``
+* ``figarch``: s2_t = omega / (1 - beta) + lambda(L) e2_t, where
+  ``lambda(L) = 1 - (1 - phi L)(1 - L)^d / (1 - beta L)``, truncated at
+  ``FIGARCH_LAGS`` lags (Baillie, Bollerslev & Mikkelsen, 1996)
+
+Innovations are Gaussian or standardized Student t.
+
+GARCH and GJR variances are linear in past squared residuals. The whole path
+is one ``scipy.signal.lfilter`` call through ``1 / (1 - beta L)``, and so is
+its Jacobian, since every derivative obeys the same recursion with a
+different input. FIGARCH is a long fixed filter of ``e2``, applied by FFT
+convolution together with the derivatives of its coefficients. EGARCH is
+nonlinear in the past variance, so its log-variance runs as one scalar loop,
+the only per-observation Python loop in the module. Its derivatives are
+then a linear recursion with time-varying coefficients, solved by a blocked
+scan.
+
+Every evaluation returns per-observation scores as well as the likelihood.
+The optimizer gets exact gradients, standard errors come from the Hessian
+of the analytic score, and robust (Bollerslev–Wooldridge) errors use the
+score outer products. Returns are scaled to unit variance before fitting
+and the estimates mapped back, which keeps the optimizer well conditioned
+for returns quoted in decimals or in percent.
+"""
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import optimize, signal, special
+
+# Truncation of the FIGARCH ARCH(infinity) representation.
+FIGARCH_LAGS = 1000
+# E|z| for a standard normal. It only recentres EGARCH's omega, so the same
+# constant is used under Student t innovations.
+ABS_NORMAL = math.sqrt(2.0 / math.pi)
+
+MODELS = {
+    "garch": ("omega", "alpha", "beta"),
+    "gjr": ("omega", "alpha", "gamma", "beta"),
+    "egarch": ("omega", "alpha", "gamma", "beta"),
+    "figarch": ("omega", "phi", "d", "beta"),
+}
+# Starting values for returns scaled to unit variance.
+STARTS = {
+    "garch": (0.05, 0.05, 0.90),
+    "gjr": (0.05, 0.03, 0.04, 0.90),
+    "egarch": (0.0, 0.10, -0.05, 0.95),
+    "figarch": (0.10, 0.20, 0.40, 0.50),
+}
+BOUNDS = {
+    "garch": ((1e-8, None), (0.0, 1.0), (0.0, 1.0)),
+    "gjr": ((1e-8, None), (0.0, 1.0), (-1.0, 1.0), (0.0, 1.0)),
+    "egarch": ((None, None), (-1.0, 2.0), (-1.0, 1.0), (-0.9999, 0.9999)),
+    "figarch": ((1e-8, None), (0.0, 1.0), (0.01, 0.99), (0.0, 1.0)),
+}
+DISTRIBUTIONS = ("normal", "t")
+# Long samples are first fitted on this many recent observations, and the
+# full-sample optimizer starts from there.
+WARM_NOBS = 10_000
+
+
+@dataclass
+class GARCHResult:
+    model: str
+    dist: str
+    names: list
+    params: np.ndarray
+    bse: np.ndarray           # inverse-Hessian standard errors
+    robust_bse: np.ndarray    # Bollerslev–Wooldridge sandwich
+    loglik: float
+    aic: float
+    bic: float
+    persistence: float
+    sigma2: np.ndarray        # conditional variance, in the units of ``returns``
+    std_resid: np.ndarray
+    nobs: int
+    converged: bool
+    iterations: int
+
+
+def _linear_variance(theta, e, backcast, asymmetric):
+    """GARCH/GJR variance path and its Jacobian ``(k, n)`` via ``lfilter``."""
+    if asymmetric:
+        omega, alpha, gamma, beta = theta
+    else:
+        (omega, alpha, beta), gamma = theta, 0.0
+    e2 = e ** 2
+    negative = e < 0
+    arch = alpha + gamma * negative
+    u = np.empty_like(e)
+    u[0] = backcast
+    u[1:] = omega + arch[:-1] * e2[:-1]
+    sigma2 = signal.lfilter([1.0], [1.0, -beta], u)
+
+    rows = [np.empty_like(e) for _ in range(len(theta) + 1)]
+    d_mu, d_omega, d_alpha, d_beta = rows[0], rows[1], rows[2], rows[-1]
+    d_mu[0] = -2.0 * e.mean()
+    d_mu[1:] = -2.0 * arch[:-1] * e[:-1]
+    d_omega[0], d_omega[1:] = 0.0, 1.0
+    d_alpha[0], d_alpha[1:] = 0.0, e2[:-1]
+    if asymmetric:
+        rows[3][0], rows[3][1:] = 0.0, negative[:-1] * e2[:-1]
+    d_beta[0], d_beta[1:] = 0.0, sigma2[:-1]
+    jac = signal.lfilter([1.0], [1.0, -beta], np.array(rows), axis=-1)
+    return sigma2, jac
+
+
+def linear_scan(a, u, block=16):
+    """Solve ``x_t = a_t x_{t-1} + u_t`` from ``x_{-1} = 0`` without a time loop.
+
+    ``a`` has shape ``(n,)`` and ``u`` shape ``(n, k)``. Within blocks of
+    ``block`` steps the solution is a lower-triangular product of transition
+    factors, formed from cumulative log-magnitudes and sign counts. The
+    block end points obey the same kind of recursion, which is solved by
+    recursing on the ``n / block`` of them.
+    """
+    n, k = u.shape
+    if n <= block:
+        x = np.empty_like(u)
+        state = np.zeros(k)
+        for t in range(n):
+            state = a[t] * state + u[t]
+            x[t] = state
+        return x
+    pad = -n % block
+    a = np.r_[a, np.ones(pad)].reshape(-1, block)
+    u = np.concatenate([u, np.zeros((pad, k))]).reshape(-1, block, k)
+    logs = np.cumsum(np.log(np.maximum(np.abs(a), 1e-300)), axis=1)
+    flips = np.cumsum(a < 0, axis=1)
+    lower = np.tri(block, dtype=bool)
+    # factors[b, i, j] = a_{j+1} ... a_i for j <= i, and 0 above the diagonal.
+    factors = np.exp(np.where(lower, logs[:, :, None] - logs[:, None, :], -np.inf))
+    factors[(flips[:, :, None] - flips[:, None, :]) % 2 == 1] *= -1.0
+    local = factors @ u
+    into = np.exp(logs) * np.where(flips % 2 == 1, -1.0, 1.0)
+    ends = linear_scan(into[:, -1], local[:, -1], block)
+    entering = np.concatenate([np.zeros((1, k)), ends[:-1]])
+    return (local + into[..., None] * entering[:, None, :]).reshape(-1, k)[:n]
+
+
+def _egarch_variance(theta, e, backcast):
+    """EGARCH variance path and Jacobian.
+
+    The log-variance needs a scalar loop. Its derivatives then follow the
+    linear recursion ``g_{t+1} = c_t g_t + b_t`` with known coefficients,
+    which :func:`linear_scan` solves for all parameters at once.
+    """
+    omega, alpha, gamma, beta = theta
+    h = []
+    append = h.append
+    exp = math.exp
+    ht = math.log(backcast)
+    try:
+        for et in e.tolist():
+            append(ht)
+            z = et * exp(-0.5 * ht)
+            ht = omega + alpha * ((z if z >= 0.0 else -z) - ABS_NORMAL) + gamma * z + beta * ht
+    except OverflowError:
+        # An explosive trial point: signal an invalid variance to the likelihood.
+        return np.full(e.shape, np.inf), np.zeros((5, e.shape[0]))
+    h = np.array(h)
+    if not np.all(np.abs(h) < 700.0):
+        return np.full(e.shape, np.inf), np.zeros((5, e.shape[0]))
+    scale = np.exp(-0.5 * h)
+    z = e * scale
+    slope = np.where(z >= 0.0, alpha, -alpha) + gamma
+    # dz = -scale d_mu - z/2 dh, so h_{t+1} reacts to dh_t through c_t.
+    carry = np.r_[0.0, beta - 0.5 * slope[:-1] * z[:-1]]
+    direct = np.column_stack([-slope * scale, np.ones_like(h), np.abs(z) - ABS_NORMAL, z, h])
+    direct = np.concatenate([[[-2.0 * e.mean() / backcast, 0.0, 0.0, 0.0, 0.0]], direct[:-1]])
+    sigma2 = np.exp(h)
+    return sigma2, linear_scan(carry, direct).T * sigma2
+
+
+def figarch_weights(phi, d, beta, lags=FIGARCH_LAGS):
+    """ARCH(infinity) weights ``lambda_1..lambda_lags`` and their derivatives.
+
+    Derivatives are with respect to ``(phi, d, beta)``, shape ``(3, lags)``.
+    """
+    j = np.arange(1, lags + 1)
+    ratio = (j - 1.0 - d) / j
+    pi = np.r_[1.0, np.cumprod(ratio)]
+    # d pi_j / d d = pi_j * sum_{i <= j} -1 / (i - 1 - d)
+    d_pi = pi * np.r_[0.0, np.cumsum(-1.0 / (j - 1.0 - d))]
+    psi = pi.copy()
+    psi[1:] -= phi * pi[:-1]
+    d_psi_phi = np.r_[0.0, -pi[:-1]]
+    d_psi_d = d_pi.copy()
+    d_psi_d[1:] -= phi * d_pi[:-1]
+    delta = signal.lfilter([1.0], [1.0, -beta], psi)
+    d_delta = signal.lfilter([1.0], [1.0, -beta], np.array([d_psi_phi, d_psi_d, np.r_[0.0, delta[:-1]]]), axis=-1)
+    return -delta[1:], -d_delta[:, 1:]
+
+
+def _figarch_variance(theta, e, backcast):
+    """FIGARCH variance path and Jacobian by FFT convolution."""
+    omega, phi, d, beta = theta
+    n = e.shape[0]
+    weights, d_weights = figarch_weights(phi, d, beta)
+    lags = weights.shape[0]
+    # Pre-sample squared residuals are set to the backcast.
+    e2 = np.r_[np.full(lags, backcast), e ** 2]
+    d_e2 = np.r_[np.full(lags, -2.0 * e.mean()), -2.0 * e]
+
+    def apply(kernel, x):
+        return signal.fftconvolve(x, np.r_[0.0, kernel], axes=-1)[..., lags:lags + n]
+
+    sigma2 = omega / (1.0 - beta) + apply(weights, e2)
+    jac = np.empty((5, n))
+    jac[0] = apply(weights, d_e2)
+    jac[1] = 1.0 / (1.0 - beta)
+    jac[2:] = signal.fftconvolve(e2[None, :], np.column_stack([np.zeros(3), d_weights]), axes=-1)[:, lags:lags + n]
+    jac[4] += omega / (1.0 - beta) ** 2
+    return sigma2, jac
+
+
+def variance(model, theta, e, backcast):
+    """Conditional variance path and its Jacobian ``(1 + k, n)`` in ``(mu, theta)``."""
+    if model in ("garch", "gjr"):
+        return _linear_variance(theta, e, backcast, model == "gjr")
+    if model == "egarch":
+        return _egarch_variance(theta, e, backcast)
+    if model == "figarch":
+        return _figarch_variance(theta, e, backcast)
+    raise ValueError(f"model must be one of {sorted(MODELS)}, got {model!r}")
+
+
+def loglikelihood(params, returns, model, dist="normal"):
+    """Per-observation log-likelihood and scores ``(n, k)`` at ``params``.
+
+    ``params`` is ``(mu, *variance parameters[, nu])``.
+    """
+    mu = params[0]
+    k = len(MODELS[model])
+    theta = params[1:1 + k]
+    e = returns - mu
+    backcast = np.mean(e ** 2)
+    sigma2, jac = variance(model, theta, e, backcast)
+    if not np.all(sigma2 > 0) or not np.all(np.isfinite(sigma2)):
+        return np.full(e.shape, -np.inf), np.zeros((e.shape[0], len(params)))
+    e2 = e ** 2
+    if dist == "normal":
+        ll = -0.5 * (np.log(2.0 * np.pi) + np.log(sigma2) + e2 / sigma2)
+        d_sigma2 = -0.5 * (1.0 - e2 / sigma2) / sigma2
+        d_e2 = -0.5 / sigma2
+        scores = d_sigma2[:, None] * jac.T
+    else:
+        nu = params[-1]
+        q = e2 / ((nu - 2.0) * sigma2)
+        ll = (special.gammaln(0.5 * (nu + 1.0)) - special.gammaln(0.5 * nu) - 0.5 * np.log(np.pi * (nu - 2.0))
+              - 0.5 * np.log(sigma2) - 0.5 * (nu + 1.0) * np.log1p(q))
+        share = q / (1.0 + q)
+        d_sigma2 = (-0.5 + 0.5 * (nu + 1.0) * share) / sigma2
+        d_e2 = -0.5 * (nu + 1.0) / (1.0 + q) / ((nu - 2.0) * sigma2)
+        d_nu = (0.5 * special.digamma(0.5 * (nu + 1.0)) - 0.5 * special.digamma(0.5 * nu) - 0.5 / (nu - 2.0)
+                - 0.5 * np.log1p(q) + 0.5 * (nu + 1.0) * share / (nu - 2.0))
+        scores = np.column_stack([d_sigma2[:, None] * jac.T, d_nu])
+    scores[:, 0] += d_e2 * -2.0 * e
+    return ll, scores
+
+
+def _constraints(model):
+    """Inequality constraints (``>= 0``) on the variance parameters, offset by ``mu``."""
+    if model == "garch":
+        return [{"type": "ineq", "fun": lambda p: 0.9999 - p[2] - p[3], "jac": lambda p: _unit(p, {2: -1, 3: -1})}]
+    if model == "gjr":
+        return [
+            {"type": "ineq", "fun": lambda p: 0.9999 - p[2] - 0.5 * p[3] - p[4],
+             "jac": lambda p: _unit(p, {2: -1, 3: -0.5, 4: -1})},
+            {"type": "ineq", "fun": lambda p: p[2] + p[3], "jac": lambda p: _unit(p, {2: 1, 3: 1})},
+        ]
+    if model == "figarch":
+        # Bollerslev–Mikkelsen sufficient conditions for positive weights.
+        return [
+            {"type": "ineq", "fun": lambda p: p[2] - p[4] + p[3]},
+            {"type": "ineq", "fun": lambda p: (2.0 - p[3]) / 3.0 - p[2]},
+            {"type": "ineq", "fun": lambda p: p[4] * (p[2] - p[4] + p[3]) - p[3] * (p[2] - 0.5 * (1.0 - p[3]))},
+            {"type": "ineq", "fun": lambda p: 0.9999 - p[4]},
+        ]
+    return []
+
+
+def _unit(p, entries):
+    grad = np.zeros_like(p)
+    for i, value in entries.items():
+        grad[i] = value
+    return grad
+
+
+def standard_errors(cov):
+    """Square roots of the diagonal of ``cov``; NaN where it is not positive."""
+    d = np.diag(cov)
+    return np.sqrt(np.where(d > 0, d, np.nan))
+
+
+def _rescale(model, params, scale):
+    """Map estimates from unit-variance returns back to the original units.
+
+    Returns the parameters and the Jacobian of the map, for the delta method.
+    """
+    J = np.eye(params.shape[0])
+    J[0, 0] = scale
+    if model == "egarch":
+        # h scales by log(scale^2): omega absorbs (1 - beta) log(scale^2).
+        J[1, 4] = -2.0 * math.log(scale)
+        params = params.copy()
+        params[1] += 2.0 * math.log(scale) * (1.0 - params[4])
+        params[0] *= scale
+        return params, J
+    J[1, 1] = scale ** 2
+    return J @ params, J
+
+
+def persistence(model, theta):
+    """Volatility persistence: ``alpha + beta`` (plus ``gamma/2`` for GJR), or ``beta`` for EGARCH."""
+    if model == "garch":
+        return theta[1] + theta[2]
+    if model == "gjr":
+        return theta[1] + 0.5 * theta[2] + theta[3]
+    if model == "egarch":
+        return theta[3]
+    return 1.0  # FIGARCH: long memory, hyperbolic rather than geometric decay
+
+
+def _maximize(x, model, dist, start, max_iter):
+    """SLSQP on the mean log-likelihood, with the analytic score as gradient."""
+    n = x.shape[0]
+    bounds = [(None, None), *BOUNDS[model], *([(2.05, 300.0)] if dist == "t" else [])]
+    cache = {}
+
+    def evaluate(p):
+        key = p.tobytes()
+        if key not in cache:
+            cache.clear()
+            ll, scores = loglikelihood(p, x, model, dist)
+            total = ll.sum()
+            cache[key] = (-total / n, -scores.sum(axis=0) / n) if np.isfinite(total) else (1e10, np.zeros_like(p))
+        return cache[key]
+
+    return optimize.minimize(
+        lambda p: evaluate(p)[0], start, jac=lambda p: evaluate(p)[1], method="SLSQP",
+        bounds=bounds, constraints=_constraints(model), options={"maxiter": max_iter, "ftol": 1e-10},
+    )
+
+
+def garch(returns, model="garch", dist="normal", max_iter=200):
+    """Fit a GARCH-family model with a constant mean to ``returns``."""
+    returns = np.asarray(returns, dtype=float)
+    if model not in MODELS:
+        raise ValueError(f"model must be one of {sorted(MODELS)}, got {model!r}")
+    if dist not in DISTRIBUTIONS:
+        raise ValueError(f"dist must be one of {DISTRIBUTIONS}, got {dist!r}")
+    n = returns.shape[0]
+    if n < 100:
+        raise ValueError(f"need at least 100 observations, got {n}")
+    scale = returns.std()
+    if not scale > 0:
+        raise ValueError("returns are constant")
+    x = returns / scale
+
+    start = np.r_[x.mean(), STARTS[model], [8.0] if dist == "t" else []]
+    if n > 4 * WARM_NOBS:
+        # A fit on the most recent observations is a cheap, close starting point.
+        start = _maximize(x[-WARM_NOBS:], model, dist, start, max_iter).x
+    fit = _maximize(x, model, dist, start, max_iter)
+    params = fit.x
+    ll, scores = loglikelihood(params, x, model, dist)
+
+    # Hessian by forward differences of the analytic score.
+    k = params.shape[0]
+    gradient = scores.sum(axis=0)
+    hessian = np.empty((k, k))
+    for i in range(k):
+        step = 1e-7 * max(1.0, abs(params[i]))
+        shift = np.zeros(k)
+        shift[i] = step
+        hessian[i] = (loglikelihood(params + shift, x, model, dist)[1].sum(axis=0) - gradient) / step
+    hessian = 0.5 * (hessian + hessian.T)
+    try:
+        cov = np.linalg.inv(-hessian)
+    except np.linalg.LinAlgError:
+        cov = np.full((k, k), np.nan)
+    robust = cov @ (scores.T @ scores) @ cov
+
+    params_out, J = _rescale(model, params, scale)
+    names = ["mu", *MODELS[model], *(["nu"] if dist == "t" else [])]
+    sigma2 = variance(model, params[1:1 + len(MODELS[model])], x - params[0], np.mean((x - params[0]) ** 2))[0]
+    loglik = float(ll.sum() - n * math.log(scale))
+    return GARCHResult(
+        model=model,
+        dist=dist,
+        names=names,
+        params=params_out,
+        bse=standard_errors(J @ cov @ J.T),
+        robust_bse=standard_errors(J @ robust @ J.T),
+        loglik=loglik,
+        aic=-2.0 * loglik + 2.0 * k,
+        bic=-2.0 * loglik + math.log(n) * k,
+        persistence=float(persistence(model, params[1:])),
+        sigma2=sigma2 * scale ** 2,
+        std_resid=(x - params[0]) / np.sqrt(sigma2),
+        nobs=n,
+        converged=bool(fit.success),
+        iterations=int(fit.nit),
+    )
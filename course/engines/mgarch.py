@@ -0,0 +1,223 @@
+"""CCC and BEKK multivariate GARCH with memory-mapped covariance paths.
+
+* CCC (Bollerslev, 1990): ``H_t = D_t R D_t`` with univariate GARCH
+  volatilities in ``D_t`` and one correlation matrix ``R``. The univariate
+  fits run on the shared process pool, as for DCC.
+* BEKK(1,1) (Engle & Kroner, 1995), with variance targeting:
+
+      H_t = C + A' e_{t-1} e_{t-1}' A + B' H_{t-1} B,   C = S - A'SA - B'SB,
+
+  where ``S`` is the sample covariance. ``A`` and ``B`` are full (``2 N^2``
+  parameters, with cross-market spillovers) or diagonal (``2 N``).
+
+The BEKK recursion is a matrix recursion, but it decouples. With
+``B = V diag(lam) V^{-1}``, ``G_t = V' H_t V`` obeys
+
+    G_t = V'CV + u_{t-1} u_{t-1}' + diag(lam) G_{t-1} diag(lam),   u_t = (AV)' e_t,
+
+so every element of ``G`` follows its own scalar recursion with coefficient
+``lam_i lam_j``. That is one ``lfilter`` call per element instead of a
+Python loop over dates. Time is processed in blocks that carry each
+filter's state, which keeps the work arrays within ``BLOCK_BYTES``
+whatever ``T`` is. The same blocks feed the Gaussian likelihood, and they
+are streamed into a ``T x N x N`` ``.npy`` file (see
+:mod:`course.engines.storage`) that the result memory-maps.
+"""
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import optimize, signal
+
+from course.engines.dcc import univariate_fits
+from course.engines.storage import cache_dir, content_key, write_memmap
+
+# Bytes of N x N work arrays per time block of a covariance path.
+BLOCK_BYTES = 64 * 2 ** 20
+KINDS = ("diagonal", "full")
+
+
+@dataclass
+class MGARCHResult:
+    model: str              # "ccc", "dcc", "bekk-diagonal" or "bekk-full"
+    names: list
+    params: dict            # named parameter arrays
+    nparams: int
+    loglik: float           # Gaussian log-likelihood of the system
+    aic: float
+    bic: float
+    covariance: np.ndarray  # (T, N, N) read-only memory map of H_t
+    path: str
+    nobs: int
+    converged: bool
+
+    def correlation_path(self, i, j):
+        """Conditional correlation of assets ``i`` and ``j`` over time."""
+        H = self.covariance
+        return H[:, i, j] / np.sqrt(H[:, i, i] * H[:, j, j])
+
+
+def time_block(n):
+    """Dates per block so that a few ``n x n`` complex stacks fit ``BLOCK_BYTES``."""
+    return max(1, BLOCK_BYTES // (3 * 16 * n * n))
+
+
+def gaussian_loglik(e, H):
+    """Gaussian log-likelihood of residuals ``e`` (L, N) under covariances ``H`` (L, N, N)."""
+    chol = np.linalg.cholesky(H)
+    z = np.linalg.solve(chol, e[..., None])[..., 0]
+    logdet = 2.0 * np.log(np.diagonal(chol, axis1=1, axis2=2)).sum()
+    return -0.5 * (e.size * math.log(2.0 * math.pi) + logdet + np.sum(z ** 2))
+
+
+def _store(model, names, blocks, e, nparams, converged, params, path):
+    """Stream ``blocks`` of ``H_t`` to disk while accumulating the likelihood."""
+    T, n = e.shape
+    loglik = 0.0
+
+    def tap():
+        nonlocal loglik
+        for start, H in blocks:
+            loglik += gaussian_loglik(e[start:start + H.shape[0]], H)
+            yield start, H
+
+    if path is None:
+        path = cache_dir("covariance") / f"{model}-{content_key(e, model, nparams)}.npy"
+    covariance = write_memmap(path, (T, n, n), tap())
+    return MGARCHResult(
+        model=model,
+        names=names,
+        params=params,
+        nparams=nparams,
+        loglik=float(loglik),
+        aic=-2.0 * loglik + 2.0 * nparams,
+        bic=-2.0 * loglik + math.log(T) * nparams,
+        covariance=covariance,
+        path=str(path),
+        nobs=T,
+        converged=converged,
+    )
+
+
+def ccc(returns, names=None, model="garch", dist="normal", workers=None, progress=None, path=None):
+    """Constant conditional correlation GARCH on the ``(T, N)`` array ``returns``."""
+    returns = np.asarray(returns, dtype=float)
+    if returns.ndim != 2 or returns.shape[1] < 2:
+        raise ValueError("CCC needs a (T, N) array with at least two assets")
+    T, n = returns.shape
+    names = list(names) if names is not None else [f"y{i + 1}" for i in range(n)]
+    univariate = univariate_fits(returns, model, dist, workers, progress)
+    z = np.column_stack([fit.std_resid for fit in univariate])
+    vol = np.sqrt(np.column_stack([fit.sigma2 for fit in univariate]))
+    R = np.corrcoef(z, rowvar=False)
+    step = time_block(n)
+    blocks = ((s, R * vol[s:s + step, :, None] * vol[s:s + step, None, :]) for s in range(0, T, step))
+    nparams = sum(fit.params.shape[0] for fit in univariate) + n * (n - 1) // 2
+    params = {"R": R, **{f"{name} {fit.model}": fit.params for name, fit in zip(names, univariate)}}
+    return _store("ccc", names, blocks, z * vol, nparams, all(fit.converged for fit in univariate), params, path)
+
+
+def _unpack(theta, n, kind):
+    if kind == "diagonal":
+        return np.diag(theta[:n]), np.diag(theta[n:])
+    return theta[:n * n].reshape(n, n), theta[n * n:].reshape(n, n)
+
+
+def bekk_blocks(A, B, e, S, block=None):
+    """Yield ``(start, H)`` blocks of the targeted BEKK(1,1) covariance path.
+
+    Raises ``ValueError`` when ``B`` is too close to defective to
+    diagonalize.
+    """
+    T, n = e.shape
+    block = block or time_block(n)
+    lam, V = np.linalg.eig(B)
+    if np.linalg.cond(V) > 1e8:
+        raise ValueError("B is not diagonalizable")
+    Vinv = np.linalg.inv(V)
+    C = S - A.T @ S @ A - B.T @ S @ B
+    intercept = V.T @ C @ V
+    u = e @ (A @ V)
+    coef = np.outer(lam, lam)
+    rows, cols = np.triu_indices(n)
+    state = np.zeros((n, n), dtype=coef.dtype)
+    for start in range(0, T, block):
+        stop = min(T, start + block)
+        lagged = u[max(start - 1, 0):stop - 1]
+        X = np.empty((stop - start, n, n), dtype=coef.dtype)
+        X[X.shape[0] - lagged.shape[0]:] = intercept + lagged[:, :, None] * lagged[:, None, :]
+        if start == 0:
+            X[0] = V.T @ S @ V
+        G = np.empty_like(X)
+        for i, j in zip(rows, cols):
+            G[:, i, j], _ = signal.lfilter([1.0], [1.0, -coef[i, j]], X[:, i, j], zi=[coef[i, j] * state[i, j]])
+            G[:, j, i] = G[:, i, j]
+        state = G[-1]
+        yield start, (Vinv.T @ G @ Vinv).real
+
+
+def _bekk_objective(theta, e, S, kind):
+    n = e.shape[1]
+    A, B = _unpack(theta, n, kind)
+    kron = np.kron(A, A) + np.kron(B, B)
+    if np.max(np.abs(np.linalg.eigvals(kron))) >= 0.9999:
+        return 1e10
+    try:
+        np.linalg.cholesky(S - A.T @ S @ A - B.T @ S @ B)
+        loglik = sum(gaussian_loglik(e[s:s + H.shape[0]], H) for s, H in bekk_blocks(A, B, e, S))
+    except (ValueError, np.linalg.LinAlgError):
+        return 1e10
+    return -loglik / e.shape[0] if np.isfinite(loglik) else 1e10
+
+
+def _fit(e, S, kind, max_iter):
+    n = e.shape[1]
+    if kind == "diagonal":
+        start = np.r_[np.full(n, 0.25), np.full(n, 0.95)]
+        bounds = [(0.0, 1.0)] * (2 * n)
+    else:
+        # Start from the diagonal fit: B = b I is defective under any
+        # off-diagonal step, while distinct diagonal b_i are not.
+        a, b = _fit(e, S, "diagonal", max_iter).x.reshape(2, n)
+        start = np.r_[np.diag(a).ravel(), np.diag(b).ravel()]
+        # A_11 and B_11 are positive for identification.
+        bounds = [(0.0, 1.0) if k in (0, n * n) else (-1.0, 1.0) for k in range(2 * n * n)]
+    fit = optimize.minimize(
+        _bekk_objective, start, args=(e, S, kind), method="SLSQP", bounds=bounds,
+        options={"maxiter": max_iter, "ftol": 1e-9},
+    )
+    return fit
+
+
+def bekk(returns, names=None, kind="diagonal", max_iter=200, path=None):
+    """Targeted BEKK(1,1) on the ``(T, N)`` array ``returns`` (demeaned first)."""
+    returns = np.asarray(returns, dtype=float)
+    if returns.ndim != 2 or returns.shape[1] < 2:
+        raise ValueError("BEKK needs a (T, N) array with at least two assets")
+    if kind not in KINDS:
+        raise ValueError(f"kind must be one of {KINDS}, got {kind!r}")
+    T, n = returns.shape
+    names = list(names) if names is not None else [f"y{i + 1}" for i in range(n)]
+    e = returns - returns.mean(axis=0)
+    S = e.T @ e / T
+    fit = _fit(e, S, kind, max_iter)
+    A, B = _unpack(fit.x, n, kind)
+    params = {"A": A, "B": B, "C": S - A.T @ S @ A - B.T @ S @ B}
+    return _store(f"bekk-{kind}", names, bekk_blocks(A, B, e, S), e, fit.x.shape[0] + n, bool(fit.success),
+                  params, path)
+
+
+def from_dcc(result, path=None):
+    """Stream the ``H_t`` path of a :class:`course.engines.dcc.DCCResult` to disk.
+
+    Gives DCC the same full-system Gaussian likelihood and stored form as
+    CCC and BEKK, for comparison.
+    """
+    n = len(result.names)
+    e = np.column_stack([fit.std_resid for fit in result.univariate]) * result.volatility
+    step = time_block(n)
+    blocks = ((s, result.covariances(s, min(s + step, result.nobs))) for s in range(0, result.nobs, step))
+    nparams = sum(fit.params.shape[0] for fit in result.univariate) + 2
+    params = {"a, b": result.params, **{f"{name} {fit.model}": fit.params
+                                       for name, fit in zip(result.names, result.univariate)}}
+    return _store("dcc", result.names, blocks, e, nparams, result.converged, params, path)
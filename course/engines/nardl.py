@@ -0,0 +1,196 @@
+"""Nonlinear ARDL (Shin, Yu & Greenwood-Nimmo, 2014).
+
+Each asymmetric regressor is split into positive and negative partial sums
+
+    x_t^+ = sum_{i<=t} max(dx_i, 0),    x_t^- = sum_{i<=t} min(dx_i, 0)
+
+with two cumulative sums. The NARDL is then an ordinary ARDL in the partial
+sums, so selection, estimation and the bounds test reuse
+:mod:`course.engines.ardl`.
+
+The cumulative dynamic multiplier of ``x^±`` at horizon ``h`` is the sum of the
+ARDL impulse responses up to ``h``. It converges to the long-run coefficient.
+The recursion runs over horizons only and is vectorised over regressors and
+bootstrap replications. :class:`NARDLBootstrap` regenerates ``y`` from
+resampled residuals with ``lfilter`` and refits the selected order. Its
+Gram matrices are assembled from a fixed regressor block and the
+replicate's lag block, never from per-replicate copies of the design.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+from scipy.signal import lfilter, lfiltic
+
+from course.engines.ardl import ARDLResult, ardl, ardl_design, order_columns
+from course.engines.design import lag_matrix
+
+
+def partial_sums(x, threshold=0.0):
+    """Positive and negative partial sums of ``x`` (each starting at 0).
+
+    Changes above ``threshold`` count as positive and the rest as negative,
+    so ``x^+ + x^- = x - x_0`` for any threshold.
+    """
+    x = np.asarray(x, dtype=float)
+    dx = np.diff(x, axis=0, prepend=x[:1])
+    positive = np.where(dx > threshold, dx, 0.0)
+    return np.cumsum(positive, axis=0), np.cumsum(dx - positive, axis=0)
+
+
+def decompose(X, threshold=0.0):
+    """Columns ``[x_1^+, x_1^-, x_2^+, x_2^-, ...]`` of the regressors."""
+    X = np.asarray(X, dtype=float)
+    X = X.reshape(X.shape[0], -1)
+    pos, neg = partial_sums(X, threshold)
+    return np.stack([pos, neg], axis=2).reshape(X.shape[0], -1)
+
+
+def _split(params, order, trend):
+    """Regressor lag-polynomials ``(k, qmax+1)`` and AR coefficients ``(p,)``.
+
+    ``params`` may carry leading replication axes.
+    """
+    det = 2 if trend == "ct" else 1
+    q = order[1:]
+    width = max(q) + 1
+    betas = np.zeros(params.shape[:-1] + (len(q), width))
+    at = det
+    for j, qj in enumerate(q):
+        betas[..., j, :qj + 1] = params[..., at:at + qj + 1]
+        at += qj + 1
+    return betas, params[..., at:at + order[0]]
+
+
+def dynamic_multipliers(betas, ar, horizon):
+    """Cumulative dynamic multipliers for ``h = 0..horizon``.
+
+    ``betas`` has shape ``(..., k, q+1)`` and ``ar`` shape ``(..., p)``;
+    the result has shape ``(..., k, horizon + 1)``.
+    """
+    p = ar.shape[-1]
+    width = betas.shape[-1]
+    psi = np.zeros(betas.shape[:-1] + (horizon + 1,))
+    for h in range(horizon + 1):
+        value = betas[..., h] if h < width else 0.0
+        for i in range(1, min(p, h) + 1):
+            value = value + ar[..., None, i - 1] * psi[..., h - i]
+        psi[..., h] = value
+    return np.cumsum(psi, axis=-1)
+
+
+def _wald(R, params, cov):
+    """Wald statistic and chi2(1) p-value for ``R @ params = 0``."""
+    value = R @ params
+    variance = R @ cov @ R
+    if variance <= 0:
+        return np.nan, np.nan
+    wald = value ** 2 / variance
+    return float(wald), float(stats.chi2.sf(wald, 1))
+
+
+@dataclass
+class NARDLResult:
+    ardl: ARDLResult
+    regressors: list
+    multipliers: np.ndarray   # (k, 2, horizon + 1): positive and negative
+    long_run: np.ndarray      # (k, 2)
+    long_run_test: list       # Wald (stat, p-value) for L+ = L-, per regressor
+    short_run_test: list      # Wald (stat, p-value) for sum pi+ = sum pi-
+    threshold: float
+    pmax: int
+    qmax: int
+
+
+def nardl(y, X, pmax=4, qmax=4, trend="c", ic="aic", horizon=20, threshold=0.0, names=None):
+    """Select, estimate and test a NARDL of ``y`` on asymmetric regressors ``X``."""
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float).reshape(y.shape[0], -1)
+    k = X.shape[1]
+    names = [f"x{j + 1}" for j in range(k)] if names is None else list(names)
+    sums = decompose(X, threshold)
+    labels = [f"{name}{sign}" for name in names for sign in ("+", "-")]
+    fit = ardl(y, sums, pmax, qmax, trend, ic, labels)
+
+    betas, ar = _split(fit.params, fit.order, trend)
+    multipliers = dynamic_multipliers(betas, ar, horizon).reshape(k, 2, horizon + 1)
+    long_run = betas.sum(axis=-1).reshape(k, 2) / (1.0 - ar.sum())
+
+    det = 2 if trend == "ct" else 1
+    q = fit.order[1:]
+    starts = det + np.r_[0, np.cumsum(np.asarray(q) + 1)][:-1]
+    long_run_test, short_run_test = [], []
+    for j in range(k):
+        lr = np.zeros_like(fit.params)
+        sr = np.zeros_like(fit.params)
+        for sign, column in zip((1.0, -1.0), (2 * j, 2 * j + 1)):
+            lags = np.arange(q[column] + 1)
+            lr[starts[column] + lags] = sign
+            # Sum of the ECM's short-run coefficients on dx: b_0 - sum_{l>=2} (l-1) b_l.
+            # With q = 0 the ECM keeps dx_t, so the sum is b_0 alone.
+            sr[starts[column] + lags] = sign * np.where(lags == 0, 1.0, -(lags - 1.0))
+        long_run_test.append(_wald(lr, fit.params, fit.cov))
+        short_run_test.append(_wald(sr, fit.params, fit.cov))
+
+    return NARDLResult(
+        ardl=fit,
+        regressors=names,
+        multipliers=multipliers,
+        long_run=long_run,
+        long_run_test=long_run_test,
+        short_run_test=short_run_test,
+        threshold=threshold,
+        pmax=pmax,
+        qmax=qmax,
+    )
+
+
+class NARDLBootstrap:
+    """Recursive residual bootstrap of the NARDL dynamic multipliers.
+
+    Resampled residuals drive the fitted ARDL forward from the observed
+    initial values (``lfilter`` with initial conditions, one call for the
+    whole batch), and the selected order is refitted on each path. Returns
+    multipliers of shape ``(size, k, 2, horizon + 1)``. Instances are
+    picklable replicators for :func:`course.engines.bootstrap.run_bootstrap`.
+    """
+
+    def __init__(self, y, X, result, trend="c", horizon=20):
+        y = np.asarray(y, dtype=float)
+        self.order = result.ardl.order
+        self.trend = trend
+        self.horizon = horizon
+        self.k = len(result.regressors)
+        sums = decompose(X, result.threshold)
+        target, Z = ardl_design(y, sums, result.pmax, result.qmax, trend)
+        p = self.order[0]
+        columns = order_columns(self.order, result.qmax, trend)
+        self.fixed = np.ascontiguousarray(Z[:, columns[:len(columns) - p]])
+        params = result.ardl.params
+        resid = target - Z[:, columns] @ params
+        self.resid = resid - resid.mean()
+        self.ar = np.r_[1.0, -params[len(params) - p:]]
+        self.drive = self.fixed @ params[:len(params) - p]
+        self.start = y.shape[0] - target.shape[0]
+        self.initial = lfiltic([1.0], self.ar, y[self.start - p:self.start][::-1])
+        self.head = y[self.start - p:self.start]
+
+    def __call__(self, rng, size):
+        p = self.order[0]
+        shocks = rng.choice(self.resid, size=(size, self.resid.shape[0]))
+        zi = np.broadcast_to(self.initial, (size, self.initial.shape[0]))
+        paths = lfilter([1.0], self.ar, self.drive + shocks, axis=1, zi=zi)[0]
+        # Lagged y of each replicate: observed pre-sample values, then the path.
+        full = np.concatenate([np.broadcast_to(self.head, (size, p)), paths], axis=1)
+        lags = lag_matrix(full, p)
+        F = self.fixed
+        gram = np.empty((size,) + 2 * (F.shape[1] + p,))
+        gram[:, :F.shape[1], :F.shape[1]] = F.T @ F
+        cross = np.einsum("ni,bnj->bij", F, lags)
+        gram[:, :F.shape[1], F.shape[1]:] = cross
+        gram[:, F.shape[1]:, :F.shape[1]] = cross.transpose(0, 2, 1)
+        gram[:, F.shape[1]:, F.shape[1]:] = np.einsum("bni,bnj->bij", lags, lags)
+        xty = np.concatenate([paths @ F, np.einsum("bni,bn->bi", lags, paths)], axis=1)
+        params = np.linalg.solve(gram, xty[..., None])[..., 0]
+        betas, ar = _split(params, self.order, self.trend)
+        return dynamic_multipliers(betas, ar, self.horizon).reshape(size, self.k, 2, self.horizon + 1)
@@ -0,0 +1,98 @@
+"""Process pool shared by the engines that fan work out across cores.
+
+Tasks must be picklable top-level callables and arguments. ``workers=1``
+always runs in the calling process, which is also what small jobs should do
+to avoid paying for worker start-up.
+
+Large arrays that several tasks read can be placed in shared memory once
+with :func:`shared_array`; tasks then receive a small picklable handle and
+copy out only the slice they need with :func:`shared_slice` instead of
+receiving a pickled copy of the whole array.
+"""
+import concurrent.futures as cf
+import contextlib
+import functools
+import multiprocessing
+import os
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def default_workers():
+    """Worker count: ``COURSE_BOOTSTRAP_WORKERS`` or the number of CPUs."""
+    return int(os.environ.get("COURSE_BOOTSTRAP_WORKERS", 0)) or os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=None)
+def process_pool(workers):
+    """Process pool shared by every session of the server process.
+
+    Workers are spawned rather than forked because the Streamlit server is
+    multi-threaded.
+    """
+    return cf.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def parallel_map(function, tasks, workers=None, progress=None):
+    """``[function(*task) for task in tasks]``, spread over the shared pool.
+
+    Results keep the order of ``tasks``. ``progress(done, total)`` is called
+    in the calling thread as tasks finish.
+    """
+    tasks = list(tasks)
+    workers = workers or default_workers()
+    results = [None] * len(tasks)
+    if workers == 1 or len(tasks) == 1:
+        for i, task in enumerate(tasks):
+            results[i] = function(*task)
+            if progress is not None:
+                progress(i + 1, len(tasks))
+        return results
+
+    pool = process_pool(workers)
+    try:
+        futures = {pool.submit(function, *task): i for i, task in enumerate(tasks)}
+        for done, future in enumerate(cf.as_completed(futures), 1):
+            results[futures[future]] = future.result()
+            if progress is not None:
+                progress(done, len(tasks))
+    except BrokenProcessPool:
+        process_pool.cache_clear()
+        raise
+    return results
+
+
+@contextlib.contextmanager
+def shared_array(array):
+    """Copy ``array`` into a new shared-memory block; yield its handle.
+
+    The handle ``(name, shape, dtype)`` is what tasks receive. The block is
+    released when the ``with`` body ends, so every task using it must have
+    finished by then.
+    """
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        yield block.name, array.shape, array.dtype.str
+    finally:
+        block.close()
+        block.unlink()
+
+
+def shared_slice(handle, index):
+    """Copy of ``array[index]`` from a :func:`shared_array` block.
+
+    Only the slice is copied; the block is unmapped again before returning.
+    """
+    name, shape, dtype = handle
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        out = np.array(view[index])
+        del view
+        return out
+    finally:
+        block.close()
@@ -0,0 +1,91 @@
+"""Quantile-on-quantile regression (Sim & Zhou, 2015).
+
+For a quantile ``theta`` of the regressor and ``tau`` of the response, QQR
+fits the local linear quantile regression
+
+    min sum_t rho_tau(y_t - b0 - b1 (x_t - x^theta) - a' z_t) K((F_n(x_t) - theta) / h)
+
+where ``x^theta`` is the ``theta`` quantile of ``x``, ``F_n`` its empirical
+CDF, ``K`` the Gaussian kernel and ``z_t`` optional lags of ``y``. The slope
+``b1(theta, tau)`` is the heat map.
+
+The kernel weights depend on ``theta`` only. They are computed once per
+``theta`` and folded into the data, since ``rho_tau(w u) = w rho_tau(u)`` for
+``w >= 0``. Observations with negligible weight are dropped, and the whole
+``tau`` grid is then solved by
+:func:`course.engines.quantile.quantile_profile`, as one batched problem for
+the usual effective sample sizes. Each ``theta`` is one task
+on the shared process pool.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+from course.engines.design import lag_matrix
+from course.engines.parallel import parallel_map
+from course.engines.quantile import quantile_profile
+
+GRID = np.round(np.arange(0.05, 0.96, 0.05), 10)
+# Weights below this fraction of the largest one are treated as zero.
+WEIGHT_FLOOR = 1e-6
+
+
+@dataclass
+class QQRResult:
+    thetas: np.ndarray
+    taus: np.ndarray
+    slope: np.ndarray       # (thetas, taus): b1(theta, tau)
+    intercept: np.ndarray   # (thetas, taus): b0(theta, tau)
+    qr_slope: np.ndarray    # (taus,): standard quantile regression slope
+    bandwidth: float
+    lags: int
+    nobs: int
+
+
+def kernel_weights(ranks, theta, bandwidth):
+    """Gaussian kernel weights of the empirical-CDF ``ranks`` around ``theta``."""
+    return stats.norm.pdf((ranks - theta) / bandwidth)
+
+
+def _theta_fits(y, x, ranks, lagged, theta, taus, bandwidth):
+    """``(b0, b1)`` over the ``tau`` grid for one ``theta``."""
+    weights = kernel_weights(ranks, theta, bandwidth)
+    keep = weights > WEIGHT_FLOOR * weights.max()
+    w = weights[keep]
+    X = np.column_stack([np.ones(w.shape[0]), x[keep] - np.quantile(x, theta), lagged[keep]])
+    profile = quantile_profile(w * y[keep], w[:, None] * X, taus)
+    return profile.params[:, 0], profile.params[:, 1]
+
+
+def qqr(y, x, thetas=None, taus=None, bandwidth=0.05, lags=1, workers=None, progress=None):
+    """Quantile-on-quantile slopes of ``y`` on ``x`` over ``thetas x taus``."""
+    y = np.asarray(y, dtype=float)
+    x = np.asarray(x, dtype=float)
+    thetas = GRID if thetas is None else np.asarray(thetas, dtype=float)
+    taus = GRID if taus is None else np.asarray(taus, dtype=float)
+    if y.shape != x.shape:
+        raise ValueError("y and x must have the same length")
+    if bandwidth <= 0:
+        raise ValueError("bandwidth must be positive")
+    lagged = lag_matrix(y, lags) if lags else np.empty((y.shape[0], 0))
+    y, x = y[lags:], x[lags:]
+    ranks = stats.rankdata(x) / x.shape[0]
+
+    fits = parallel_map(
+        _theta_fits,
+        [(y, x, ranks, lagged, theta, taus, bandwidth) for theta in thetas],
+        workers=workers,
+        progress=progress,
+    )
+    X = np.column_stack([np.ones(y.shape[0]), x, lagged])
+    return QQRResult(
+        thetas=thetas,
+        taus=taus,
+        slope=np.array([fit[1] for fit in fits]),
+        intercept=np.array([fit[0] for fit in fits]),
+        qr_slope=quantile_profile(y, X, taus).params[:, 1],
+        bandwidth=bandwidth,
+        lags=lags,
+        nobs=y.shape[0],
+    )
@@ -0,0 +1,233 @@
+"""Linear quantile regression over a grid of quantiles.
+
+Each quantile is solved with the Frisch–Newton interior-point method of
+Portnoy & Koenker (1997), as in ``quantreg::rq.fit.fnb``. That solver works
+on the dual
+
+    max y'd  s.t.  X'd = (1 - tau) X'1,  0 <= d <= 1.
+
+A grid is not solved as independent cold problems. It starts at the
+quantile nearest the median and walks outward, and every fit warm-starts its
+neighbour through Portnoy–Koenker preprocessing. Residuals from the previous
+quantile's coefficients pick a band of ``m ~ sqrt(k n)`` observations near the
+new quantile. Everything below or above the band is summed into one
+pseudo-observation each, since its residual sign is already known, and only
+the small problem goes to the interior-point solver. If too many collapsed
+observations come out on the wrong side of the new fit, they rejoin the
+band and the small problem is solved again.
+
+On small samples the walk costs more than it saves, and the whole grid is
+instead iterated in lockstep as one batched interior-point problem.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+# Step damping of rq.fit.fnb and its duality-gap tolerance (relative here).
+STEP = 0.99995
+TOLERANCE = 1e-6
+# Up to this many observations the grid is cheaper as one lockstep batched
+# solve than as a walk of warm-started reduced problems.
+LOCKSTEP_NOBS = 1_500
+
+
+@dataclass
+class QuantileProfile:
+    taus: np.ndarray
+    params: np.ndarray     # (taus, k)
+    bse: np.ndarray        # (taus, k)
+    objective: np.ndarray  # check-loss at each tau
+    reduced: np.ndarray    # observations passed to the interior-point solver
+    nobs: int
+
+
+def check_loss(u, tau):
+    """Koenker–Bassett check function ``u (tau - 1{u < 0})`` summed."""
+    return np.sum(u * (tau - (u < 0)), axis=-1)
+
+
+def _step(v, dv):
+    """Largest step along ``dv`` keeping ``v`` positive, per row."""
+    ratio = np.divide(-v, dv, out=np.full_like(v, np.inf), where=dv < 0)
+    return ratio.min(axis=-1)
+
+
+def frisch_newton(X, y, tau, max_iter=100):
+    """Coefficients of the ``tau`` quantile regression of ``y`` on ``X``.
+
+    Mehrotra predictor–corrector on the bounded dual, a transcription of
+    Koenker's ``rqfnb``. ``tau`` may be a vector, in which case all the
+    quantiles are iterated in lockstep as one batched problem (shape
+    ``(len(tau), k)``); each stops moving once its own gap has closed.
+    """
+    tau = np.asarray(tau, dtype=float)
+    scalar = tau.ndim == 0
+    tau = np.atleast_1d(tau)[:, None]
+    n = X.shape[0]
+    c = -y
+    b = (1.0 - tau) * X.sum(axis=0)
+    x = np.repeat(1.0 - tau, n, axis=1)
+    s = 1.0 - x
+    dual = np.repeat(-np.linalg.lstsq(X, y, rcond=None)[0][None], tau.shape[0], axis=0)
+    r = c - dual @ X.T
+    r = r + 0.001 * (r == 0)
+    z = np.maximum(r, 0.0)
+    w = z - r
+    for _ in range(max_iter):
+        gap = x @ c - np.einsum("bi,bi->b", dual, b) + w.sum(axis=1)
+        # Relative gap: absolute precision runs out on large aggregated globs.
+        active = gap > TOLERANCE * (1.0 + np.abs(x @ c))
+        if not active.any():
+            break
+        q = 1.0 / (z / x + w / s)
+        r = z - w
+        AQA = (X.T * q[:, None, :]) @ X
+        dy = np.linalg.solve(AQA, ((q * r) @ X)[..., None])[..., 0]
+        dx = q * (dy @ X.T - r)
+        ds = -dx
+        dz = -z * (dx / x + 1.0)
+        dw = -w * (ds / s + 1.0)
+        fp = np.minimum(STEP * np.minimum(_step(x, dx), _step(s, ds)), 1.0)[:, None]
+        fd = np.minimum(STEP * np.minimum(_step(w, dw), _step(z, dz)), 1.0)[:, None]
+        correct = np.minimum(fp, fd)[:, 0] < 1.0
+        if correct.any():
+            # Mehrotra corrector with a centring term, where the full step is blocked.
+            mu = np.einsum("bn,bn->b", z, x) + np.einsum("bn,bn->b", w, s)
+            g = (np.einsum("bn,bn->b", z + fd * dz, x + fp * dx)
+                 + np.einsum("bn,bn->b", w + fd * dw, s + fp * ds))
+            mu = (mu * (g / mu) ** 3 / (2.0 * n))[:, None]
+            dxdz, dsdw = dx * dz, ds * dw
+            xinv, sinv = 1.0 / x, 1.0 / s
+            xi = mu * (xinv - sinv)
+            dy_c = np.linalg.solve(AQA, ((q * (r + dxdz - dsdw - xi)) @ X)[..., None])[..., 0]
+            dx_c = q * (dy_c @ X.T + xi - r - dxdz + dsdw)
+            dz_c = mu * xinv - z - xinv * z * dx_c - dxdz
+            dw_c = mu * sinv - w - sinv * w * -dx_c - dsdw
+            use = correct[:, None]
+            dy, dx = np.where(use, dy_c, dy), np.where(use, dx_c, dx)
+            dz, dw = np.where(use, dz_c, dz), np.where(use, dw_c, dw)
+            ds = -dx
+            fp = np.minimum(STEP * np.minimum(_step(x, dx), _step(s, ds)), 1.0)[:, None]
+            fd = np.minimum(STEP * np.minimum(_step(w, dw), _step(z, dz)), 1.0)[:, None]
+        fp = fp * active[:, None]
+        fd = fd * active[:, None]
+        x = x + fp * dx
+        s = s + fp * ds
+        dual = dual + fd * dy
+        w = w + fd * dw
+        z = z + fd * dz
+    return -dual[0] if scalar else -dual
+
+
+def rq(y, X, tau, start=None, band=2.0, max_rounds=4):
+    """Quantile regression at ``tau``, warm-started from coefficients ``start``.
+
+    Without ``start`` the preliminary fit uses a random subsample, as in
+    Portnoy & Koenker's preprocessing. Returns ``(params, observations)``,
+    where ``observations`` is the size of the final reduced problem.
+    """
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float)
+    n, k = X.shape
+    m = int(band * np.sqrt(k * n) * max(1.0, np.log(n) / 4.0))
+    if m >= n // 2:
+        return frisch_newton(X, y, tau), n
+    if start is None:
+        rng = np.random.default_rng(0)
+        sub = rng.choice(n, size=min(n, 4 * m), replace=False)
+        start = frisch_newton(X[sub], y[sub], tau)
+
+    resid = y - X @ start
+    while m < n // 2:
+        lo, hi = np.quantile(resid, [max(0.0, tau - m / (2.0 * n)), min(1.0, tau + m / (2.0 * n))])
+        below, above = resid < lo, resid > hi
+        for _ in range(max_rounds):
+            keep = ~(below | above)
+            # Each glob is the sum of its observations, so its check loss is
+            # exact while every member stays on the same side of the fit.
+            globs = [g for g in (below, above) if g.any()]
+            Xr = np.vstack([X[keep]] + [X[g].sum(axis=0) for g in globs])
+            yr = np.r_[y[keep], [y[g].sum() for g in globs]]
+            params = frisch_newton(Xr, yr, tau)
+            fitted = y - X @ params
+            wrong = (below & (fitted > 0)) | (above & (fitted < 0))
+            if not wrong.any():
+                return params, Xr.shape[0]
+            if wrong.sum() > 0.1 * m:
+                break
+            # A few misclassified observations rejoin the band.
+            below &= ~wrong
+            above &= ~wrong
+        m *= 2
+    return frisch_newton(X, y, tau), n
+
+
+def hall_sheather(n, tau, alpha=0.05):
+    """Hall–Sheather (1988) bandwidth for the sparsity estimate."""
+    z = stats.norm.ppf(1.0 - alpha / 2.0)
+    x = stats.norm.ppf(tau)
+    f = stats.norm.pdf(x)
+    return n ** (-1.0 / 3.0) * z ** (2.0 / 3.0) * (1.5 * f ** 2 / (2.0 * x ** 2 + 1.0)) ** (1.0 / 3.0)
+
+
+def _iid_se(X, resid, tau, xtx_inv):
+    """Koenker–Bassett standard errors with a difference-quotient sparsity."""
+    n = X.shape[0]
+    h = hall_sheather(n, tau)
+    lower, upper = max(tau - h, 1.0 / n), min(tau + h, 1.0 - 1.0 / n)
+    lo, hi = np.quantile(resid, [lower, upper])
+    sparsity = (hi - lo) / (upper - lower)
+    return sparsity * np.sqrt(tau * (1.0 - tau) * np.diag(xtx_inv))
+
+
+def _walk(y, X, taus, params, reduced):
+    """Fill ``params`` from the median outward, warm-starting each fit."""
+    middle = int(np.argmin(np.abs(taus - 0.5)))
+    params[middle], reduced[middle] = rq(y, X, taus[middle])
+    for direction, stop in ((1, taus.shape[0]), (-1, -1)):
+        for i in range(middle + direction, stop, direction):
+            last, prev = i - direction, i - 2 * direction
+            start = params[last]
+            if abs(i - middle) >= 2:
+                # Extrapolate the coefficient path linearly from the last two fits.
+                slope = (params[last] - params[prev]) / (taus[last] - taus[prev])
+                start = start + slope * (taus[i] - taus[last])
+            params[i], reduced[i] = rq(y, X, taus[i], start=start)
+
+
+def quantile_profile(y, X, taus=None):
+    """Quantile regressions over ``taus`` (default 0.05..0.95 by 0.05).
+
+    Small samples solve the whole grid as one batched interior-point
+    problem. Larger ones are solved from the quantile nearest the median
+    outward. Each fit starts from its neighbour's coefficients, extrapolated
+    along the path once two fits are available.
+    """
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float)
+    taus = np.round(np.arange(0.05, 0.96, 0.05), 10) if taus is None else np.sort(np.asarray(taus, dtype=float))
+    if np.any((taus <= 0) | (taus >= 1)):
+        raise ValueError("quantiles must lie strictly between 0 and 1")
+    n, k = X.shape
+    if n <= k:
+        raise ValueError(f"need more than {k} observations, got {n}")
+
+    params = np.empty((taus.shape[0], k))
+    reduced = np.full(taus.shape[0], n)
+    if n <= LOCKSTEP_NOBS:
+        params[:] = frisch_newton(X, y, taus)
+    else:
+        _walk(y, X, taus, params, reduced)
+
+    resid = y[None, :] - params @ X.T
+    xtx_inv = np.linalg.inv(X.T @ X)
+    bse = np.array([_iid_se(X, resid[i], tau, xtx_inv) for i, tau in enumerate(taus)])
+    return QuantileProfile(
+        taus=taus,
+        params=params,
+        bse=bse,
+        objective=np.array([check_loss(resid[i], tau) for i, tau in enumerate(taus)]),
+        reduced=reduced,
+        nobs=n,
+    )
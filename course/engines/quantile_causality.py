@@ -0,0 +1,187 @@
+"""Nonparametric Granger causality in quantiles (Jeong, Härdle & Song, 2012).
+
+``x`` does not cause ``y`` at quantile ``tau`` when
+
+    Q_tau(y_t | Y_{t-1}, X_{t-1}) = Q_tau(y_t | Y_{t-1})
+
+with ``Y_{t-1}, X_{t-1}`` the last ``p`` values of each series. Under the
+null ``e_t = 1{y_t <= Q_tau(y_t | Y_{t-1})} - tau`` is unpredictable from
+``Z_t = (Y_{t-1}, X_{t-1})``, and the test statistic is the kernel U-statistic
+
+    J = sum_{t != s} K_ts e_t e_s / sqrt(2 sum_{t != s} K_ts^2 e_t^2 e_s^2),
+
+asymptotically standard normal and rejected in the upper tail. The restricted
+quantile comes from a leave-one-out Nadaraya–Watson conditional CDF, since
+``y_t <= Q_tau(Y_{t-1})`` exactly when ``F(y_t | Y_{t-1}) <= tau``.
+
+Both the conditional CDF and the statistic are sums over all ``n^2`` pairs.
+Neither ``n x n`` kernel matrix is ever held: rows are processed in blocks
+sized to a memory budget and held in float32, and each block of ``K`` serves
+every quantile at once through one matrix product. The CDF does not depend on ``tau`` either,
+so a whole grid costs two passes over the pairs. Statistics are cached per
+(series, lags, quantile); asking for more quantiles of a series already seen
+only runs the second pass for the new ones.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import stats
+
+from course.engines.design import lag_matrix
+
+# Memory for the n-wide temporaries of one block of kernel rows.
+MEMORY_BUDGET = 512 * 2 ** 20
+# Float32 arrays of width n alive at once inside a block.
+BLOCK_ARRAYS = 4
+# Squared distance beyond which the kernel is zero. Far pairs would otherwise
+# leave subnormal float32 values (also once squared), which are very slow to
+# multiply.
+CUTOFF = 60.0
+FLOOR = np.exp(-0.5 * CUTOFF)
+# Kernel mass from other observations below which the CDF falls back to ranks.
+MIN_MASS = 1e-3
+# Series whose statistics are kept, oldest dropped first.
+CACHE_SERIES = 32
+
+_cache = {}
+_lock = threading.Lock()
+
+
+@dataclass
+class QuantileCausalityResult:
+    taus: np.ndarray
+    statistic: np.ndarray  # J at each tau, N(0, 1) under no causality
+    pvalue: np.ndarray
+    lags: int
+    moment: int            # 1: causality in quantiles, 2: in variance
+    nobs: int
+    bandwidth: tuple       # (restricted CDF, test kernel), standardized units
+    reused: int            # quantiles taken from the cache
+
+
+def block_rows(n, budget=MEMORY_BUDGET):
+    """Kernel rows per block so that one block stays within ``budget`` bytes."""
+    return int(max(1, min(n, budget // (BLOCK_ARRAYS * 4 * n))))
+
+
+def rule_of_thumb(n, dim):
+    """Silverman-type bandwidth for a ``dim``-variate standardized Gaussian kernel."""
+    return 1.06 * n ** (-1.0 / (4.0 + dim))
+
+
+def _blocks(Z, bandwidth, budget):
+    """Yield ``(rows, K)`` for row blocks of the Gaussian kernel matrix of ``Z``."""
+    Z = (Z / bandwidth).astype(np.float32)
+    norms = np.einsum("ij,ij->i", Z, Z)
+    step = block_rows(Z.shape[0], budget)
+    for start in range(0, Z.shape[0], step):
+        rows = slice(start, start + step)
+        distance = Z[rows] @ Z.T
+        distance *= -2.0
+        distance += norms[rows, None]
+        distance += norms[None, :]
+        np.clip(distance, 0.0, CUTOFF, out=distance)
+        K = np.exp(-0.5 * distance, out=distance)
+        K *= K > FLOOR
+        yield rows, K
+
+
+def conditional_cdf(y, Y, bandwidth, budget=MEMORY_BUDGET):
+    """Leave-one-out kernel estimate of ``F(y_t | Y_{t-1})`` at each ``y_t``.
+
+    Observations with almost no neighbours at this bandwidth get their
+    unconditional rank instead.
+    """
+    cdf = stats.rankdata(y) / y.shape[0]
+    for rows, L in _blocks(Y, bandwidth, budget):
+        # Own terms contribute 1 to both sums (K_tt = 1, y_t <= y_t).
+        mass = L.sum(axis=1, dtype=float) - 1.0
+        L *= y[None, :] <= y[rows, None]
+        below = L.sum(axis=1, dtype=float) - 1.0
+        np.divide(below, mass, out=cdf[rows], where=mass > MIN_MASS)
+    return cdf
+
+
+def jhs_statistic(cdf, Z, taus, bandwidth, budget=MEMORY_BUDGET):
+    """Standardized JHS statistics for every ``tau`` from one pass over ``K``."""
+    e = ((cdf[:, None] <= taus[None, :]) - taus[None, :]).astype(np.float32)
+    e2 = e ** 2
+    numerator = np.zeros(taus.shape[0])
+    variance = np.zeros(taus.shape[0])
+    for rows, K in _blocks(Z, bandwidth, budget):
+        numerator += np.einsum("it,it->t", e[rows], K @ e, dtype=float)
+        variance += np.einsum("it,it->t", e2[rows], np.square(K, out=K) @ e2, dtype=float)
+    # Drop the t = s terms, where K_tt = 1.
+    numerator -= np.sum(e2, axis=0, dtype=float)
+    variance -= np.sum(e2 ** 2, axis=0, dtype=float)
+    n = cdf.shape[0]
+    return np.sqrt(n / (n - 1.0)) * numerator / np.sqrt(2.0 * variance)
+
+
+def _key(y, x, lags, moment, bandwidth):
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (y, x):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest(), lags, moment, bandwidth
+
+
+def quantile_causality(y, x, lags=1, taus=None, moment=1, bandwidth=None, budget=MEMORY_BUDGET):
+    """Test whether ``x`` Granger-causes ``y`` at each quantile in ``taus``.
+
+    ``moment=2`` tests causality in variance by using ``y_t**2`` (after
+    demeaning) as the dependent variable. ``bandwidth`` is a
+    ``(restricted, test)`` pair in standardized units; the default is the
+    rule of thumb for each kernel's dimension.
+    """
+    y = np.asarray(y, dtype=float)
+    x = np.asarray(x, dtype=float)
+    taus = np.round(np.arange(0.05, 0.96, 0.05), 10) if taus is None else np.sort(np.round(np.asarray(taus, dtype=float), 10))
+    if y.shape != x.shape:
+        raise ValueError("y and x must have the same length")
+    if np.any((taus <= 0) | (taus >= 1)):
+        raise ValueError("quantiles must lie strictly between 0 and 1")
+    if moment not in (1, 2):
+        raise ValueError(f"moment must be 1 or 2, got {moment!r}")
+    if lags < 1 or y.shape[0] - lags < 20:
+        raise ValueError(f"need at least one lag and 20 usable observations, got {y.shape[0] - lags}")
+    if moment == 2:
+        y = (y - y.mean()) ** 2
+
+    target = y[lags:]
+    n = target.shape[0]
+    Y = lag_matrix(y, lags)
+    Z = np.column_stack([Y, lag_matrix(x, lags)])
+    Z = (Z - Z.mean(axis=0)) / Z.std(axis=0)
+    if not np.all(np.isfinite(Z)):
+        raise ValueError("a lagged series is constant")
+    if bandwidth is None:
+        bandwidth = (rule_of_thumb(n, lags), rule_of_thumb(n, 2 * lags))
+    bandwidth = tuple(float(h) for h in bandwidth)
+
+    key = _key(y, x, lags, moment, bandwidth)
+    with _lock:
+        entry = _cache.pop(key, None)
+    if entry is None:
+        entry = (conditional_cdf(target, Z[:, :lags], bandwidth[0], budget), {})
+    cdf, known = entry
+    missing = np.array([tau for tau in taus if tau not in known])
+    if missing.size:
+        known.update(zip(missing, jhs_statistic(cdf, Z, missing, bandwidth[1], budget)))
+    with _lock:
+        _cache[key] = entry
+        while len(_cache) > CACHE_SERIES:
+            _cache.pop(next(iter(_cache)))
+
+    statistic = np.array([known[tau] for tau in taus])
+    return QuantileCausalityResult(
+        taus=taus,
+        statistic=statistic,
+        pvalue=stats.norm.sf(statistic),
+        lags=lags,
+        moment=moment,
+        nobs=n,
+        bandwidth=bandwidth,
+        reused=taus.shape[0] - missing.size,
+    )
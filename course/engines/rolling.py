@@ -0,0 +1,130 @@
+"""Rolling and recursive least squares from incrementally updated moments.
+
+Sliding the window forward one period adds the outer product of the new row
+to ``X'X`` (and ``x_t y_t`` to ``X'y``) and subtracts that of the row that
+leaves. Those rank-one up/downdates are applied a chunk of periods at a time
+as cumulative sums, so the cost is ``O(n k^2)`` for the moments plus one
+``k x k`` solve per window, whatever the window length. Each chunk starts from
+moments summed exactly over its first window, so rounding error cannot build
+up across a long sample.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.linalg import solve_triangular
+
+
+@dataclass(frozen=True)
+class RollingOLSResult:
+    ends: np.ndarray        # index of the last observation in each window
+    params: np.ndarray      # (windows, k)
+    bse: np.ndarray         # (windows, k)
+    ssr: np.ndarray         # (windows,)
+    rsquared: np.ndarray    # (windows,)
+    nobs: np.ndarray        # (windows,)
+    window: int | None
+
+
+def moment_paths(y, X, window=None, min_nobs=None, chunk=4096):
+    """Yield ``(ends, X'X, X'y, y'y, y_sum, nobs)`` for consecutive chunks of windows.
+
+    ``window=None`` gives recursive (expanding) windows starting with the
+    first ``min_nobs`` observations. Memory is ``O(chunk k^2)``.
+    """
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float)
+    n, k = X.shape
+    first = (window or min_nobs or k + 1) - 1
+    if window is not None and window <= k:
+        raise ValueError(f"window must exceed the {k} regressors, got {window}")
+    if window is None and min_nobs is not None and not k < min_nobs <= n:
+        raise ValueError(f"min_nobs must exceed the {k} regressors and be at most {n}, got {min_nobs}")
+    if first >= n:
+        raise ValueError(f"need more than {first} observations, got {n}")
+    chunk = max(int(chunk), window or 1)
+
+    for start in range(first, n, chunk):
+        ends = np.arange(start, min(start + chunk, n))
+        lo = 0 if window is None else start - window + 1
+        # Exact moments of the chunk's first window ...
+        gram = X[lo:start + 1].T @ X[lo:start + 1]
+        xty = X[lo:start + 1].T @ y[lo:start + 1]
+        yty = y[lo:start + 1] @ y[lo:start + 1]
+        ysum = y[lo:start + 1].sum()
+        # ... then one rank-one update (and downdate) per later period.
+        new = slice(start + 1, ends[-1] + 1)
+        d_gram = np.einsum("ti,tj->tij", X[new], X[new])
+        d_xty = X[new] * y[new, None]
+        d_yty = y[new] ** 2
+        d_ysum = y[new].copy()
+        if window is not None:
+            old = slice(start + 1 - window, ends[-1] + 1 - window)
+            d_gram -= np.einsum("ti,tj->tij", X[old], X[old])
+            d_xty -= X[old] * y[old, None]
+            d_yty -= y[old] ** 2
+            d_ysum -= y[old]
+        yield (
+            ends,
+            np.concatenate([gram[None], gram + np.cumsum(d_gram, axis=0)]),
+            np.concatenate([xty[None], xty + np.cumsum(d_xty, axis=0)]),
+            np.r_[yty, yty + np.cumsum(d_yty)],
+            np.r_[ysum, ysum + np.cumsum(d_ysum)],
+            ends + 1 if window is None else np.full(ends.shape, window),
+        )
+
+
+def rolling_ols(y, X, window=None, min_nobs=None, chunk=4096):
+    """OLS on every rolling (``window``) or recursive window of ``(y, X)``.
+
+    Rows of ``X`` are aligned with ``y``; include a constant column yourself.
+    """
+    X = np.asarray(X, dtype=float)
+    parts = []
+    for ends, gram, xty, yty, ysum, nobs in moment_paths(y, X, window, min_nobs, chunk):
+        gram_inv = np.linalg.inv(gram)
+        params = np.einsum("tij,tj->ti", gram_inv, xty)
+        ssr = np.maximum(yty - np.einsum("ti,ti->t", params, xty), 0.0)
+        sst = yty - ysum ** 2 / nobs
+        sigma2 = ssr / (nobs - X.shape[1])
+        parts.append((
+            ends, params,
+            np.sqrt(sigma2[:, None] * np.diagonal(gram_inv, axis1=-2, axis2=-1)),
+            ssr, 1.0 - ssr / sst, nobs,
+        ))
+    return RollingOLSResult(*(np.concatenate(column) for column in zip(*parts)), window=window)
+
+
+def recursive_residuals(y, X, min_nobs=None, block=64):
+    """Standardised recursive residuals (Brown, Durbin & Evans, 1975).
+
+    ``w_t = (y_t - x_t' b_{t-1}) / sqrt(1 + x_t' (X_{t-1}'X_{t-1})^{-1} x_t)``
+    for ``t = min_nobs .. n-1``, where ``b_{t-1}`` uses observations before
+    ``t``. The sample is streamed in blocks: within a block the one-step
+    prediction errors from the block's starting fit have covariance
+    ``sigma^2 (I + X_B P X_B')``, and its Cholesky factor turns them into the
+    sequential recursive residuals in one triangular solve. Only the ``k x k``
+    moments are carried between blocks.
+    """
+    y = np.asarray(y, dtype=float)
+    X = np.asarray(X, dtype=float)
+    n, k = X.shape
+    first = k if min_nobs is None else min_nobs
+    if first < k or first >= n:
+        raise ValueError(f"min_nobs must be between {k} and {n - 1}, got {first}")
+    gram = X[:first].T @ X[:first]
+    if np.linalg.matrix_rank(gram) < k:
+        raise ValueError(f"the first {first} observations do not identify the {k} coefficients; raise min_nobs")
+    xty = X[:first].T @ y[:first]
+    out = np.empty(n - first)
+    for start in range(first, n, block):
+        rows, target = X[start:start + block], y[start:start + block]
+        gram_inv = np.linalg.inv(gram)
+        errors = target - rows @ (gram_inv @ xty)
+        cov = rows @ gram_inv @ rows.T
+        cov[np.diag_indices_from(cov)] += 1.0
+        out[start - first:start - first + rows.shape[0]] = solve_triangular(
+            np.linalg.cholesky(cov), errors, lower=True, check_finite=False,
+        )
+        gram += rows.T @ rows
+        xty += rows.T @ target
+    return out
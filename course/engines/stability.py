@@ -0,0 +1,70 @@
+"""CUSUM and CUSUMSQ parameter-stability tests (Brown, Durbin & Evans, 1975).
+
+Both tests are cumulative sums of the recursive residuals from
+:func:`course.engines.rolling.recursive_residuals`, so one streaming pass
+over the sample gives both paths and their significance bands.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from course.engines.rolling import recursive_residuals
+
+# Brown–Durbin–Evans boundary constants for the CUSUM test.
+CUSUM_A = {0.01: 1.143, 0.05: 0.948, 0.10: 0.850}
+# Two-sided Kolmogorov quantiles, the large-sample limit of Durbin's (1969)
+# CUSUMSQ table with m = (n - k) / 2.
+CUSUMSQ_K = {0.01: 1.628, 0.05: 1.358, 0.10: 1.224}
+
+
+@dataclass(frozen=True)
+class StabilityResult:
+    ends: np.ndarray       # observation index of each recursive residual
+    residuals: np.ndarray
+    cusum: np.ndarray
+    cusum_band: np.ndarray     # half-width of the CUSUM band at each point
+    cusumsq: np.ndarray
+    cusumsq_mean: np.ndarray   # expected CUSUMSQ path under stability
+    cusumsq_band: float
+    level: float
+
+    def cusum_crossings(self):
+        """Indices into ``ends`` where the CUSUM path leaves its band."""
+        return np.flatnonzero(np.abs(self.cusum) > self.cusum_band)
+
+    def cusumsq_crossings(self):
+        """Indices into ``ends`` where the CUSUMSQ path leaves its band."""
+        return np.flatnonzero(np.abs(self.cusumsq - self.cusumsq_mean) > self.cusumsq_band)
+
+
+def cusum_band(m, level=0.05):
+    """CUSUM band ``a (sqrt(m) + 2 r / sqrt(m))`` for ``r = 1..m``."""
+    r = np.arange(1, m + 1)
+    return CUSUM_A[level] * (np.sqrt(m) + 2.0 * r / np.sqrt(m))
+
+
+def cusumsq_band(m, level=0.05):
+    """Half-width of the CUSUMSQ band around ``r / m`` (finite-sample corrected)."""
+    half = m / 2.0
+    return CUSUMSQ_K[level] / (np.sqrt(half) + 0.12 + 0.11 / np.sqrt(half))
+
+
+def stability_tests(y, X, level=0.05, min_nobs=None):
+    """CUSUM and CUSUMSQ paths, bands and crossings for ``y`` on ``X``."""
+    if level not in CUSUM_A:
+        raise ValueError(f"level must be one of {sorted(CUSUM_A)}, got {level!r}")
+    w = recursive_residuals(y, X, min_nobs)
+    m = w.shape[0]
+    if m < 3:
+        raise ValueError("too few recursive residuals for the stability tests")
+    squares = np.cumsum(w ** 2)
+    return StabilityResult(
+        ends=np.arange(len(y) - m, len(y)),
+        residuals=w,
+        cusum=np.cumsum(w) / w.std(ddof=1),
+        cusum_band=cusum_band(m, level),
+        cusumsq=squares / squares[-1],
+        cusumsq_mean=np.arange(1, m + 1) / m,
+        cusumsq_band=cusumsq_band(m, level),
+        level=level,
+    )
@@ -0,0 +1,130 @@
+"""On-disk outputs shared by the engines.
+
+Results too large to keep in RAM are written as ``.npy`` files under one
+cache directory and read back memory-mapped. The directory is
+``COURSE_CACHE_DIR`` when that is set, and ``course-cache`` in the system
+temporary directory otherwise. File names are content keys of the inputs,
+so rerunning the same job replaces its own file rather than adding one.
+
+Each cache subdirectory is capped at ``CACHE_BYTES`` (``COURSE_CACHE_BYTES``
+overrides it). After a file is written, the oldest files of its directory
+by modification time are deleted until the directory fits the budget; the
+new file is always kept. Deleting a file that a session still maps is
+safe: the map keeps the inode alive until it is closed. Files written to
+an explicit path outside the cache directory are never pruned.
+
+Every file is written under a unique temporary name in the same directory
+and renamed into place. Sessions are threads of one process, so two of them
+may write the same key at once. The rename swaps the directory entry
+without touching the old inode, so a session that still maps the previous
+file keeps reading it.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Default byte budget of each cache subdirectory.
+CACHE_BYTES = 2 * 2 ** 30
+
+
+def _root():
+    return Path(os.environ.get("COURSE_CACHE_DIR") or Path(tempfile.gettempdir()) / "course-cache")
+
+
+def cache_dir(*parts):
+    """Cache subdirectory ``parts``, created if needed."""
+    path = _root().joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def prune(directory, budget=None, keep=None):
+    """Delete the oldest ``.npy`` files in ``directory`` until it fits ``budget`` bytes.
+
+    ``keep`` is never deleted. Files that vanish meanwhile, removed by
+    another session, are skipped.
+    """
+    if budget is None:
+        budget = int(os.environ.get("COURSE_CACHE_BYTES", CACHE_BYTES))
+    files = []
+    for entry in Path(directory).glob("*.npy"):
+        try:
+            info = entry.stat()
+        except FileNotFoundError:
+            continue
+        files.append((info.st_mtime, info.st_size, entry))
+    total = sum(size for _, size, _ in files)
+    for _, size, entry in sorted(files, key=lambda item: item[0]):
+        if total <= budget:
+            break
+        if keep is not None and entry == Path(keep):
+            continue
+        entry.unlink(missing_ok=True)
+        total -= size
+
+
+def _evict(path):
+    """Prune the directory of ``path`` when it lies inside the cache directory."""
+    if path.resolve().parent.is_relative_to(_root().resolve()):
+        prune(path.parent, keep=path)
+
+
+def content_key(*items):
+    """Short hash of arrays and plain values, for cache file names."""
+    digest = hashlib.blake2b(digest_size=12)
+    for item in items:
+        if isinstance(item, np.ndarray):
+            digest.update(np.ascontiguousarray(item).tobytes())
+        else:
+            digest.update(repr(item).encode())
+    return digest.hexdigest()
+
+
+def _partial(path):
+    """Unique temporary file next to ``path``; the caller renames or removes it."""
+    handle, name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".partial", dir=path.parent)
+    os.close(handle)
+    return Path(name)
+
+
+def write_memmap(path, shape, blocks, dtype=np.float64):
+    """Write ``(start, array)`` blocks along axis 0 into a ``.npy`` file.
+
+    Returns the file opened read-only with ``mmap_mode="r"``, so only the
+    pages that are read come into memory.
+    """
+    path = Path(path)
+    partial = _partial(path)
+    try:
+        out = np.lib.format.open_memmap(partial, mode="w+", dtype=dtype, shape=shape)
+        for start, block in blocks:
+            out[start:start + block.shape[0]] = block
+        out.flush()
+        del out
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    mapped = np.load(path, mmap_mode="r")
+    _evict(path)
+    return mapped
+
+
+def save_array(path, array):
+    """Write ``array`` to ``path`` as ``.npy`` atomically.
+
+    A reader in another session never sees the file half-written.
+    """
+    path = Path(path)
+    partial = _partial(path)
+    try:
+        with open(partial, "wb") as handle:
+            np.save(handle, array)
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    _evict(path)
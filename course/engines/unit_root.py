@@ -0,0 +1,195 @@
+"""Classical and Fourier unit root / stationarity statistics.
+
+Every function accepts ``y`` of shape ``(..., T)`` and returns statistics with
+the leading shape, so the same code tests one observed series and simulates
+thousands of null paths at once for ``course.engines.critical_values``.
+
+``trend`` is ``"c"`` (constant) or ``"ct"`` (constant and linear trend);
+``frequency > 0`` adds the Enders–Lee / Becker–Enders–Lee Fourier pair to the
+deterministic terms.
+"""
+import numpy as np
+
+from course.engines.design import (
+    deterministic_terms,
+    fourier_terms,
+    information_criterion,
+    lag_matrix,
+    nested_ssr,
+    ols,
+)
+
+# Local-to-unity parameters of Elliott, Rothenberg & Stock (1996).
+GLS_CBAR = {"c": -7.0, "ct": -13.5}
+
+
+def deterministics(T, trend, frequency=0):
+    """Deterministic regressors, optionally with one Fourier pair."""
+    D = deterministic_terms(T, trend)
+    if frequency:
+        D = np.column_stack([D, fourier_terms(T, frequency)])
+    return D
+
+
+def newey_west_bandwidth(T):
+    """Newey–West (1994) rule-of-thumb truncation lag ``4 (T/100)^(2/9)``."""
+    return int(4 * (T / 100.0) ** (2.0 / 9.0))
+
+
+def long_run_variance(e, bandwidth):
+    """Bartlett-kernel long-run variance of ``e`` along the last axis."""
+    n = e.shape[-1]
+    lrv = np.einsum("...n,...n->...", e, e) / n
+    for j in range(1, bandwidth + 1):
+        gamma = np.einsum("...n,...n->...", e[..., j:], e[..., :-j]) / n
+        lrv = lrv + 2.0 * (1.0 - j / (bandwidth + 1.0)) * gamma
+    return lrv
+
+
+def _with_deterministics(X, D):
+    D = np.broadcast_to(D, X.shape[:-1] + D.shape[-1:])
+    return np.concatenate([X, D], axis=-1)
+
+
+def _df_regression(y, lags, D=None, trim=None):
+    """``dy_t`` on ``[y_{t-1}, dy_{t-1..t-lags}, D_t]`` over a common sample."""
+    trim = lags if trim is None else trim
+    dy = np.diff(y, axis=-1)
+    X = np.concatenate([y[..., trim:-1, None], lag_matrix(dy, trim)[..., :lags]], axis=-1)
+    if D is not None:
+        X = _with_deterministics(X, D[trim + 1:])
+    return dy[..., trim:], X
+
+
+def adf(y, trend="c", lags=0, frequency=0, trim=None):
+    """ADF τ and normalised bias ``n * rho`` (Fourier ADF when ``frequency``).
+
+    ``trim`` drops that many leading differences (default ``lags``) so lag
+    orders can be compared on a common sample.
+    """
+    y = np.asarray(y, dtype=float)
+    target, X = _df_regression(y, lags, deterministics(y.shape[-1], trend, frequency), trim)
+    beta, se, resid = ols(target, X)
+    n = target.shape[-1]
+    alpha = n * beta[..., 0] / (1.0 - beta[..., 1:1 + lags].sum(axis=-1))
+    return beta[..., 0] / se[..., 0], alpha
+
+
+def select_lags(y, trend="c", pmax=12, ic="aic", frequency=0):
+    """ADF lag order minimising ``ic`` over ``0..pmax`` on a common sample."""
+    y = np.asarray(y, dtype=float)
+    D = deterministics(y.shape[-1], trend, frequency)
+    target, X = _df_regression(y, pmax, D, pmax)
+    # Order [y_{t-1}, D, lags] so that every lag order is a leading block.
+    X = np.concatenate([X[..., :1], X[..., 1 + pmax:], X[..., 1:1 + pmax]], axis=-1)
+    X = X / np.linalg.norm(X, axis=-2, keepdims=True)
+    gram = np.einsum("...ni,...nj->...ij", X, X)
+    xty = np.einsum("...ni,...n->...i", X, target)
+    yty = np.einsum("...n,...n->...", target, target)
+    base = 1 + D.shape[1]
+    ssr = nested_ssr(gram, xty, yty[..., None])[..., base - 1:]
+    criterion = information_criterion(ssr, target.shape[-1], base + np.arange(pmax + 1), ic)
+    return criterion.argmin(axis=-1)
+
+
+def phillips_perron(y, trend="c", bandwidth=None):
+    """Phillips–Perron ``Z_t`` and ``Z_alpha`` with a Bartlett long-run variance."""
+    y = np.asarray(y, dtype=float)
+    target, X = _df_regression(y, 0, deterministics(y.shape[-1], trend))
+    beta, se, resid = ols(target, X)
+    n, m = X.shape[-2:]
+    bandwidth = newey_west_bandwidth(n) if bandwidth is None else bandwidth
+    gamma0 = np.einsum("...n,...n->...", resid, resid) / n
+    lam2 = long_run_variance(resid, bandwidth)
+    s2 = gamma0 * n / (n - m)
+    rho, se_rho = beta[..., 0], se[..., 0]
+    z_t = np.sqrt(gamma0 / lam2) * rho / se_rho - (lam2 - gamma0) * n * se_rho / (2.0 * np.sqrt(lam2 * s2))
+    z_alpha = n * rho - (n * se_rho) ** 2 / s2 * (lam2 - gamma0) / 2.0
+    return z_t, z_alpha
+
+
+def kpss(y, trend="c", bandwidth=None, frequency=0):
+    """KPSS η statistic (Fourier KPSS of Becker, Enders & Lee when ``frequency``)."""
+    y = np.asarray(y, dtype=float)
+    T = y.shape[-1]
+    D = deterministics(T, trend, frequency)
+    resid = y - (y @ np.linalg.pinv(D).T) @ D.T
+    bandwidth = newey_west_bandwidth(T) if bandwidth is None else bandwidth
+    partial = np.cumsum(resid, axis=-1)
+    return np.einsum("...n,...n->...", partial, partial) / (T ** 2 * long_run_variance(resid, bandwidth))
+
+
+def gls_detrend(y, trend="c"):
+    """ERS local-to-unity GLS detrending of ``y``."""
+    y = np.asarray(y, dtype=float)
+    T = y.shape[-1]
+    D = deterministic_terms(T, trend)
+    a = 1.0 + GLS_CBAR[trend] / T
+    yq = np.concatenate([y[..., :1], y[..., 1:] - a * y[..., :-1]], axis=-1)
+    Dq = np.vstack([D[:1], D[1:] - a * D[:-1]])
+    return y - (yq @ np.linalg.pinv(Dq).T) @ D.T
+
+
+def dfgls(y, trend="c", lags=0):
+    """Elliott–Rothenberg–Stock DF-GLS τ statistic."""
+    yd = gls_detrend(y, trend)
+    target, X = _df_regression(yd, lags)
+    beta, se, _ = ols(target, X)
+    return beta[..., 0] / se[..., 0]
+
+
+def ng_perron(y, trend="c", lags=0):
+    """Ng–Perron (2001) ``MZa``, ``MZt``, ``MSB`` and ``MPT`` statistics."""
+    yd = gls_detrend(y, trend)
+    T = yd.shape[-1]
+    target, X = _df_regression(yd, lags)
+    beta, _, resid = ols(target, X)
+    s2 = np.einsum("...n,...n->...", resid, resid) / target.shape[-1]
+    s2 = s2 / (1.0 - beta[..., 1:].sum(axis=-1)) ** 2
+    kappa = np.einsum("...n,...n->...", yd[..., :-1], yd[..., :-1]) / T ** 2
+    end = yd[..., -1] ** 2 / T
+    cbar = GLS_CBAR[trend]
+    mza = (end - s2) / (2.0 * kappa)
+    msb = np.sqrt(kappa / s2)
+    if trend == "c":
+        mpt = (cbar ** 2 * kappa - cbar * end) / s2
+    else:
+        mpt = (cbar ** 2 * kappa + (1.0 - cbar) * end) / s2
+    return {"MZa": mza, "MZt": mza * msb, "MSB": msb, "MPT": mpt}
+
+
+def za_step(T):
+    """Break-date spacing of at most ~100 candidates, as used for the critical values.
+
+    A finer grid gives a more negative minimum, so a statistic is only
+    comparable with the tables when computed with this step.
+    """
+    return max(1, T // 100)
+
+
+def zivot_andrews(y, model="c", lags=0, trim=0.15, step=1):
+    """Zivot–Andrews minimum τ over candidate break dates.
+
+    ``model`` is ``"c"`` (break in intercept, model A), ``"t"`` (break in
+    trend, model B) or ``"ct"`` (both, model C). Returns the statistic and
+    the break index for each series.
+    """
+    y = np.asarray(y, dtype=float)
+    T = y.shape[-1]
+    t = np.arange(1, T + 1)
+    D = deterministic_terms(T, "ct")
+    best = np.full(y.shape[:-1], np.inf)
+    where = np.zeros(y.shape[:-1], dtype=int)
+    for tb in range(int(trim * T), int((1.0 - trim) * T), step):
+        columns = [D]
+        if model in ("c", "ct"):
+            columns.append((t > tb).astype(float)[:, None])
+        if model in ("t", "ct"):
+            columns.append(np.where(t > tb, (t - tb) / T, 0.0)[:, None])
+        target, X = _df_regression(y, lags, np.hstack(columns))
+        beta, se, _ = ols(target, X)
+        stat = beta[..., 0] / se[..., 0]
+        better = stat < best
+        best = np.where(better, stat, best)
+        where = np.where(better, tb, where)
+    return best, where
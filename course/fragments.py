@@ -0,0 +1,110 @@
+"""Pre-rendered static page content.
+
+Nearly everything the pages show is constant markdown and HTML. ``static()``
+compiles a run of such blocks to a single HTML fragment the first time it is
+requested, keeps it for the life of the server process, and emits it with
+``st.html`` so the browser receives ready HTML in one delta instead of several
+markdown elements to parse.
+
+Fragments are stable byte-for-byte across reruns, so Streamlit's forward
+message cache (``global.minCachedMessageSize`` in ``.streamlit/config.toml``)
+replaces repeat sends with a hash reference once a browser has seen them.
+"""
+import functools
+import hashlib
+import html
+import re
+import textwrap
+
+import streamlit as st
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_BULLET = re.compile(r"^[-*]\s+(.*)$")
+_NUMBERED = re.compile(r"^\d+\.\s+(.*)$")
+_RULE = re.compile(r"^(-{3,}|\*{3,})$")
+_CODE = re.compile(r"`([^`]+)`")
+_STRONG = re.compile(r"\*\*(.+?)\*\*")
+
+
+def _inline(text):
+    text = html.escape(text, quote=False)
+    text = _CODE.sub(r"<code>\1</code>", text)
+    return _STRONG.sub(r"<strong>\1</strong>", text)
+
+
+def _to_html(markdown):
+    """Convert the markdown subset used by the course pages to HTML.
+
+    Handles headings, bullet and numbered lists, horizontal rules, ``**bold**``,
+    inline code, paragraphs and raw HTML blocks (a line starting with ``<``
+    opens a block that runs to the next blank line, as in CommonMark).
+    """
+    out = []
+    para = []
+    list_tag = None
+    in_html = False
+
+    def close():
+        nonlocal list_tag
+        if para:
+            out.append(f"<p>{_inline(chr(10).join(para))}</p>")
+            para.clear()
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    for raw in markdown.split("\n"):
+        line = raw.strip()
+        if in_html:
+            if line:
+                out.append(raw)
+                continue
+            in_html = False
+        if not line:
+            close()
+            continue
+        if line.startswith("<") and not para:
+            close()
+            out.append(raw)
+            in_html = True
+            continue
+        if _RULE.match(line):
+            close()
+            out.append("<hr>")
+            continue
+        match = _HEADING.match(line)
+        if match:
+            close()
+            level = len(match.group(1))
+            out.append(f"<h{level}>{_inline(match.group(2))}</h{level}>")
+            continue
+        match = _BULLET.match(line)
+        tag = "ul"
+        if not match:
+            match = _NUMBERED.match(line)
+            tag = "ol"
+        if match:
+            if para or list_tag != tag:
+                close()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{_inline(match.group(1))}</li>")
+            continue
+        if list_tag:
+            close()
+        para.append(line)
+    close()
+    return "\n".join(out)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_fragment(*blocks):
+    """Compile markdown/HTML blocks into one content-hashed HTML fragment."""
+    body = "\n".join(_to_html(textwrap.dedent(block).strip("\n")) for block in blocks)
+    digest = hashlib.blake2b(body.encode("utf-8"), digest_size=8).hexdigest()
+    return f'<div class="static-fragment" data-fragment="{digest}">\n{body}\n</div>'
+
+
+def static(*blocks):
+    """Render constant markdown/HTML blocks as a single pre-rendered element."""
+    st.html(compile_fragment(*blocks))
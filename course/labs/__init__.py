@@ -0,0 +1,6 @@
+"""Interactive labs embedded in the course pages.
+
+Each module exposes ``render(key)``, which draws the inputs and results for one
+engine from ``course.engines``. ``key`` keeps widget state apart when the same
+lab appears on more than one page.
+"""
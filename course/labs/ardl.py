@@ -0,0 +1,125 @@
+"""ARDL bounds testing lab."""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.ardl import CASES, SIMULATION_NOBS, ardl, bounds_critical_values
+from course.fragments import static
+
+TRENDS = {"c": "Constant (case III)", "ct": "Constant + trend (case V)"}
+LEVELS = (0.10, 0.05, 0.025, 0.01)
+# Larger grids still run, but no longer feel interactive.
+MAX_SPECIFICATIONS = 500_000
+
+
+@st.cache_data(show_spinner=False)
+def _run(y, X, pmax, qmax, trend, ic, names):
+    start = time.perf_counter()
+    result = ardl(y, X, pmax, qmax, trend, ic, names)
+    return result, time.perf_counter() - start
+
+
+@st.cache_data(show_spinner="Simulating bounds critical values…")
+def _bounds(k, nobs, trend):
+    return bounds_critical_values(k, nobs, trend, LEVELS)
+
+
+def _decision(stat, lower, upper, tail):
+    if tail == "right":
+        stat, lower, upper = -stat, -lower, -upper
+    if stat < upper:
+        return "Reject H0: level relationship"
+    if stat > lower:
+        return "Do not reject H0"
+    return "Inconclusive"
+
+
+def bounds_table(f_stat, t_stat, k, nobs, trend):
+    """Draw the PSS bounds table for the F and t statistics."""
+    simulated = min(nobs, SIMULATION_NOBS)
+    bounds = _bounds(k, simulated, trend)
+    (f_lower, f_upper), (t_lower, t_upper) = bounds["F"], bounds["t"]
+    st.dataframe(pd.DataFrame(
+        {
+            "F I(0)": f_lower,
+            "F I(1)": f_upper,
+            "F decision": [_decision(f_stat, lo, hi, "right") for lo, hi in zip(f_lower, f_upper)],
+            "t I(0)": t_lower,
+            "t I(1)": t_upper,
+            "t decision": [_decision(t_stat, lo, hi, "left") for lo, hi in zip(t_lower, t_upper)],
+        },
+        index=pd.Index([f"{level:.1%}" for level in LEVELS], name="Level"),
+    ), width="stretch")
+    st.caption(
+        f"PSS (2001) case {CASES[trend]}, k = {k}; bounds simulated for T = {simulated} "
+        "(x's all I(0) for the lower bound, all I(1) for the upper)."
+    )
+
+
+def render(key):
+    static("#### 🧪 ARDL Bounds Testing Lab")
+    frame = dataset_input(key, default_sample="Cointegrated system")
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    if len(columns) < 2:
+        st.error("ARDL needs a dependent variable and at least one regressor.")
+        return
+
+    col1, col2 = st.columns([1, 2])
+    target = col1.selectbox("Dependent variable", columns, key=f"{key}-y")
+    others = [c for c in columns if c != target]
+    regressors = col2.multiselect("Regressors", others, default=others, key=f"{key}-x")
+    if not regressors:
+        st.info("Select at least one regressor.")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    pmax = col1.slider("Max lags of y (p)", 1, 8, 4, key=f"{key}-pmax")
+    qmax = col2.slider("Max lags of x (q)", 0, 8, 4, key=f"{key}-qmax")
+    trend = col3.radio("Deterministics", list(TRENDS), format_func=TRENDS.get, key=f"{key}-trend")
+    ic = col4.radio("Lag criterion", ["aic", "bic"], format_func=str.upper, key=f"{key}-ic")
+
+    k = len(regressors)
+    specifications = pmax * (qmax + 1) ** k
+    if specifications > MAX_SPECIFICATIONS:
+        st.warning(f"{specifications:,} specifications; reduce the lags or regressors (limit {MAX_SPECIFICATIONS:,}).")
+        return
+
+    try:
+        result, elapsed = _run(
+            frame[target].to_numpy(dtype=float), frame[regressors].to_numpy(dtype=float),
+            pmax, qmax, trend, ic, tuple(regressors),
+        )
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"ARDL estimation failed: {exc}")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Selected ARDL", f"ARDL{result.order}")
+    col2.metric("F statistic", f"{result.f_stat:.3f}")
+    col3.metric("t statistic", f"{result.t_stat:.3f}")
+    col4.metric("Speed of adjustment", f"{result.ect:.3f}")
+    st.caption(f"{specifications:,} specifications searched by {ic.upper()} in {elapsed * 1e3:.0f} ms.")
+
+    bounds_tab, long_tab, short_tab, grid_tab = st.tabs(
+        ["Bounds test", "Long-run coefficients", "Levels ARDL", "Top specifications"]
+    )
+    with bounds_tab:
+        bounds_table(result.f_stat, result.t_stat, k, result.nobs, trend)
+    long_tab.dataframe(pd.DataFrame(
+        {"Coefficient": result.long_run, "Std. error": result.long_run_se,
+         "t": result.long_run / result.long_run_se},
+        index=pd.Index(regressors, name="Regressor"),
+    ))
+    short_tab.dataframe(pd.DataFrame(
+        {"Coefficient": result.params, "Std. error": result.bse, "t": result.params / result.bse},
+        index=pd.Index(result.names, name="Term"),
+    ))
+    grid_tab.dataframe(pd.DataFrame(
+        {"Order": [f"ARDL{tuple(int(v) for v in row)}" for row in result.specifications[:20]],
+         ic.upper(): result.criterion[:20]},
+    ), hide_index=True)
@@ -0,0 +1,66 @@
+"""Bootstrap controls shared by the labs.
+
+Bootstraps are too slow to rerun on every widget change, so they start from a
+button and their draws are kept in ``st.session_state`` under the lab's key
+together with a token describing the inputs. A later rerun reuses the draws
+only while that token still matches.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.engines.bootstrap import bootstrap_pvalue, critical_values, run_bootstrap
+
+REPLICATIONS = [199, 499, 999, 1999, 4999, 9999]
+LEVELS = (0.01, 0.05, 0.10)
+
+
+def fingerprint(*arrays):
+    """Short content hash of the arrays a bootstrap was run on."""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def bootstrap_panel(key, token, make_replicator, label="Bootstrap critical values", batch_size=32):
+    """Draw B/seed controls and a run button; return the bootstrap draws.
+
+    ``make_replicator`` is only called when the button is pressed. Returns
+    ``None`` until draws matching ``token`` exist for this lab. Cheap
+    replicators can pass a larger ``batch_size`` to send fewer pool tasks.
+    """
+    col1, col2, col3 = st.columns([2, 1, 1], vertical_alignment="bottom")
+    B = col1.select_slider("Bootstrap replications B", REPLICATIONS, value=999, key=f"{key}-B")
+    seed = col2.number_input("Bootstrap seed", 0, 2 ** 31 - 1, 2024, key=f"{key}-bseed")
+    run = col3.button(label, key=f"{key}-brun")
+
+    token = (token, B, seed, batch_size)
+    state_key = f"{key}-bootstrap"
+    if run:
+        bar = st.progress(0.0, text="Starting bootstrap workers…")
+
+        def progress(done, total):
+            bar.progress(done / total, text=f"Bootstrap replications: {done:,} / {total:,}")
+
+        stats = run_bootstrap(make_replicator(), B, seed=seed, batch_size=batch_size, progress=progress)
+        bar.empty()
+        st.session_state[state_key] = (token, stats)
+
+    cached = st.session_state.get(state_key)
+    if cached is not None and cached[0] == token:
+        return cached[1]
+    return None
+
+
+def critical_value_table(stat, stats, tail="left"):
+    """Critical values at 1/5/10% and the bootstrap p-value as a DataFrame."""
+    values = critical_values(stats, LEVELS, tail)
+    frame = pd.DataFrame(
+        {"Critical value": values, "Reject H0": stat < values if tail == "left" else stat > values},
+        index=[f"{level:.0%}" for level in LEVELS],
+    )
+    frame.index.name = "Level"
+    return frame, bootstrap_pvalue(stat, stats, tail)
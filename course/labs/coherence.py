@@ -0,0 +1,167 @@
+"""Wavelet coherence lab: heat map with cone of influence and phase arrows."""
+import time
+
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.cwt import coherence
+from course.engines.cwt_significance import cached_significance, coherence_significance
+from course.engines.parallel import default_workers
+from course.fragments import static
+
+VOICES = {4: "4 per octave", 8: "8 per octave", 12: "12 per octave"}
+# Dates drawn across the heat map; longer samples are thinned to this many columns.
+HEAT_COLUMNS = 250
+# Phase arrows drawn per row of scales, and the coherence they need.
+ARROW_COLUMNS = 40
+ARROW_COHERENCE = 0.6
+SURROGATES = [200, 500, 1000, 2000]
+
+
+@st.cache_data(show_spinner=False)
+def _run(x, y, voices):
+    start = time.perf_counter()
+    result = coherence(x, y, dj=1.0 / voices)
+    return result, time.perf_counter() - start
+
+
+def heat_map(result, values, title, scheme="viridis", domain=None, phase=None, significant=None):
+    """Altair heat map of an ``(S, N)`` array over time and period, faded outside the COI.
+
+    ``phase`` adds arrows where ``values`` reach ``ARROW_COHERENCE``;
+    ``significant`` is an ``(S, N)`` mask whose outline is drawn as a
+    contour. Shared with the other wavelet labs.
+    """
+    n = result.nobs
+    columns = np.arange(0, n, max(1, n // HEAT_COLUMNS))
+    width = np.diff(np.r_[columns, n])
+    ratio = np.sqrt(result.periods[1] / result.periods[0]) if result.periods.shape[0] > 1 else 1.5
+    inside = result.inside()[:, columns]
+    t0, p = np.meshgrid(columns, result.periods)
+    frame = pd.DataFrame({
+        "t": t0.ravel(),
+        "t_end": (t0 + width[None, :]).ravel(),
+        "Period": p.ravel(),
+        "p_low": (p / ratio).ravel(),
+        "p_high": (p * ratio).ravel(),
+        title: values[:, columns].ravel(),
+        "Inside COI": inside.ravel(),
+    })
+    color = alt.Color(f"{title}:Q", scale=alt.Scale(scheme=scheme, **({"domain": domain} if domain else {})))
+    heat = alt.Chart(frame).mark_rect().encode(
+        x=alt.X("t:Q", title="t", scale=alt.Scale(domain=[0, n], nice=False)),
+        x2="t_end:Q",
+        y=alt.Y("p_low:Q", title="Period", scale=alt.Scale(type="log", reverse=True, nice=False)),
+        y2="p_high:Q",
+        color=color,
+        opacity=alt.condition("datum['Inside COI']", alt.value(1.0), alt.value(0.3)),
+        tooltip=["t:Q", alt.Tooltip("Period:Q", format=".1f"), alt.Tooltip(f"{title}:Q", format=".3f")],
+    )
+    coi = pd.DataFrame({"t": np.arange(n)[columns], "COI": np.clip(result.coi[columns], result.periods[0] / ratio,
+                                                                   result.periods[-1] * ratio)})
+    layers = [heat, alt.Chart(coi).mark_line(color="white", strokeDash=[4, 3]).encode(x="t:Q", y="COI:Q")]
+    if significant is not None:
+        mask = np.pad(significant[:, columns], 1)
+        edge = mask[1:-1, 1:-1] & ~(mask[:-2, 1:-1] & mask[2:, 1:-1] & mask[1:-1, :-2] & mask[1:-1, 2:])
+        rows, cols = np.nonzero(edge)
+        outline = pd.DataFrame({"t": columns[cols] + width[cols] / 2, "Period": result.periods[rows]})
+        layers.append(alt.Chart(outline).mark_square(size=8, color="black").encode(x="t:Q", y="Period:Q"))
+    if phase is not None:
+        rows = np.arange(0, result.periods.shape[0], max(1, result.periods.shape[0] // 12))
+        cols = np.arange(0, n, max(1, n // ARROW_COLUMNS))
+        r, c = np.meshgrid(rows, cols, indexing="ij")
+        keep = (values[r, c] >= ARROW_COHERENCE) & result.inside()[r, c]
+        points = pd.DataFrame({
+            "t": c[keep],
+            "Period": result.periods[r[keep]],
+            # Vega's arrow points up and turns clockwise: phase 0 points right and
+            # x leading by 90 degrees points down, as in Grinsted et al. (2004).
+            "angle": 90.0 + np.degrees(phase[r[keep], c[keep]]),
+        })
+        layers.append(alt.Chart(points).mark_point(shape="arrow", size=60, filled=True, color="black").encode(
+            x="t:Q", y="Period:Q", angle=alt.Angle("angle:Q", scale=None),
+        ))
+    return alt.layer(*layers).properties(height=360)
+
+
+def _significance(key, x, y, voices):
+    """Red-noise levels from the disk cache, or from a run the user starts."""
+    col1, col2, col3 = st.columns([2, 1, 1], vertical_alignment="bottom")
+    replications = col1.select_slider("Surrogate pairs", SURROGATES, value=1000, key=f"{key}-B")
+    seed = col2.number_input("Surrogate seed", 0, 2 ** 31 - 1, 0, key=f"{key}-sseed")
+    run = col3.button("Red-noise significance", key=f"{key}-srun")
+    cached = cached_significance(x, y, dj=1.0 / voices, replications=replications, seed=seed)
+    if cached is not None or not run:
+        return cached
+    bar = st.progress(0.0, text="Starting surrogate workers…")
+
+    def progress(done, total):
+        bar.progress(done / total, text=f"Surrogate batches: {done} / {total} on {default_workers()} workers")
+
+    significance = coherence_significance(x, y, dj=1.0 / voices, replications=replications, seed=seed,
+                                          progress=progress)
+    bar.empty()
+    return significance
+
+
+def render(key):
+    static("#### 🧪 Wavelet Coherence Lab")
+    frame = dataset_input(key, default_sample="Time-varying regression", default_n=2000)
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    if len(columns) < 2:
+        st.error("Wavelet coherence needs two series.")
+        return
+    col1, col2, col3 = st.columns(3)
+    first = col1.selectbox("Series x", columns, key=f"{key}-x")
+    second = col2.selectbox("Series y", [c for c in columns if c != first], key=f"{key}-y")
+    voices = col3.radio("Scale resolution", list(VOICES), index=1, format_func=VOICES.get, key=f"{key}-voices")
+
+    try:
+        with st.spinner("Computing both transforms and the smoothed spectra…"):
+            result, elapsed = _run(frame[first].to_numpy(dtype=float), frame[second].to_numpy(dtype=float), voices)
+    except ValueError as exc:
+        st.error(f"Wavelet coherence failed: {exc}")
+        return
+
+    inside = result.inside()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Scales × dates", f"{result.periods.shape[0]} × {result.nobs:,}")
+    col2.metric("Mean coherence inside COI", f"{result.coherence[inside].mean():.3f}")
+    col3.metric("Computed in", f"{elapsed:.2f} s")
+    st.caption(
+        "Both CWTs are one batched FFT multiply over every scale; the coherence smoother is another. "
+        "Faded cells lie outside the cone of influence, where edge effects dominate."
+    )
+
+    coh_tab, cross_tab, period_tab = st.tabs(["Coherence", "Cross-wavelet power", "Coherence by period"])
+    with coh_tab:
+        significance = _significance(key, frame[first].to_numpy(dtype=float), frame[second].to_numpy(dtype=float),
+                                     voices)
+        significant = significance.significant(result) if significance is not None else None
+        if significance is not None:
+            share = significant[inside].mean()
+            st.caption(
+                f"Black outlines: coherence above the 95% level of {significance.replications:,} AR(1) "
+                f"surrogate pairs (AR coefficients {significance.ar[0]:.2f} and {significance.ar[1]:.2f}); "
+                f"{share:.1%} of the cells inside the COI."
+                + (" Null distribution reused from the disk cache." if significance.reused else "")
+            )
+        chart = heat_map(result, result.coherence, "Coherence", domain=[0, 1], phase=result.phase,
+                         significant=significant)
+        st.altair_chart(chart, width="stretch")
+        st.caption(
+            f"Arrows where coherence ≥ {ARROW_COHERENCE}: → in phase, ← anti-phase, ↓ {first} leads "
+            f"{second} by 90°, ↑ {second} leads."
+        )
+    cross_tab.altair_chart(heat_map(result, np.log2(result.cross + 1e-12), "log2 power"), width="stretch")
+    with period_tab:
+        rows = inside.any(axis=1)
+        st.line_chart(pd.DataFrame(
+            {"Mean coherence inside COI": (result.coherence * inside)[rows].sum(axis=1) / inside[rows].sum(axis=1)},
+            index=pd.Index(np.round(result.periods[rows], 2), name="Period"),
+        ))
@@ -0,0 +1,82 @@
+"""Fourier ADF (Enders–Lee) lab."""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import series_input
+from course.engines import critical_values
+from course.engines.fourier_adf import FourierADFBootstrap, fourier_adf
+from course.fragments import static
+from course.labs.bootstrap import bootstrap_panel, critical_value_table, fingerprint
+
+TRENDS = {"c": "Constant", "ct": "Constant + trend"}
+
+
+@st.cache_data(show_spinner=False)
+def _run(values, kmax, pmax, trend, ic):
+    return fourier_adf(values, kmax=kmax, pmax=pmax, trend=trend, ic=ic)
+
+
+def render(key):
+    static("#### 🧪 Fourier ADF Lab")
+    series = series_input(key, default_sample="Smooth structural breaks")
+    if series is None:
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    kmax = col1.slider("Max frequency k", 1, 5, 5, key=f"{key}-kmax")
+    pmax = col2.slider("Max lags p", 0, 12, 8, key=f"{key}-pmax")
+    trend = col3.radio("Deterministics", list(TRENDS), format_func=TRENDS.get, key=f"{key}-trend")
+    ic = col4.radio("Lag criterion", ["aic", "bic"], format_func=str.upper, key=f"{key}-ic")
+
+    try:
+        result = _run(series.to_numpy(dtype=float), kmax, pmax, trend, ic)
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Fourier ADF failed: {exc}")
+        return
+
+    T = series.shape[0]
+    try:
+        cv = critical_values.critical_values("fourier_adf", trend, T, result.frequency)
+        pvalue = critical_values.pvalue(result.stat, "fourier_adf", trend, T, result.frequency)
+    except ValueError as exc:
+        cv = pvalue = None
+        st.error(f"No tabulated critical values: {exc}. Use the bootstrap instead.")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("τ statistic", f"{result.stat:.3f}")
+    col2.metric("p-value", "—" if pvalue is None else f"{pvalue:.3f}")
+    col3.metric("Frequency k*", result.frequency)
+    col4.metric("Lags p*", result.lags)
+    col5.metric("F (no Fourier terms)", f"{result.f_stat:.2f}")
+    if cv is not None:
+        st.caption(
+            f"Critical values for k = {result.frequency}, T = {T}: "
+            f"1% {cv[0]:.3f} · 5% {cv[1]:.3f} · 10% {cv[2]:.3f} (response-surface table)"
+        )
+
+    fit_tab, grid_tab, boot_tab = st.tabs(
+        ["Series and Fourier trend", "SSR by frequency and lag", "Bootstrap critical values"]
+    )
+    fit_tab.line_chart(pd.DataFrame(
+        {series.name: series.to_numpy(), "Fourier trend": result.fourier_trend},
+        index=series.index,
+    ))
+    with grid_tab:
+        st.dataframe(pd.DataFrame(
+            result.ssr,
+            index=pd.Index(np.arange(1, kmax + 1), name="k"),
+            columns=pd.Index(np.arange(pmax + 1), name="p"),
+        ))
+
+    with boot_tab:
+        values = series.to_numpy(dtype=float)
+        stats = bootstrap_panel(
+            key,
+            (fingerprint(values), result.frequency, result.lags, result.max_lags, trend),
+            lambda: FourierADFBootstrap(values, result.frequency, result.lags, trend, trim=result.max_lags),
+        )
+        if stats is not None:
+            table, pvalue = critical_value_table(result.stat, stats)
+            st.dataframe(table)
+            st.metric("Bootstrap p-value", f"{pvalue:.3f}")
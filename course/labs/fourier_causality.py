@@ -0,0 +1,93 @@
+"""Fourier Toda–Yamamoto causality lab."""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.bootstrap import bootstrap_pvalue, critical_values
+from course.engines.fourier_causality import BOOTSTRAP_BATCH, FourierCausalityBootstrap, fourier_causality
+from course.fragments import static
+from course.labs.bootstrap import LEVELS, bootstrap_panel, fingerprint
+
+
+@st.cache_data(show_spinner=False)
+def _run(y, x, kmax, pmax, dmax, ic, names):
+    start = time.perf_counter()
+    result = fourier_causality(y, x, kmax, pmax, dmax, ic, names)
+    return result, time.perf_counter() - start
+
+
+def _grid(result, values):
+    return pd.DataFrame(
+        values,
+        index=pd.Index(result.lags, name="Lags p"),
+        columns=[f"k = {k}" for k in result.frequencies],
+    )
+
+
+def render(key):
+    static("#### 🧪 Fourier Causality Lab")
+    frame = dataset_input(key, default_sample="Asymmetric pass-through", default_n=1000)
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    if len(columns) < 2:
+        st.error("The test needs two series.")
+        return
+
+    col1, col2 = st.columns(2)
+    target = col1.selectbox("Series y", columns, key=f"{key}-y")
+    cause = col2.selectbox("Series x", [c for c in columns if c != target], key=f"{key}-x")
+    col1, col2, col3, col4 = st.columns(4)
+    kmax = col1.slider("Max frequency k", 1, 5, 3, key=f"{key}-kmax")
+    pmax = col2.slider("Max lags p", 1, 8, 4, key=f"{key}-pmax")
+    dmax = col3.radio("Extra lags dmax", [0, 1, 2], index=1, horizontal=True, key=f"{key}-dmax")
+    ic = col4.radio("Criterion", ["aic", "bic"], format_func=str.upper, horizontal=True, key=f"{key}-ic")
+
+    y = frame[target].to_numpy(dtype=float)
+    x = frame[cause].to_numpy(dtype=float)
+    try:
+        result, elapsed = _run(y, x, kmax, pmax, dmax, ic, (target, cause))
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Fourier causality test failed: {exc}")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Frequency k*", result.frequency)
+    col2.metric("Lags p*", result.lag)
+    col3.metric(f"{cause} → {target} p-value", f"{result.pvalue_xy:.3f}")
+    col4.metric(f"{target} → {cause} p-value", f"{result.pvalue_yx:.3f}")
+    st.caption(
+        f"VAR({result.lag} + {dmax}) in levels with a Fourier pair; asymptotic χ²({result.lag}) p-values. "
+        f"All {kmax} frequencies of a lag order are one stacked QR; the grid took {elapsed * 1e3:.0f} ms."
+    )
+
+    boot_tab, grid_tab = st.tabs(["Bootstrap critical values", "Wald statistics by (k, p)"])
+    with boot_tab:
+        draws = bootstrap_panel(
+            key,
+            (fingerprint(y, x), result.frequency, result.lag, dmax, pmax),
+            lambda: FourierCausalityBootstrap(y, x, result.frequency, result.lag, dmax, pmax + dmax),
+            batch_size=BOOTSTRAP_BATCH,
+        )
+        if draws is not None:
+            rows = {}
+            for i, (label, stat) in enumerate([(f"{cause} → {target}", result.wald_xy),
+                                              (f"{target} → {cause}", result.wald_yx)]):
+                cv = critical_values(draws[:, i], LEVELS, tail="right")
+                rows[label] = {"Wald": stat, **{f"{level:.0%} cv": c for level, c in zip(LEVELS, cv)},
+                               "Bootstrap p-value": bootstrap_pvalue(stat, draws[:, i], tail="right")}
+            st.dataframe(pd.DataFrame(rows).T.rename_axis("Direction"), width="stretch")
+            st.caption(
+                "Fixed-design residual bootstrap under non-causality: the QR factors of the selected design "
+                "are reused, so each replication is two projections of resampled residuals."
+            )
+    with grid_tab:
+        st.dataframe(_grid(result, result.stat_xy).style.format("{:.2f}"), width="stretch")
+        st.caption(f"Wald statistic of {cause} → {target}.")
+        st.dataframe(_grid(result, result.stat_yx).style.format("{:.2f}"), width="stretch")
+        st.caption(f"Wald statistic of {target} → {cause}.")
+        st.dataframe(_grid(result, result.criterion).style.format("{:.1f}"), width="stretch")
+        st.caption(f"{ic.upper()} of the VAR; the minimum gives (k*, p*).")
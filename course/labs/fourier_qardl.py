@@ -0,0 +1,112 @@
+"""Fourier quantile ARDL lab: long-run coefficients across quantiles."""
+import time
+
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.fourier_qardl import FourierQARDLBootstrap, fourier_qardl
+from course.fragments import static
+from course.labs.bootstrap import bootstrap_panel, fingerprint
+
+GRIDS = {0.1: "0.1 … 0.9 (9 quantiles)", 0.05: "0.05 … 0.95 (19 quantiles)"}
+
+
+@st.cache_data(show_spinner=False)
+def _run(y, X, kmax, pmax, qmax, step, names):
+    taus = np.round(np.arange(step, 1.0 - step / 2, step), 10)
+    start = time.perf_counter()
+    result = fourier_qardl(y, X, kmax, pmax, qmax, taus, names)
+    return result, time.perf_counter() - start
+
+
+def _long_run_chart(result, j, bands):
+    frame = pd.DataFrame({"τ": result.taus, "β(τ)": result.long_run[:, j]})
+    line = alt.Chart(frame).mark_line(point=True).encode(
+        x=alt.X("τ:Q", scale=alt.Scale(domain=[0, 1])),
+        y=alt.Y("β(τ):Q", title=f"Long-run coefficient of {result.regressors[j]}", scale=alt.Scale(zero=False)),
+    )
+    if bands is None:
+        return line
+    frame["lower"], frame["upper"] = bands[0][:, j], bands[1][:, j]
+    band = alt.Chart(frame).mark_area(opacity=0.25).encode(x="τ:Q", y="lower:Q", y2="upper:Q")
+    return band + line
+
+
+def render(key):
+    static("#### 🧪 Fourier-Quantile-ARDL Lab")
+    frame = dataset_input(key, default_sample="Cointegrated system", default_n=2000)
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    if len(columns) < 2:
+        st.error("The model needs a dependent variable and at least one regressor.")
+        return
+
+    col1, col2 = st.columns([1, 2])
+    target = col1.selectbox("Dependent variable", columns, key=f"{key}-y")
+    others = [c for c in columns if c != target]
+    regressors = col2.multiselect("Regressors", others, default=others, key=f"{key}-x")
+    if not regressors:
+        st.info("Select at least one regressor.")
+        return
+    col1, col2, col3, col4 = st.columns(4)
+    kmax = col1.slider("Max frequency k", 1, 5, 3, key=f"{key}-kmax")
+    pmax = col2.slider("Max lags of y (p)", 1, 4, 2, key=f"{key}-pmax")
+    qmax = col3.slider("Max lags of x (q)", 0, 4, 2, key=f"{key}-qmax")
+    step = col4.selectbox("Quantile grid", list(GRIDS), index=1, format_func=GRIDS.get, key=f"{key}-grid")
+
+    y = frame[target].to_numpy(dtype=float)
+    X = frame[regressors].to_numpy(dtype=float)
+    try:
+        with st.spinner("Sweeping frequencies, lag orders and quantiles…"):
+            result, elapsed = _run(y, X, kmax, pmax, qmax, step, tuple(regressors))
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Fourier QARDL failed: {exc}")
+        return
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Frequency k*", result.frequency)
+    col2.metric("QARDL(p, q)", f"({result.order[0]}, {result.order[1]})")
+    col3.metric("Quantile fits", f"{result.fits:,}")
+    col4.metric("Sweep time", f"{elapsed:.2f} s")
+    st.caption(
+        "The lagged ARDL design is built once; each (k, p, q) is a column subset with its Fourier pair appended, "
+        "and each quantile fit is warm-started from its neighbour on the τ grid. (k, p, q) minimise the "
+        "Schwarz criterion of the median fit."
+    )
+
+    long_tab, sweep_tab, coef_tab = st.tabs(["Long-run coefficients", "Sensitivity to (k, p, q)", "Estimates"])
+    with long_tab:
+        draws = bootstrap_panel(
+            key,
+            (fingerprint(y, X), result.frequency, result.order, tuple(result.taus), pmax, qmax),
+            lambda: FourierQARDLBootstrap(y, X, result, pmax, qmax),
+            label="Bootstrap bands",
+        )
+        bands = None if draws is None else np.quantile(draws, [0.05, 0.95], axis=0)
+        name = st.selectbox("Regressor", regressors, key=f"{key}-coef") if len(regressors) > 1 else regressors[0]
+        j = regressors.index(name)
+        st.altair_chart(_long_run_chart(result, j, bands), width="stretch")
+        if bands is not None:
+            st.caption("Shaded: 90% pairs-bootstrap band; each replication refits every quantile warm-started.")
+        st.line_chart(pd.DataFrame({"Error-correction speed": result.speed}, index=pd.Index(result.taus, name="τ")))
+    with sweep_tab:
+        name = st.selectbox("Regressor", regressors, key=f"{key}-sweep") if len(regressors) > 1 else regressors[0]
+        j = regressors.index(name)
+        median = int(np.argmin(np.abs(result.taus - 0.5)))
+        labels = [f"({p}, {q})" for p, q in result.orders]
+        st.dataframe(pd.DataFrame(
+            result.sweep[:, :, median, j].T, index=pd.Index(labels, name="(p, q)"),
+            columns=[f"k = {k}" for k in result.frequencies],
+        ).style.format("{:.3f}"), width="stretch")
+        st.caption(f"Long-run coefficient of {name} at τ = {result.taus[median]:.2f} for every specification.")
+        st.dataframe(pd.DataFrame(
+            result.sic.T, index=pd.Index(labels, name="(p, q)"), columns=[f"k = {k}" for k in result.frequencies],
+        ).style.format("{:.4f}"), width="stretch")
+        st.caption("Schwarz criterion of the median fit; the minimum is selected.")
+    coef_tab.dataframe(pd.DataFrame(
+        result.params, index=pd.Index(result.taus, name="τ"), columns=result.names,
+    ), width="stretch")
@@ -0,0 +1,102 @@
+"""Multivariate GARCH lab: BEKK, CCC and DCC side by side."""
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.dcc import dcc
+from course.engines.mgarch import bekk, ccc, from_dcc
+from course.fragments import static
+from course.labs.garch import CHART_POINTS
+
+KINDS = {"diagonal": "Diagonal BEKK", "full": "Full BEKK"}
+# Full BEKK has 2 N^2 parameters; beyond this it is left out of the lab.
+FULL_ASSETS = 4
+# Fitted systems whose covariance maps stay open across reruns and sessions.
+MAX_CACHED_FITS = 8
+
+
+def _timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+# cache_data would pickle the memory-mapped H_t paths into RAM on every rerun;
+# cache_resource hands every session the same read-only maps. Evicted entries
+# close their maps; the files themselves are pruned by course.engines.storage.
+@st.cache_resource(show_spinner=False, max_entries=MAX_CACHED_FITS)
+def _run(returns, names, kinds):
+    fits = {}
+    for kind in kinds:
+        fits[KINDS[kind]] = _timed(bekk, returns, names, kind)
+    fits["CCC"] = _timed(ccc, returns, names)
+    result, elapsed = _timed(dcc, returns, names)
+    stored, extra = _timed(from_dcc, result)
+    fits["DCC"] = stored, elapsed + extra
+    return fits
+
+
+def render(key):
+    static("#### 🧪 Multivariate GARCH Lab")
+    frame = dataset_input(key, default_sample="Asset returns")
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    assets = st.multiselect("Assets", columns, default=columns, key=f"{key}-assets")
+    if len(assets) < 2:
+        st.info("Select at least two assets.")
+        return
+    kinds = ["diagonal", "full"] if len(assets) <= FULL_ASSETS else ["diagonal"]
+    if len(assets) > FULL_ASSETS:
+        st.caption(f"Full BEKK is skipped above {FULL_ASSETS} assets ({2 * len(assets) ** 2} parameters).")
+
+    try:
+        with st.spinner("Fitting BEKK, CCC and DCC…"):
+            fits = _run(frame[assets].to_numpy(dtype=float), tuple(assets), tuple(kinds))
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Multivariate GARCH estimation failed: {exc}")
+        return
+
+    table = pd.DataFrame(
+        [{
+            "Parameters": result.nparams,
+            "Log-likelihood": result.loglik,
+            "AIC": result.aic,
+            "BIC": result.bic,
+            "Fit time (s)": elapsed,
+            "H_t file (KB)": os.path.getsize(result.path) / 2 ** 10,
+            "Converged": result.converged,
+        } for result, elapsed in fits.values()],
+        index=pd.Index(list(fits), name="Model"),
+    )
+    st.dataframe(table.style.format({
+        "Log-likelihood": "{:,.1f}", "AIC": "{:,.1f}", "BIC": "{:,.1f}",
+        "Fit time (s)": "{:.2f}", "H_t file (KB)": "{:,.0f}",
+    }).highlight_min(subset=["AIC", "BIC"], color="#d4edda"), width="stretch")
+    st.caption(
+        "Log-likelihoods are all Gaussian and for the full system, so they are comparable. Each fit "
+        "streams its T x N x N covariance path to a .npy file in blocks and reads it back memory-mapped."
+    )
+
+    corr_tab, param_tab = st.tabs(["Pairwise correlation", "BEKK matrices"])
+    with corr_tab:
+        col1, col2 = st.columns(2)
+        first = col1.selectbox("Asset", assets, key=f"{key}-first")
+        second = col2.selectbox("With", [c for c in assets if c != first], key=f"{key}-second")
+        i, j = assets.index(first), assets.index(second)
+        nobs = next(iter(fits.values()))[0].nobs
+        step = max(1, nobs // CHART_POINTS)
+        st.line_chart(pd.DataFrame(
+            {name: result.correlation_path(i, j)[::step] for name, (result, _) in fits.items()},
+            index=pd.Index(np.arange(nobs)[::step], name="t"),
+        ))
+    with param_tab:
+        name = st.radio("Model", [KINDS[kind] for kind in kinds], horizontal=True, key=f"{key}-bekk")
+        params = fits[name][0].params
+        for label in ("A", "B", "C"):
+            st.markdown(f"**{label}**")
+            st.dataframe(pd.DataFrame(params[label], index=assets, columns=assets).style.format("{:.4f}"))
@@ -0,0 +1,87 @@
+"""Quantile regression profile lab."""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.design import lag_matrix
+from course.engines.quantile import quantile_profile
+from course.fragments import static
+
+GRIDS = {0.1: "0.1 … 0.9 (9 quantiles)", 0.05: "0.05 … 0.95 (19 quantiles)", 0.025: "0.025 … 0.975 (39 quantiles)"}
+
+
+def design(frame, target, regressors, lags):
+    """Target, regressors and names for a quantile (auto)regression.
+
+    ``lags > 0`` adds ``y_{t-1..t-lags}`` (Koenker–Xiao quantile
+    autoregression) and drops the first ``lags`` rows.
+    """
+    y = frame[target].to_numpy(dtype=float)
+    X = np.column_stack([np.ones(y.shape[0]), frame[regressors].to_numpy(dtype=float)])
+    names = ["const"] + list(regressors)
+    if lags:
+        X = np.column_stack([X[lags:], lag_matrix(y, lags)])
+        names += [f"{target}(t-{i})" for i in range(1, lags + 1)]
+        y = y[lags:]
+    return y, X, names
+
+
+@st.cache_data(show_spinner=False)
+def _run(y, X, step):
+    taus = np.round(np.arange(step, 1.0 - step / 2, step), 10)
+    start = time.perf_counter()
+    profile = quantile_profile(y, X, taus)
+    ols = np.linalg.lstsq(X, y, rcond=None)[0]
+    return profile, ols, time.perf_counter() - start
+
+
+def render(key):
+    static("#### 🧪 Quantile Regression Lab")
+    frame = dataset_input(key, default_sample="Heteroskedastic regression")
+    if frame is None:
+        return
+    columns = list(frame.columns)
+
+    col1, col2 = st.columns([1, 2])
+    target = col1.selectbox("Dependent variable", columns, key=f"{key}-y")
+    others = [c for c in columns if c != target]
+    regressors = col2.multiselect("Regressors", others, default=others, key=f"{key}-x")
+    col1, col2 = st.columns(2)
+    lags = col1.slider("Lags of the dependent variable (QAR order)", 0, 4, 0, key=f"{key}-lags")
+    step = col2.selectbox("Quantile grid", list(GRIDS), index=1, format_func=GRIDS.get, key=f"{key}-grid")
+
+    y, X, names = design(frame, target, regressors, lags)
+    try:
+        profile, ols, elapsed = _run(y, X, step)
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Quantile regression failed: {exc}")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Quantiles", profile.taus.shape[0])
+    col2.metric("Observations", f"{profile.nobs:,}")
+    col3.metric("Whole grid solved in", f"{elapsed * 1e3:.0f} ms")
+    st.caption(
+        f"Each quantile is warm-started from its neighbour: the interior-point solver only sees "
+        f"about {int(np.median(profile.reduced)):,} of {profile.nobs:,} observations per quantile."
+    )
+
+    profile_tab, table_tab = st.tabs(["Coefficient profile", "Estimates"])
+    with profile_tab:
+        name = st.selectbox("Coefficient", names, index=min(1, len(names) - 1), key=f"{key}-coef")
+        j = names.index(name)
+        st.line_chart(pd.DataFrame(
+            {
+                f"{name}(τ)": profile.params[:, j],
+                "95% lower": profile.params[:, j] - 1.96 * profile.bse[:, j],
+                "95% upper": profile.params[:, j] + 1.96 * profile.bse[:, j],
+                "OLS": ols[j],
+            },
+            index=pd.Index(profile.taus, name="τ"),
+        ))
+    table_tab.dataframe(pd.DataFrame(
+        profile.params, index=pd.Index(profile.taus, name="τ"), columns=names,
+    ), width="stretch")
@@ -0,0 +1,77 @@
+"""Rolling and recursive regression lab."""
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.rolling import rolling_ols
+from course.fragments import static
+
+MODES = {"rolling": "Rolling window", "recursive": "Recursive (expanding)"}
+
+
+@st.cache_data(show_spinner=False)
+def _run(y, X, window, min_nobs):
+    start = time.perf_counter()
+    result = rolling_ols(y, X, window, min_nobs)
+    return result, time.perf_counter() - start
+
+
+def render(key):
+    static("#### 🧪 Rolling / Recursive Regression Lab")
+    frame = dataset_input(key, default_sample="Time-varying regression")
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    if len(columns) < 2:
+        st.error("The regression needs at least two numeric columns.")
+        return
+
+    col1, col2 = st.columns([1, 2])
+    target = col1.selectbox("Dependent variable", columns, key=f"{key}-y")
+    others = [c for c in columns if c != target]
+    regressors = col2.multiselect("Regressors", others, default=others, key=f"{key}-x")
+
+    n = frame.shape[0]
+    col1, col2, col3 = st.columns(3)
+    mode = col1.radio("Windows", list(MODES), format_func=MODES.get, key=f"{key}-mode")
+    constant = col2.checkbox("Include constant", True, key=f"{key}-const")
+    k = len(regressors) + constant
+    if k == 0:
+        st.info("Select at least one regressor or the constant.")
+        return
+    window = col3.slider(
+        "Window length" if mode == "rolling" else "Initial window",
+        k + 2, max(k + 3, n // 2), min(max(k + 2, n // 5), max(k + 3, n // 2)), key=f"{key}-window",
+    )
+
+    X = frame[regressors].to_numpy(dtype=float)
+    names = list(regressors)
+    if constant:
+        X = np.column_stack([np.ones(n), X])
+        names = ["const"] + names
+    y = frame[target].to_numpy(dtype=float)
+    try:
+        result, elapsed = _run(y, X, window, None) if mode == "rolling" else _run(y, X, None, window)
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Rolling regression failed: {exc}")
+        return
+
+    index = frame.index[result.ends]
+    name = st.selectbox("Coefficient", names, index=min(1, len(names) - 1), key=f"{key}-coef")
+    j = names.index(name)
+    st.line_chart(pd.DataFrame(
+        {
+            name: result.params[:, j],
+            "+2 s.e.": result.params[:, j] + 2.0 * result.bse[:, j],
+            "−2 s.e.": result.params[:, j] - 2.0 * result.bse[:, j],
+        },
+        index=index,
+    ))
+    st.line_chart(pd.DataFrame({"R²": result.rsquared}, index=index), height=180)
+    st.caption(
+        f"{result.ends.shape[0]:,} windows estimated in {elapsed * 1e3:.1f} ms by updating X'X and X'y "
+        "as each observation enters (and leaves) the window."
+    )
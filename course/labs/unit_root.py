@@ -0,0 +1,77 @@
+"""Classical unit root and stationarity test battery."""
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import series_input
+from course.engines import critical_values, unit_root
+from course.fragments import static
+
+TRENDS = {"c": "Constant", "ct": "Constant + trend"}
+LEVELS = (0.01, 0.05, 0.10)
+
+
+def _format_pvalue(p):
+    if p <= critical_values.PROBABILITIES[0]:
+        return "< 0.001"
+    if p >= critical_values.PROBABILITIES[-1]:
+        return "> 0.999"
+    return f"{p:.3f}"
+
+
+@st.cache_data(show_spinner=False)
+def _run(values, trend, pmax, ic):
+    T = values.shape[0]
+    lags = int(unit_root.select_lags(values, trend, pmax, ic))
+    tau, alpha = unit_root.adf(values, trend, lags)
+    z_t, z_alpha = unit_root.phillips_perron(values, trend)
+    ng = unit_root.ng_perron(values, trend, lags)
+    za_model = "ct" if trend == "ct" else "c"
+    za, za_break = unit_root.zivot_andrews(values, za_model, lags, step=unit_root.za_step(T))
+
+    tests = [
+        ("ADF τ", "Unit root", tau, "adf", trend),
+        ("PP Zt", "Unit root", z_t, "adf", trend),
+        ("PP Zα", "Unit root", z_alpha, "adf_alpha", trend),
+        ("KPSS η", "Stationary", unit_root.kpss(values, trend), "kpss", trend),
+        ("DF-GLS τ", "Unit root", unit_root.dfgls(values, trend, lags), "dfgls", trend),
+        *((f"Ng-Perron {name}", "Unit root", ng[name], name, trend) for name in ("MZa", "MZt", "MSB", "MPT")),
+        ("Zivot-Andrews", "Unit root (one break)", za, "za", za_model),
+    ]
+    rows = []
+    for name, null, stat, table, spec in tests:
+        cv = critical_values.critical_values(table, spec, T, levels=LEVELS)
+        p = critical_values.pvalue(stat, table, spec, T)
+        rows.append({
+            "Test": name,
+            "H0": null,
+            "Statistic": float(stat),
+            **{f"{level:.0%}": value for level, value in zip(LEVELS, cv)},
+            "p-value": _format_pvalue(p),
+            "Reject at 5%": bool(p < 0.05),
+        })
+    return pd.DataFrame(rows).set_index("Test"), lags, int(za_break)
+
+
+def render(key):
+    static("#### 🧪 Classical Unit Root Lab")
+    series = series_input(key, default_sample="Smooth structural breaks")
+    if series is None:
+        return
+
+    col1, col2, col3 = st.columns(3)
+    trend = col1.radio("Deterministics", list(TRENDS), format_func=TRENDS.get, key=f"{key}-trend")
+    pmax = col2.slider("Max lags", 0, 12, 8, key=f"{key}-pmax")
+    ic = col3.radio("Lag criterion", ["aic", "bic"], format_func=str.upper, key=f"{key}-ic")
+
+    try:
+        table, lags, za_break = _run(series.to_numpy(dtype=float), trend, pmax, ic)
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Unit root tests failed: {exc}")
+        return
+
+    st.dataframe(table, width="stretch")
+    st.caption(
+        f"Lag order {lags} ({ic.upper()}); Zivot-Andrews break at {series.index[za_break]}. "
+        "Critical values and p-values come from precomputed response surfaces, not simulation."
+    )
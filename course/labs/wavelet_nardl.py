@@ -0,0 +1,128 @@
+"""Wavelet-NARDL-GARCH lab: asymmetries and volatility at each time scale."""
+import time
+
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from course.data import dataset_input
+from course.engines.modwt import max_level
+from course.engines.parallel import default_workers
+from course.engines.wavelet_nardl import wavelet_nardl
+from course.fragments import static
+from course.labs.garch import LABELS
+
+# Deepest level offered in the lab.
+MAX_LEVEL = 6
+# Variance models offered per scale; FIGARCH needs more data than most components have.
+MODELS = ("garch", "gjr", "egarch")
+
+
+@st.cache_data(show_spinner=False)
+def _run(y, X, level, pmax, qmax, model, names):
+    start = time.perf_counter()
+    result = wavelet_nardl(y, X, level, pmax=pmax, qmax=qmax, model=model, names=names)
+    return result, time.perf_counter() - start
+
+
+def summary(result):
+    """Scale × asymmetry table: long-run effects, symmetry tests and volatility per scale."""
+    rows = []
+    for fit in result.fits:
+        row = {"Scale": fit.label}
+        if fit.error is not None:
+            rows.append({**row, "Note": fit.error})
+            continue
+        for j, name in enumerate(result.regressors):
+            row[f"{name} L⁺"] = fit.long_run[j, 0]
+            row[f"{name} L⁻"] = fit.long_run[j, 1]
+            row[f"{name} p(L⁺ = L⁻)"] = fit.long_run_test[j][1]
+            row[f"{name} p(short-run symmetry)"] = fit.short_run_test[j][1]
+        row["NARDL order"] = str(fit.order)
+        row["Bounds F"] = fit.f_stat
+        row["ECT"] = fit.ect
+        if "gamma" in fit.garch_names:
+            row["GARCH γ (leverage)"] = fit.garch_params[fit.garch_names.index("gamma")]
+        row["GARCH persistence"] = fit.persistence
+        row["Converged"] = fit.converged
+        rows.append(row)
+    return pd.DataFrame(rows).set_index("Scale")
+
+
+def _asymmetry_chart(table, name, order):
+    frame = table[[f"{name} L⁺", f"{name} L⁻"]].reset_index().melt(
+        id_vars="Scale", var_name="Effect", value_name="Long-run coefficient",
+    )
+    return alt.Chart(frame).mark_bar().encode(
+        x=alt.X("Scale:N", sort=order),
+        xOffset="Effect:N",
+        y="Long-run coefficient:Q",
+        color="Effect:N",
+        tooltip=["Scale:N", "Effect:N", alt.Tooltip("Long-run coefficient:Q", format=".3f")],
+    ).properties(height=320)
+
+
+def render(key):
+    static("#### 🧪 Wavelet-NARDL-GARCH Lab")
+    frame = dataset_input(key, default_sample="Asymmetric pass-through", default_n=2000)
+    if frame is None:
+        return
+    columns = list(frame.columns)
+    if len(columns) < 2:
+        st.error("The pipeline needs a dependent variable and at least one regressor.")
+        return
+
+    col1, col2 = st.columns([1, 2])
+    target = col1.selectbox("Dependent variable", columns, key=f"{key}-y")
+    others = [c for c in columns if c != target]
+    regressors = col2.multiselect("Asymmetric regressors", others, default=others[:1], key=f"{key}-x")
+    if not regressors:
+        st.info("Select at least one regressor to decompose.")
+        return
+    deepest = min(MAX_LEVEL, max_level(len(frame), "la8"))
+    if deepest < 1:
+        st.error("The series are too short for an LA(8) decomposition.")
+        return
+    col1, col2, col3, col4 = st.columns(4)
+    level = col1.slider("Levels J", 1, deepest, min(4, deepest), key=f"{key}-level")
+    pmax = col2.slider("Max lags of y (p)", 1, 4, 2, key=f"{key}-pmax")
+    qmax = col3.slider("Max lags of x± (q)", 0, 4, 2, key=f"{key}-qmax")
+    model = col4.selectbox("Variance model", MODELS, index=1, format_func=LABELS.get, key=f"{key}-model")
+    if pmax * (qmax + 1) ** (2 * len(regressors)) > 500_000:
+        st.warning("Too many lag combinations; reduce the lags or regressors.")
+        return
+
+    y = frame[target].to_numpy(dtype=float)
+    X = frame[regressors].to_numpy(dtype=float)
+    try:
+        with st.spinner("Decomposing the series and fitting every scale…"):
+            result, elapsed = _run(y, X, level, pmax, qmax, model, tuple(regressors))
+    except (ValueError, np.linalg.LinAlgError) as exc:
+        st.error(f"Wavelet-NARDL failed: {exc}")
+        return
+
+    table = summary(result)
+    fitted = [fit for fit in result.fits if fit.error is None]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Scales fitted", f"{len(fitted)} / {len(result.fits)}")
+    col2.metric(
+        "Long-run asymmetry at 5%",
+        f"{sum(fit.long_run_test[0][1] < 0.05 for fit in fitted)} / {len(fitted)}",
+        help=f"Scales where L⁺ ≠ L⁻ for {regressors[0]}.",
+    )
+    col3.metric("Pool workers", default_workers())
+    col4.metric("Computed in", f"{elapsed:.2f} s")
+    st.caption(
+        "All series go through one stacked MODWT; the components sit in one shared-memory block, and each "
+        "scale's NARDL + GARCH is an independent pool task that copies out only its own scale. "
+        "Short samples are fitted in-process. 'Denoised' drops D1 from every series."
+    )
+
+    table_tab, chart_tab = st.tabs(["Scale × asymmetry summary", "Long-run effects by scale"])
+    table_tab.dataframe(table, width="stretch")
+    with chart_tab:
+        name = st.selectbox("Regressor", regressors, key=f"{key}-coef") if len(regressors) > 1 else regressors[0]
+        if fitted:
+            st.altair_chart(_asymmetry_chart(table.dropna(subset=[f"{name} L⁺"]), name, result.labels),
+                            width="stretch")
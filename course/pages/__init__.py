@@ -0,0 +1,4 @@
+"""Course pages, one module per sidebar entry.
+
+Each module exposes ``render()``; see ``course.registry`` for the mapping.
+"""
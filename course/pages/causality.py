@@ -0,0 +1,164 @@
+"""Causality & VECM page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import fourier_causality, fourier_vecm, quantile_causality, wavelet_causality
+
+
+def render():
+    static('<p class="section-header">⚡ Causality Analysis & Vector Error Correction</p>', """
+    <div class="info-box">
+        <strong>Module Overview:</strong> Master causal inference in time series from classical Granger causality 
+        to advanced time-varying, frequency-domain, and quantile-specific approaches.
+    </div>
+    """)
+
+    # Fourier VECM
+    with st.expander("🌊 Fourier Vector Error Correction Models", expanded=True):
+        static("""
+        ### Long-Run and Short-Run Dynamics with Breaks
+
+        **Fourier VECM Framework:**
+        - Error correction equations with Fourier structural breaks
+        - Captures time-varying equilibrium relationships
+        - Distinguishes long-run and short-run dynamics
+
+        **Model Components:**
+        - **Error Correction Term**: Speed of adjustment to equilibrium
+        - **Fourier Deterministic Components**: Smooth structural changes
+        - **Short-run Dynamics**: Lagged difference terms
+
+        **Applications:**
+        - Monetary policy transmission with regime changes
+        - Energy-growth nexus with technological shifts
+        - International trade relationships with gradual liberalization
+        """, """
+        <div class="highlight-box">
+        💡 <strong>Innovation:</strong> Traditional VECM assumes stable equilibrium. Fourier VECM 
+        allows equilibrium to evolve smoothly over time!
+        </div>
+        """)
+        fourier_vecm.render("causality-vecm")
+
+    # Fourier Causality
+    with st.expander("🔄 Fourier Causality Testing", expanded=True):
+        static("""
+        ### Structural Break-Robust Causality
+
+        **Fourier Toda-Yamamoto Causality:**
+        - Extends Toda-Yamamoto to structural breaks
+        - Level VAR with Fourier approximation
+        - No need for cointegration pre-testing
+
+        **Nazlioglu et al. Fourier Granger Causality:**
+        - Bootstrap critical values for size correction
+        - Optimal frequency selection
+        - Gradual shifts in causal relationships
+
+        **Key Advantages:**
+        - Avoids spurious non-causality from breaks
+        - Detects changing causal patterns
+        - More powerful than traditional tests
+
+        **Practical Applications:**
+        - Energy consumption → Economic growth (with policy changes)
+        - Financial contagion across markets
+        - Environmental policy effectiveness
+        """)
+        fourier_causality.render("causality-fourier")
+
+    # Quantile Causality
+    with st.expander("📊 Granger Causality in Quantiles 🆕", expanded=True):
+        static("""
+        ### Distribution-Specific Causal Analysis
+
+        **Troster (2018) Quantile Causality Test:**
+        - Tests causality at different quantiles
+        - Non-parametric framework
+        - Robust to distributional assumptions
+
+        **Hybrid Non-Parametric Quantile Causality:**
+        - Combines quantile and non-parametric methods
+        - Captures tail dependencies
+        - Identifies causality at extreme quantiles
+
+        **Why Quantile Causality Matters:**
+        - **Tail Dependencies**: Different causality in extremes vs. median
+        - **Asymmetric Effects**: Positive vs. negative shock responses
+        - **Risk Management**: Causal relationships during crises
+        - **Policy Analysis**: Effects vary across economic states
+
+        **Example Applications:**
+        """)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            static("""
+            **Financial Markets:**
+            - Crisis contagion (lower quantiles)
+            - Bull market linkages (upper quantiles)
+            - Volatility spillovers
+            """)
+        with col2:
+            static("""
+            **Macroeconomics:**
+            - Recession vs. expansion dynamics
+            - Inflation asymmetries
+            - Labor market responses
+            """)
+        quantile_causality.render("causality-quantile")
+
+    # Wavelet Causality
+    with st.expander("🌊 Wavelet-Based Causality", expanded=True):
+        static("""
+        ### Time-Frequency Domain Causality
+
+        **CWT Causality:**
+        - Continuous Wavelet Transform approach
+        - No spectral factorization required
+        - Scale-specific causal relationships
+
+        **Wavelet Granger Causality (Olayeni):**
+        - Decomposes series into time-scale components
+        - Tests causality at each scale
+        - Reveals multi-horizon causal patterns
+
+        **Time-Varying Frequency Domain Causality:**
+        - Causality evolves over time AND frequency
+        - Captures changing lead-lag relationships
+        - Identifies structural changes in causality
+
+        **Unique Insights:**
+        - Short-run vs. long-run causality
+        - Time-varying causal strength
+        - Frequency-specific channels
+        - Crisis vs. normal period patterns
+        """)
+
+        st.info("🎯 **Power**: Wavelet methods reveal when and at what frequencies causality operates")
+        wavelet_causality.render("causality-wavelet")
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        static("""
+        **R Packages:**
+        - `vars`: VAR/VECM
+        - `biwavelet`: Wavelet
+        - Custom causality functions
+        """)
+    with col2:
+        static("""
+        **MATLAB:**
+        - Wavelet toolbox
+        - Custom VECM codes
+        - Causality functions
+        """)
+    with col3:
+        static("""
+        **Applications:**
+        - Policy analysis
+        - Market linkages
+        - Risk transmission
+        """)
@@ -0,0 +1,132 @@
+"""Cointegration Methods page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import ardl
+
+
+def render():
+    static('<p class="section-header">🔗 Cointegration Analysis</p>', """
+    <div class="info-box">
+        <strong>Module Overview:</strong> Explore long-run equilibrium relationships from classical two-step procedures 
+        to modern ARDL bounds testing and quantile cointegration.
+    </div>
+    """)
+
+    # Classical Cointegration
+    with st.expander("📚 Classical Cointegration Methods", expanded=True):
+        static("### Foundational Techniques", """
+        **Engle-Granger Two-Step Procedure:**
+        - Step 1: Estimate long-run cointegrating equation
+        - Step 2: Test residuals for stationarity
+        - Simple but limited to single cointegrating vector
+
+        **Johansen Maximum Likelihood:**
+        - Tests for multiple cointegrating relationships
+        - Trace and Maximum Eigenvalue tests
+        - Provides both cointegrating vectors and adjustment speeds
+
+        **Phillips-Ouliaris Tests:**
+        - Non-parametric residual-based tests
+        - Alternative to Engle-Granger
+        - Robust to certain violations
+        """)
+
+    # ARDL
+    with st.expander("🚀 ARDL Bounds Testing", expanded=True):
+        static("### Modern Flexible Framework", """
+        **Pesaran-Shin-Smith (2001) Bounds Test:**
+        - **Revolutionary Feature**: Works with mixed I(0)/I(1) variables
+        - No pre-testing for unit roots required
+        - Suitable for small samples
+
+        **Key Components:**
+        - Critical values with upper and lower bounds
+        - Decision rules based on F-statistic
+        - Error correction representation
+        - Long-run and short-run dynamics
+
+        **Advantages:**
+        - Flexible lag structure
+        - Handles different orders of integration
+        - Robust in small samples
+        - Simultaneous estimation of long and short-run parameters
+        """)
+
+        st.success("✅ **Best Practice**: ARDL is now preferred for most cointegration analysis")
+
+        ardl.render("cointegration-ardl")
+
+    # Fourier Cointegration
+    with st.expander("🌊 Fourier-Based Cointegration Tests 🔥", expanded=True):
+        static("### Structural Break Cointegration", """
+        **Advanced Fourier Methods:**
+
+        **1. Fourier ADL Cointegration (Banerjee et al.):**
+        - Autoregressive Distributed Lag with Fourier terms
+        - Captures smooth structural changes in long-run relationship
+
+        **2. Johansen-Type with Fourier:**
+        - Multiple cointegrating vectors with structural breaks
+        - Fourier approximation of deterministic components
+
+        **3. Fourier Engle-Granger (FEG):**
+        - Two-step procedure with Fourier adjustment
+        - Improved power in presence of breaks
+
+        **4. Tsong et al. Fourier Approximation:**
+        - Flexible approach for testing cointegration null
+        - Multiple frequency components
+
+        **Fourier ARDL Bounds Test:**
+        - Bootstrap critical values with Fourier function
+        - Machine learning integration (Wu et al.)
+        - Superior to traditional dummy variables
+        - Handles smooth structural changes
+        """, """
+        <div class="highlight-box">
+        🎯 <strong>Application Power:</strong> Fourier methods excel when structural breaks are 
+        gradual, unknown, or multiple - common in economic data!
+        </div>
+        """)
+
+    # Quantile Cointegration
+    with st.expander("📊 Quantile Cointegration 🆕"):
+        static("### Distribution-Specific Long-Run Relationships", """
+        **Quantile Cointegration Methods:**
+
+        **Xiao (2009) Quantile Cointegration:**
+        - Tests cointegration at different quantiles
+        - Allows for heterogeneous long-run relationships
+
+        **Fully-Modified Quantile Regression:**
+        - Addresses endogeneity in quantile framework
+        - Corrects for serial correlation
+
+        **Augmented Quantile Cointegration:**
+        - Enhanced power and efficiency
+        - Robust to distributional assumptions
+
+        **Applications:**
+        - Tail dependence analysis
+        - Asymmetric market linkages
+        - Risk management
+        - Extreme event analysis
+        """)
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **R Packages:**
+        - `ARDL`: Bounds testing
+        - `urca`: Classical methods
+        - `quantreg`: Quantile methods
+        """)
+    with col2:
+        static("""
+        **GAUSS:**
+        - `tspdlib`: Fourier cointegration
+        - Bootstrap procedures
+        """)
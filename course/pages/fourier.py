@@ -0,0 +1,158 @@
+"""Fourier Methods page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import fourier_adf
+
+
+def render():
+    static('<p class="section-header">🌊 Fourier Methods Revolution</p>', """
+    <div class="method-card">
+        <h3>🔥 Revolutionary Approach to Structural Breaks</h3>
+        <p><strong>Core Innovation:</strong> Fourier approximations replace traditional dummy variables, 
+        allowing flexible modeling of smooth, gradual, and multiple structural changes without requiring 
+        knowledge of break dates.</p>
+    </div>
+    """, "---")
+
+    # Why Fourier
+    with st.expander("💡 Why Fourier Methods?", expanded=True):
+        static("""
+        ### The Structural Break Problem
+
+        **Traditional Approach Limitations:**
+        - Requires knowing exact break dates
+        - Assumes sharp, discrete breaks
+        - Limited to small number of breaks
+        - Poor power with unknown breaks
+
+        **Fourier Solution:**
+        - ✅ No need to specify break dates
+        - ✅ Captures smooth, gradual transitions
+        - ✅ Flexible functional form
+        - ✅ Approximates any deterministic function
+        - ✅ Superior power in presence of structural changes
+
+        ### Mathematical Foundation
+        Fourier series can approximate any deterministic function:
+        """)
+
+        st.latex(r"""
+        f(t) = \alpha_0 + \sum_{k=1}^{n} \left[\alpha_k \cos\left(\frac{2\pi kt}{T}\right) + \beta_k \sin\left(\frac{2\pi kt}{T}\right)\right]
+        """)
+
+        static("""
+        Where:
+        - `k` = frequency component
+        - `T` = sample size
+        - `α, β` = Fourier coefficients
+        """)
+
+    # Unit Root
+    with st.expander("📈 Fourier Unit Root Tests"):
+        static("""
+        **Enders-Lee Fourier ADF Test:**
+        - Extends ADF with Fourier terms
+        - Captures smooth transitions
+        - Optimal frequency selection
+
+        **Fourier-GLS:**
+        - GLS detrending with Fourier approximation
+        - Enhanced power
+        - Efficient estimation
+
+        **Fourier KPSS:**
+        - Stationarity testing with structural breaks
+        - Complementary to Fourier ADF
+
+        **Key Features:**
+        - Single frequency component often sufficient
+        - Data-driven frequency selection
+        - Robust to break form misspecification
+        """)
+
+        fourier_adf.render("fourier-fadf")
+
+    # Cointegration
+    with st.expander("🔗 Fourier Cointegration"):
+        static("""
+        **Fourier ADL (Banerjee et al.):**
+        - Distributed lag model with Fourier components
+        - Tests for cointegration with smooth breaks
+
+        **Fourier ARDL Bounds Test:**
+        - Combines ARDL flexibility with Fourier power
+        - Bootstrap critical values
+        - Machine learning integration for optimal specification
+
+        **Johansen with Fourier:**
+        - Multiple cointegrating vectors
+        - Fourier deterministic components
+        - System estimation
+
+        **Applications:**
+        - Energy-economy relationships
+        - Financial market linkages
+        - Environmental Kuznets curves
+        """)
+
+    # VECM
+    with st.expander("⚡ Fourier VECM"):
+        static("""
+        **Fourier Vector Error Correction Model:**
+        - Explicit error correction equations with Fourier terms
+        - Long-run and short-run dynamics with structural breaks
+        - Fourier deterministic components in levels and differences
+
+        **Model Structure:**
+        """)
+
+        st.latex(r"""
+        \Delta Y_t = \alpha\beta'Y_{t-1} + \gamma F(t) + \sum_{i=1}^{p-1}\Gamma_i\Delta Y_{t-i} + \epsilon_t
+        """)
+
+        static("""
+        Where `F(t)` represents Fourier terms
+
+        **Advantages:**
+        - Captures time-varying equilibrium
+        - Smooth adjustment dynamics
+        - No need for dummy variables
+        """)
+
+    # Causality
+    with st.expander("🔄 Fourier Causality Testing"):
+        static("""
+        **Fourier Toda-Yamamoto:**
+        - Causality testing with structural breaks
+        - Level VAR with Fourier approximation
+        - Robust to integration order
+
+        **Nazlioglu et al. Fourier Granger Causality:**
+        - Gradual shifts in causal relationships
+        - Bootstrap critical values
+        - Frequency component optimization
+
+        **Key Benefits:**
+        - Detects changing causal patterns
+        - Avoids spurious non-causality
+        - Flexible break modeling
+        """)
+
+    # Software
+    static("---", "### 🛠️ Implementation Tools")
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **Software:**
+        - R (custom functions)
+        - GAUSS (tspdlib library)
+        - MATLAB (custom codes)
+        """)
+    with col2:
+        static("""
+        **Best Practices:**
+        - Start with single frequency
+        - Use information criteria for selection
+        - Bootstrap for critical values
+        """)
@@ -0,0 +1,239 @@
+"""GARCH Models page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import dcc, garch, mgarch
+
+
+def render():
+    static('<p class="section-header">📈 GARCH Family Models</p>', """
+    <div class="method-card">
+        <h3>💹 Modeling Volatility Dynamics</h3>
+        <p><strong>Core Purpose:</strong> GARCH models capture time-varying volatility and volatility 
+        clustering - key features of financial and economic time series.</p>
+    </div>
+    """)
+
+    # Univariate GARCH
+    with st.expander("📊 Univariate GARCH Models", expanded=True):
+        static("""
+        ### Foundation Volatility Models
+
+        **GARCH(p,q) Specification:**
+        """)
+
+        st.latex(r"""
+        \sigma_t^2 = \omega + \sum_{i=1}^p \alpha_i \epsilon_{t-i}^2 + \sum_{j=1}^q \beta_j \sigma_{t-j}^2
+        """)
+
+        static("""
+        Where:
+        - σ²ₜ = conditional variance
+        - ε²ₜ = squared residuals (ARCH term)
+        - σ²ₜ₋₁ = lagged variance (GARCH term)
+
+        **Key Properties:**
+        - Captures volatility clustering
+        - Heavy-tailed distributions
+        - Persistent volatility shocks
+
+        **EGARCH (Exponential GARCH):**
+        - Asymmetric volatility responses
+        - Leverage effects (bad news > good news)
+        - Log specification ensures positive variance
+
+        **TGARCH/GJR-GARCH (Threshold GARCH):**
+        - Separate effects for positive and negative shocks
+        - Captures asymmetric volatility
+        - Widely used in finance
+
+        **PGARCH (Power GARCH):**
+        - Flexible power transformation
+        - Accommodates various distributions
+
+        **IGARCH (Integrated GARCH):**
+        - Persistent volatility shocks
+        - Unit root in variance equation
+        """)
+
+        st.info("💡 **Financial Fact**: Volatility clustering - large changes tend to be followed by large changes")
+        garch.render("garch-univariate")
+
+    # Extensions
+    with st.expander("🚀 GARCH Extensions", expanded=True):
+        static("""
+        ### Advanced Specifications
+
+        **GARCH-M (GARCH in Mean):**
+        - Volatility appears in mean equation
+        - Risk-return tradeoff modeling
+        - Time-varying risk premium
+
+        **QGARCH (Quadratic GARCH):**
+        - Quadratic terms in variance equation
+        - More flexible asymmetry
+
+        **AVGARCH (Asymmetric Volatility GARCH):**
+        - General asymmetric specification
+        - Multiple asymmetry channels
+
+        **Component GARCH:**
+        - Separates permanent and transitory components
+        - Long-run and short-run volatility
+
+        **FIGARCH (Fractionally Integrated GARCH):**
+        - Long memory in volatility
+        - Fractional integration parameter
+        - Gradual decay of shocks
+
+        **HYGARCH (Hyperbolic GARCH):**
+        - Generalization of FIGARCH
+        - Flexible persistence structure
+
+        **Regime-Switching GARCH:**
+        - Multiple volatility regimes
+        - Markov-switching dynamics
+        - Captures structural changes
+
+        **Time-Varying Coefficient GARCH:**
+        - Parameters evolve over time
+        - Adapts to changing market conditions
+        """)
+
+    # Multivariate
+    with st.expander("🔗 Multivariate GARCH 🔥", expanded=True):
+        static("""
+        ### System Volatility Modeling
+
+        **BEKK Model:**
+        - Ensures positive definite covariance matrix
+        - Flexible cross-market spillovers
+        - Computationally intensive
+
+        **DCC-GARCH (Dynamic Conditional Correlation):**
+        - Time-varying correlations
+        - Two-step estimation (efficient)
+        - Most popular multivariate GARCH
+
+        **Model Structure:**
+        """)
+
+        st.latex(r"""
+        H_t = D_t R_t D_t
+        """)
+
+        static("""
+        Where:
+        - Dₜ = diagonal matrix of conditional standard deviations
+        - Rₜ = time-varying correlation matrix
+
+        **GOGARCH (Generalized Orthogonal GARCH):**
+        - Independent component analysis
+        - Reduces dimensionality
+        - Efficient estimation
+
+        **CCC-GARCH (Constant Conditional Correlation):**
+        - Constant correlations (simplification)
+        - Computationally efficient
+        - Benchmark model
+
+        **Applications:**
+        - Portfolio optimization
+        - Risk management (VaR, CVaR)
+        - Contagion analysis
+        - Hedge ratios
+        """)
+
+        st.success(
+            "✅ **Industry Standard**: DCC-GARCH is widely used in finance industry for portfolio risk management")
+        dcc.render("garch-dcc")
+        mgarch.render("garch-mgarch")
+
+    # Integration
+    with st.expander("🌟 GARCH Integration with Other Methods 🆕", expanded=True):
+        static("""
+        ### Hybrid GARCH Frameworks
+
+        **ARDL-GARCH Models:**
+        - Mean equation: ARDL for cointegration
+        - Variance equation: GARCH for volatility
+        - Captures both long-run relationships and volatility dynamics
+
+        **Quantile-GARCH:**
+        - Quantile regression in mean equation
+        - GARCH variance specification
+        - Distribution-dependent volatility
+
+        **Wavelet-GARCH Decomposition:**
+        - Decompose series using wavelets
+        - Apply GARCH to each scale
+        - Multi-scale volatility modeling
+        - Separate noise from signal
+
+        **Fourier-GARCH with Structural Breaks:**
+        - Fourier approximation for breaks in mean
+        - GARCH for conditional variance
+        - Smooth transitions in volatility regimes
+
+        **Applications:**
+        - Energy price modeling with structural breaks
+        - Financial crisis volatility analysis
+        - Multi-scale risk assessment
+        - Time-varying risk-return relationships
+        """, """
+        <div class="highlight-box">
+        🔥 <strong>Cutting Edge:</strong> Hybrid GARCH models represent the frontier of 
+        volatility research, combining multiple methodologies!
+        </div>
+        """)
+
+    # Model Selection
+    with st.expander("🎯 Model Selection & Diagnostics"):
+        static("""
+        ### Choosing and Validating GARCH Models
+
+        **Information Criteria:**
+        - AIC (Akaike Information Criterion)
+        - BIC (Bayesian Information Criterion)
+        - HQIC (Hannan-Quinn)
+
+        **Standardized Residuals Tests:**
+        - Ljung-Box test for serial correlation
+        - ARCH-LM test for remaining ARCH effects
+        - Jarque-Bera test for normality
+
+        **Volatility Forecasting:**
+        - One-step ahead forecasts
+        - Multi-step ahead forecasts
+        - Forecast evaluation metrics (MSE, MAE, QLIKE)
+
+        **Best Practices:**
+        - Start with GARCH(1,1) - often sufficient
+        - Check for leverage effects (EGARCH/GJR)
+        - Consider long memory (FIGARCH) if needed
+        - Validate with out-of-sample forecasting
+        """)
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        static("""
+        **R Packages:**
+        - `rugarch`: Comprehensive
+        - `rmgarch`: Multivariate
+        - `fGarch`: Extended models
+        """)
+    with col2:
+        static("""
+        **EViews:**
+        - User-friendly GARCH
+        - Built-in diagnostics
+        - Extensive options
+        """)
+    with col3:
+        static("""
+        **MATLAB:**
+        - Econometrics Toolbox
+        - MFE Toolbox (Kevin Sheppard)
+        """)
@@ -0,0 +1,71 @@
+"""Home page."""
+import streamlit as st
+
+from course.fragments import static
+
+
+def render():
+    static(
+        '<p class="main-header">🎓 Advanced Econometric Methods</p>',
+        '<p style="text-align: center; font-size: 1.3rem; color: #555;">Master Modern Time Series & Econometric Techniques</p>',
+        "---",
+    )
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        static("""
+        <div class="method-card">
+            <h3>🔬 Advanced Methods</h3>
+            <p>Learn cutting-edge econometric techniques including Fourier transforms, Wavelet analysis, and Quantile methods</p>
+        </div>
+        """)
+
+    with col2:
+        static("""
+        <div class="method-card">
+            <h3>💡 Practical Applications</h3>
+            <p>Apply methods to real-world problems in finance, energy economics, and policy analysis</p>
+        </div>
+        """)
+
+    with col3:
+        static("""
+        <div class="method-card">
+            <h3>🛠️ Hands-on Tools</h3>
+            <p>Master R, Python, MATLAB, and specialized econometric software packages</p>
+        </div>
+        """)
+
+    static("---", "## 🎯 What You'll Master")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        static("""
+        ### Core Competencies
+        - **Unit Root Testing**: Classical & advanced Fourier/Quantile methods
+        - **Cointegration Analysis**: ARDL, Fourier, and Quantile approaches
+        - **Causality Testing**: Time-varying and frequency-domain methods
+        - **Nonlinear Modeling**: NARDL and asymmetric dynamics
+        - **Volatility Modeling**: Complete GARCH family
+        """)
+
+    with col2:
+        static("""
+        ### Advanced Techniques
+        - **Wavelet Analysis**: Multi-scale time-frequency decomposition
+        - **Fourier Methods**: Smooth structural breaks modeling
+        - **Quantile Regression**: Distribution-specific analysis
+        - **Rolling/Recursive Methods**: Time-varying parameters
+        - **Hybrid Models**: Integrated cutting-edge frameworks
+        """)
+
+    static("---", """
+    <div class="info-box">
+        <h3>📌 Course Structure</h3>
+        <p>This comprehensive program covers <strong>10 major modules</strong> spanning classical and modern econometric methods. 
+        Each module builds progressively, from foundational concepts to advanced hybrid applications.</p>
+        <p><strong>Perfect for:</strong> Graduate students, researchers, data scientists, and economists seeking advanced time series expertise.</p>
+    </div>
+    """)
@@ -0,0 +1,279 @@
+"""Hybrid Applications page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import fourier_qardl, rolling, stability, wavelet_nardl
+
+
+def render():
+    static('<p class="section-header">🚀 Advanced Hybrid Applications</p>', """
+    <div class="method-card">
+        <h3>🔥🔥 Comprehensive Framework Integration</h3>
+        <p><strong>The Frontier:</strong> Combining multiple advanced methods creates powerful 
+        frameworks that capture complex, multi-dimensional economic phenomena.</p>
+    </div>
+    """)
+
+    # Module 1
+    with st.expander("🎯 Module 1: Fourier-Quantile-ARDL Hybrid 🔥", expanded=True):
+        static("""
+        ### Triple Integration Framework
+
+        **Combining Three Powerful Methods:**
+        1. **Fourier Functions**: Smooth structural breaks
+        2. **Quantile Regression**: Distribution-specific analysis
+        3. **ARDL**: Flexible dynamics and mixed integration
+
+        **Q-ARDL with Fourier Structural Breaks:**
+        - Quantile-specific long-run relationships
+        - Fourier approximation for smooth breaks
+        - No need to specify break dates
+        - Distribution-dependent structural changes
+
+        **Scale and Location-Specific Dynamics:**
+        - Different relationships at different quantiles
+        - Time-varying across the distribution
+        - Captures heterogeneity comprehensively
+
+        **Asymmetric Adjustments with Smooth Transitions:**
+        - Combine NARDL with Fourier-Quantile
+        - Positive/negative asymmetries vary across quantiles
+        - Structural breaks in asymmetric responses
+
+        **Applications:**
+        - Energy-growth nexus with policy regime changes
+        - Income inequality dynamics over time
+        - Climate change impacts across development levels
+        - Financial market integration with crises
+        """, """
+        <div class="highlight-box">
+        💎 <strong>Research Frontier:</strong> This triple combination is at the cutting edge 
+        of econometric research, with few published applications!
+        </div>
+        """)
+        fourier_qardl.render("hybrid-fqardl")
+
+    # Module 2
+    with st.expander("🌊 Module 2: Wavelet-NARDL with GARCH 🔥", expanded=True):
+        static("""
+        ### Multi-Scale Asymmetric Volatility Framework
+
+        **Integration Strategy:**
+        1. **Wavelet Decomposition**: Separate time scales
+        2. **NARDL**: Asymmetric cointegration at each scale
+        3. **GARCH**: Time-varying volatility at each scale
+
+        **Multi-Scale Asymmetric Volatility:**
+        - Different asymmetries at different time horizons
+        - Short-run vs. long-run asymmetric volatility
+        - Scale-specific risk analysis
+
+        **Time-Frequency Conditional Heteroskedasticity:**
+        - Volatility clustering across scales
+        - Frequency-dependent GARCH effects
+        - Complete risk characterization
+
+        **Crisis Period Analysis:**
+        - Identify crisis frequencies
+        - Scale-specific contagion
+        - Time-varying correlation during turmoil
+        - Multi-horizon risk assessment
+
+        **Practical Applications:**
+
+        **Energy Markets:**
+        - Short-term: Daily trading volatility with asymmetric responses
+        - Medium-term: Seasonal patterns with NARDL
+        - Long-term: Structural trends with GARCH persistence
+
+        **Financial Contagion:**
+        - High frequency: Intraday spillovers
+        - Medium frequency: Weekly co-movements
+        - Low frequency: Long-term integration
+
+        **Climate Finance:**
+        - Multiple time scales of climate risk
+        - Asymmetric responses to extreme weather
+        - Time-varying volatility of green assets
+        """)
+
+        st.success(
+            "✅ **Power**: This framework captures asymmetries, structural changes, and volatility simultaneously across time scales!")
+        wavelet_nardl.render("hybrid-wnardl")
+
+    # Module 3
+    with st.expander("📊 Module 3: Rolling/Recursive Methods with All Tools 🔥", expanded=True):
+        static("""
+        ### Time-Varying Parameter Framework
+
+        **Core Concept:**
+        Apply ALL methods in rolling or recursive windows to capture time-varying parameters
+
+        **Time-Varying Fourier Cointegration:**
+        - Rolling window Fourier ARDL
+        - Track evolution of structural breaks
+        - Changing frequency components over time
+        - Optimal window size selection
+
+        **Rolling Wavelet Coherence:**
+        - Time-varying coherence over time and frequency
+        - Evolution of lead-lag relationships
+        - Changing synchronization patterns
+        - Crisis vs. normal period dynamics
+
+        **Recursive Quantile Causality:**
+        - Forward-expanding quantile causality tests
+        - Tracks emergence/disappearance of causality
+        - Distribution-specific causal evolution
+        - Early warning system capabilities
+
+        **Dynamic GARCH Parameters:**
+        - Rolling estimation of GARCH models
+        - Time-varying persistence
+        - Changing leverage effects
+        - Regime transition detection
+
+        **Methodology:**
+        """, """
+        **Rolling Window:**
+        - Fixed window size (e.g., 5 years)
+        - Slides forward one period at a time
+        - Produces time series of parameter estimates
+        - Bootstrap confidence intervals
+
+        **Recursive:**
+        - Expanding window from start
+        - Accumulates information over time
+        - CUSUM and CUSUMSQ tests for stability
+        - Identifies structural break timing
+        """, """
+        **Applications:**
+
+        **Policy Regime Changes:**
+        - Track parameter changes around policy interventions
+        - Quantify effectiveness evolution
+        - Identify optimal policy windows
+
+        **Financial Crises Detection:**
+        - Early warning indicators
+        - Real-time stability monitoring
+        - Regime shift identification
+
+        **Time-Varying Elasticities:**
+        - Price elasticity evolution
+        - Income elasticity dynamics
+        - Cross-price elasticity changes
+        """)
+
+        rolling.render("hybrid-rolling")
+        stability.render("hybrid-stability")
+
+    # Module 4
+    with st.expander("🎯 Module 4: Complete Decision Framework", expanded=True):
+        static("""
+        ### Integrated Methodological Workflow
+
+        **Step-by-Step Research Design:**
+
+        **Phase 1: Initial Exploration**
+        1. **Data Visualization**: Time plots, histograms, correlations
+        2. **Descriptive Statistics**: Distribution properties, outliers
+        3. **Wavelet Analysis**: Identify dominant frequencies and scales
+
+        **Phase 2: Stationarity & Integration**
+        1. **Classical Tests**: ADF, PP, KPSS
+        2. **If structural breaks suspected**: Fourier unit root tests
+        3. **If distribution concerns**: Quantile unit root tests
+        4. **Decision**: Proceed to cointegration if I(1)
+
+        **Phase 3: Cointegration Analysis**
+        1. **Start with ARDL**: Bounds testing (most flexible)
+        2. **If breaks present**: Fourier-ARDL
+        3. **If asymmetry suspected**: NARDL or W-NARDL
+        4. **If distribution matters**: Q-ARDL
+        5. **If all of above**: Fourier-Quantile-NARDL hybrid
+
+        **Phase 4: Causality Testing**
+        1. **Time domain**: Granger causality or Toda-Yamamoto
+        2. **With breaks**: Fourier causality
+        3. **Frequency domain**: Wavelet causality
+        4. **Distribution**: Quantile causality
+        5. **Comprehensive**: Combine all approaches
+
+        **Phase 5: Volatility Modeling**
+        1. **Test for ARCH effects**: Ljung-Box, ARCH-LM
+        2. **Choose GARCH specification**: Start with GARCH(1,1)
+        3. **If asymmetry**: EGARCH or GJR-GARCH
+        4. **If multivariate**: DCC-GARCH
+        5. **Integration**: ARDL-GARCH, Wavelet-GARCH, etc.
+
+        **Phase 6: Stability Analysis**
+        1. **Rolling/recursive estimation**: All key parameters
+        2. **CUSUM tests**: Identify break points
+        3. **Bootstrap confidence bands**: Uncertainty quantification
+
+        **Phase 7: Validation & Robustness**
+        1. **Diagnostic tests**: Residual analysis, specification tests
+        2. **Out-of-sample forecasting**: Predictive accuracy
+        3. **Alternative specifications**: Sensitivity analysis
+        4. **Robustness checks**: Different periods, frequencies
+        """, """
+        <div class="highlight-box">
+        📋 <strong>Practical Wisdom:</strong> Not every study needs every method! 
+        Choose based on research question, data properties, and theoretical foundation.
+        </div>
+        """)
+
+    # Real Applications
+    with st.expander("🌍 Real-World Application Examples"):
+        static("""
+        ### Case Studies Across Domains
+
+        **Case 1: Energy-GDP Nexus (Complete Framework)**
+        - Fourier-ARDL: Long-run with smooth breaks
+        - W-NARDL: Multi-scale asymmetries
+        - Wavelet coherence: Time-frequency relationships
+        - DCC-GARCH: Volatility spillovers
+        - Rolling quantile causality: Time-varying effects
+
+        **Case 2: Financial Contagion Analysis**
+        - Quantile cointegration: Tail dependence
+        - Wavelet coherence: Crisis frequency identification
+        - DCC-GARCH: Dynamic correlations
+        - Quantile causality: Extreme event transmission
+
+        **Case 3: Climate Change Economics**
+        - Fourier cointegration: Gradual environmental changes
+        - Quantile-ARDL: Different effects across countries
+        - Wavelet analysis: Multiple climate cycles
+        - NARDL: Asymmetric policy responses
+
+        **Case 4: Monetary Policy Effectiveness**
+        - Fourier-VECM: Policy regime breaks
+        - Rolling ARDL: Time-varying transmission
+        - Quantile causality: Distributional effects
+        - GARCH-M: Risk-adjusted policy impacts
+        """)
+
+    # Software Integration
+    static("---", "### 🛠️ Integrated Software Workflow")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **Primary Tools:**
+        - **R**: Most flexible, free, extensive packages
+        - **MATLAB**: Best for wavelets and advanced numerics
+        - **GAUSS**: Fourier methods (tspdlib)
+        - **EViews**: User-friendly for NARDL/GARCH
+        """)
+    with col2:
+        static("""
+        **Workflow Strategy:**
+        - Data preparation: R or Python
+        - Unit roots & cointegration: R
+        - Wavelets: MATLAB or R (biwavelet)
+        - NARDL: EViews or R (nardl)
+        - GARCH: R (rugarch) or EViews
+        - Visualization: R (ggplot2)
+        """)
@@ -0,0 +1,180 @@
+"""Nonlinear ARDL page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import nardl, wavelet_nardl
+
+
+def render():
+    static('<p class="section-header">🔄 Nonlinear ARDL Models</p>', """
+    <div class="method-card">
+        <h3>🚀 Capturing Asymmetric Dynamics</h3>
+        <p><strong>Core Innovation:</strong> NARDL extends ARDL to capture positive and negative 
+        asymmetries in both short-run and long-run relationships.</p>
+    </div>
+    """)
+
+    # NARDL Framework
+    with st.expander("📚 NARDL Framework (Shin et al.)", expanded=True):
+        static("""
+        ### Asymmetric Long-Run Cointegration
+
+        **Core Concept:**
+        Traditional models assume symmetric responses:
+        - Oil price ↑ $10 = same effect as oil price ↓ $10
+        - NARDL allows: Different responses to increases vs. decreases
+
+        **Positive and Negative Partial Sum Decomposition:**
+        """)
+
+        st.latex(r"""
+        x_t = x_0 + x_t^+ + x_t^-
+        """)
+
+        static("""
+        Where:
+        """)
+
+        st.latex(r"""
+        x_t^+ = \sum_{i=1}^t \Delta x_i^+ = \sum_{i=1}^t \max(\Delta x_i, 0)
+        """)
+
+        st.latex(r"""
+        x_t^- = \sum_{i=1}^t \Delta x_i^- = \sum_{i=1}^t \min(\Delta x_i, 0)
+        """)
+
+        static("""
+        **Asymmetric Dynamic Multipliers:**
+        - **Short-run asymmetries**: Immediate response differences
+        - **Long-run asymmetries**: Equilibrium relationship differences
+        - **Adjustment asymmetries**: Different speeds of adjustment
+
+        **Testing Procedures:**
+        - Wald tests for short-run asymmetry
+        - Wald tests for long-run asymmetry
+        - Bounds test for cointegration
+        """)
+
+        st.success(
+            "✅ **Key Advantage**: Captures realistic economic behavior where increases and decreases have different impacts")
+
+        nardl.render("nardl-lab")
+
+    # Applications
+    with st.expander("🌍 NARDL Applications", expanded=True):
+        static("""
+        ### Real-World Economic Asymmetries
+
+        **1. Oil Price Pass-Through:**
+        - **Rockets and Feathers**: Prices rise quickly but fall slowly
+        - Gasoline retail pricing
+        - Airline ticket pricing
+        - Transportation costs
+
+        **2. Exchange Rate Effects:**
+        - Depreciation vs. appreciation impacts
+        - Import vs. export price responses
+        - Currency crisis asymmetries
+        - Trade balance adjustments
+
+        **3. Policy Asymmetries:**
+        - Monetary policy tightening vs. easing
+        - Fiscal stimulus vs. austerity
+        - Interest rate changes
+        - Tax policy effects
+
+        **4. Financial Markets:**
+        - Good news vs. bad news effects
+        - Bull vs. bear market dynamics
+        - Volatility asymmetries
+        - Risk premium variations
+
+        **5. Environmental Economics:**
+        - Carbon pricing asymmetries
+        - Energy efficiency responses
+        - Climate policy impacts
+        """, """
+        <div class="highlight-box">
+        💼 <strong>Industry Relevance:</strong> NARDL is extensively used in central banks, 
+        energy companies, and financial institutions for policy analysis and forecasting.
+        </div>
+        """)
+
+    # Quantile ARDL
+    with st.expander("📊 Quantile ARDL (Q-ARDL) 🆕", expanded=True):
+        static("""
+        ### Location-Specific Long-Run Relationships
+
+        **Cho et al. Q-ARDL Framework:**
+        Combines ARDL with quantile regression to analyze:
+        - Different cointegrating relationships at different quantiles
+        - Distribution-dependent error correction
+        - Heterogeneous long-run equilibria
+
+        **Key Features:**
+        - **Quantile-Specific Error Correction**: Adjustment speeds vary across distribution
+        - **Location-Specific Dynamics**: Different relationships in tails vs. center
+        - **Bootstrap Inference**: Robust critical values
+
+        **Applications:**
+        - **Income Distribution**: Growth effects differ across income levels
+        - **Financial Risk**: Different dynamics in good vs. bad times
+        - **Regional Analysis**: Heterogeneous responses across regions
+
+        **Advantages Over Standard ARDL:**
+        - Captures heterogeneity across distribution
+        - Robust to outliers and non-normal errors
+        - Provides complete distributional picture
+        - Better for extreme value analysis
+        """)
+
+    # Wavelet-NARDL
+    with st.expander("🌊 Wavelet-NARDL Integration 🔥🆕", expanded=True):
+        static("""
+        ### Multi-Scale Asymmetric Analysis
+
+        **Jammazi et al. Wavelet-Based NARDL:**
+        Revolutionary combination of wavelet decomposition and NARDL
+
+        **Methodology:**
+        1. **Wavelet Decomposition**: Decompose series using MODWT
+        2. **Denoising**: Remove noise components
+        3. **NARDL Estimation**: Apply NARDL to decomposed series
+        4. **Multi-Scale Analysis**: Analyze asymmetries at each scale
+
+        **Advantages:**
+        - **Noise Removal**: Better signal extraction
+        - **Scale-Specific Asymmetries**: Different asymmetries at different horizons
+        - **Improved Model Fit**: Better diagnostics and forecasting
+        - **Time-Frequency Insights**: When and at what frequencies asymmetries occur
+
+        **Applications:**
+        - Energy market dynamics with multiple cycles
+        - Financial contagion across time scales
+        - Climate-economy relationships
+        - Multi-horizon policy analysis
+        """, """
+        <div class="highlight-box">
+        🔥 <strong>Cutting Edge:</strong> W-NARDL represents the frontier of asymmetric 
+        cointegration analysis, published in top-tier journals!
+        </div>
+        """)
+        wavelet_nardl.render("nardl-wavelet")
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **R Packages:**
+        - `nardl`: NARDL estimation
+        - `wavelets`: Wavelet decomposition
+        - `quantreg`: Quantile methods
+        """)
+    with col2:
+        static("""
+        **EViews:**
+        - Built-in NARDL procedures
+        - User-friendly interface
+        - Automated testing
+        """)
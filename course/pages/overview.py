@@ -0,0 +1,240 @@
+"""Course Overview page."""
+import streamlit as st
+
+from course.fragments import static
+
+
+def render():
+    static('<p class="section-header">🎯 Complete Course Structure</p>', """
+    <div class="info-box">
+        <h3>📚 Comprehensive Learning Journey</h3>
+        <p>This course provides complete mastery of modern econometric methods, from classical foundations 
+        to cutting-edge hybrid applications. Designed for researchers, data scientists, and economists 
+        seeking advanced time series expertise.</p>
+    </div>
+    """, "---", "## 📖 Curriculum Modules")
+
+    # Create curriculum overview
+    modules = [
+        {
+            "module": "Unit Root & Stationarity",
+            "icon": "📈",
+            "topics": ["Classical Tests (ADF, PP, KPSS)", "Fourier Unit Root Tests", "Quantile Unit Root Tests"],
+            "level": "Foundation → Advanced"
+        },
+        {
+            "module": "Cointegration Methods",
+            "icon": "🔗",
+            "topics": ["Classical Methods", "ARDL Bounds Testing", "Fourier Cointegration", "Quantile Cointegration"],
+            "level": "Core → Advanced"
+        },
+        {
+            "module": "Fourier Methods",
+            "icon": "🌊",
+            "topics": ["Theory & Applications", "Fourier Unit Roots", "Fourier Cointegration", "Fourier VECM",
+                       "Fourier Causality"],
+            "level": "Advanced"
+        },
+        {
+            "module": "Causality & VECM",
+            "icon": "⚡",
+            "topics": ["Fourier VECM", "Fourier Causality", "Quantile Causality", "Wavelet Causality"],
+            "level": "Advanced"
+        },
+        {
+            "module": "Nonlinear ARDL",
+            "icon": "🔄",
+            "topics": ["NARDL Framework", "Applications", "Q-ARDL", "Wavelet-NARDL"],
+            "level": "Advanced → Frontier"
+        },
+        {
+            "module": "Wavelet Analysis",
+            "icon": "🌊",
+            "topics": ["Wavelet Theory", "Decomposition", "Coherence", "Wavelet Causality", "Wavelet-Quantile"],
+            "level": "Advanced → Frontier"
+        },
+        {
+            "module": "Quantile Methods",
+            "icon": "📊",
+            "topics": ["Quantile Unit Roots", "Quantile Cointegration", "Q-ARDL", "Quantile Causality", "QQR"],
+            "level": "Advanced"
+        },
+        {
+            "module": "GARCH Models",
+            "icon": "📈",
+            "topics": ["Univariate GARCH", "Extensions", "Multivariate GARCH", "Hybrid GARCH"],
+            "level": "Core → Advanced"
+        },
+        {
+            "module": "Rolling & Recursive Methods",
+            "icon": "🔄",
+            "topics": ["Rolling Window ARDL", "Recursive ARDL", "Time-Varying Parameters", "Stability Analysis"],
+            "level": "Advanced"
+        },
+        {
+            "module": "Hybrid Applications",
+            "icon": "🚀",
+            "topics": ["Fourier-Quantile-ARDL", "Wavelet-NARDL-GARCH", "Rolling Integration", "Complete Framework"],
+            "level": "Frontier"
+        }
+    ]
+
+    for i, mod in enumerate(modules, 1):
+        with st.expander(f"{mod['icon']} Module {i}: {mod['module']}", expanded=False):
+            topics = "\n".join(f"- {topic}" for topic in mod['topics'])
+            static(f"**Level**: {mod['level']}", "**Key Topics:**", topics)
+
+    # Learning Outcomes
+    static("---", "## 🎓 Learning Outcomes")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        static("""
+        ### Technical Skills
+        - ✅ Master all major unit root and cointegration tests
+        - ✅ Apply Fourier methods for structural breaks
+        - ✅ Conduct wavelet time-frequency analysis
+        - ✅ Implement quantile econometric methods
+        - ✅ Model asymmetries with NARDL
+        - ✅ Estimate complete GARCH family
+        - ✅ Integrate multiple methods into hybrid frameworks
+        - ✅ Use rolling/recursive for time-varying analysis
+        """)
+
+    with col2:
+        static("""
+        ### Research Capabilities
+        - ✅ Design sophisticated econometric studies
+        - ✅ Choose appropriate methods for research questions
+        - ✅ Interpret complex model outputs
+        - ✅ Validate models with proper diagnostics
+        - ✅ Apply methods to real economic data
+        - ✅ Present findings effectively
+        - ✅ Publish in top-tier journals
+        - ✅ Conduct policy-relevant analysis
+        """)
+
+    # Software Proficiency
+    static("---", "## 🛠️ Software Proficiency")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        static("""
+        ### R Programming
+        - urca, ARDL packages
+        - quantreg, nardl
+        - wavelets, biwavelet
+        - rugarch, rmgarch
+        - Custom functions
+        """)
+
+    with col2:
+        static("""
+        ### MATLAB
+        - Wavelet Toolbox
+        - Econometrics Toolbox
+        - Custom implementations
+        - Visualization tools
+        """)
+
+    with col3:
+        static("""
+        ### Other Tools
+        - GAUSS (tspdlib)
+        - EViews (NARDL/GARCH)
+        - Python (alternative)
+        - LaTeX (reporting)
+        """)
+
+    # Target Audience
+    static("---", "## 👥 Who Should Participate")
+
+    audience = [
+        {"title": "PhD Students",
+         "description": "Writing dissertations in econometrics, finance, or applied economics"},
+        {"title": "Researchers", "description": "Publishing in top-tier journals requiring advanced methods"},
+        {"title": "Policy Analysts", "description": "Conducting rigorous policy evaluation and forecasting"},
+        {"title": "Data Scientists", "description": "Working with economic and financial time series"},
+        {"title": "Quantitative Analysts", "description": "Building sophisticated financial models"},
+        {"title": "Central Bank Staff", "description": "Performing monetary policy and stability analysis"}
+    ]
+
+    cols = st.columns(3)
+    for i, aud in enumerate(audience):
+        with cols[i % 3]:
+            static(f"""
+            <div class="info-box">
+                <h4>{aud['title']}</h4>
+                <p>{aud['description']}</p>
+            </div>
+            """)
+
+    # Prerequisites
+    static("---", "## 📋 Prerequisites")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        static("""
+        ### Required Background
+        - Basic econometrics (OLS, hypothesis testing)
+        - Time series fundamentals (stationarity, autocorrelation)
+        - Statistical theory (distributions, inference)
+        - Linear algebra basics
+        - Programming experience (any language)
+        """)
+
+    with col2:
+        static("""
+        ### Recommended (Not Required)
+        - Graduate-level econometrics
+        - Experience with R or MATLAB
+        - Published research experience
+        - Familiarity with GARCH models
+        - Knowledge of cointegration
+        """)
+
+    # Key Features
+    static("---", "## ⭐ Key Course Features")
+
+    features = [
+        {"icon": "🎯", "title": "Hands-On Learning", "desc": "Real data analysis with actual economic datasets"},
+        {"icon": "💻", "title": "Code Provided", "desc": "Complete R, MATLAB, and GAUSS implementations"},
+        {"icon": "📊", "title": "Practical Focus", "desc": "Applied examples from published research"},
+        {"icon": "🔬", "title": "Research-Ready", "desc": "Methods ready for dissertation and publication"},
+        {"icon": "📚", "title": "Comprehensive Materials", "desc": "Slides, code, papers, and datasets"},
+        {"icon": "🤝", "title": "Ongoing Support", "desc": "Post-course consultation and resources"}
+    ]
+
+    cols = st.columns(3)
+    for i, feat in enumerate(features):
+        with cols[i % 3]:
+            static(f"""
+            <div class="method-card" style="min-height: 150px;">
+                <h3>{feat['icon']} {feat['title']}</h3>
+                <p>{feat['desc']}</p>
+            </div>
+            """)
+
+    # Application Domains and Final Message
+    static("---", "## 🌍 Application Domains", """
+    **This course prepares you for research in:**
+
+    - 💹 **Finance**: Asset pricing, volatility forecasting, portfolio management, risk analysis
+    - 🏦 **Monetary Economics**: Policy transmission, interest rate dynamics, exchange rates
+    - ⚡ **Energy Economics**: Energy-growth nexus, oil price analysis, renewable energy
+    - 🌱 **Environmental Economics**: Climate change, pollution, sustainability
+    - 📈 **Macroeconomics**: Business cycles, growth, inflation, unemployment
+    - 🌐 **International Economics**: Trade, capital flows, currency markets
+    - 🏛️ **Development Economics**: Growth determinants, inequality, poverty dynamics
+    """, "---", """
+    <div class="method-card">
+        <h2 style="text-align: center; color: white;">🎓 Transform Your Research Capabilities</h2>
+        <p style="text-align: center; font-size: 1.1rem;">
+            Master the most advanced econometric methods and join the frontier of economic research. 
+            This comprehensive program equips you with tools used in top journals and leading institutions worldwide.
+        </p>
+    </div>
+    """)
@@ -0,0 +1,222 @@
+"""Quantile Methods page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import qqr, quantile, quantile_causality
+
+
+def render():
+    static('<p class="section-header">📊 Quantile Methods</p>', """
+    <div class="method-card">
+        <h3>🎯 Beyond-the-Mean Analysis</h3>
+        <p><strong>Core Innovation:</strong> Quantile methods analyze relationships across the 
+        entire distribution, revealing heterogeneous effects often masked by mean-based approaches.</p>
+    </div>
+    """)
+
+    # Why Quantile
+    with st.expander("💡 Why Quantile Methods?", expanded=True):
+        static("""
+        ### Limitations of Mean-Based Methods
+
+        **Traditional OLS Problem:**
+        - Estimates only conditional mean relationship
+        - Single coefficient for entire distribution
+        - Misses heterogeneity and asymmetries
+        - Sensitive to outliers
+
+        **Quantile Regression Solution:**
+        - Estimates relationships at any quantile (τ)
+        - τ = 0.1 (lower tail), τ = 0.5 (median), τ = 0.9 (upper tail)
+        - Complete distributional picture
+        - Robust to outliers
+
+        **Example - Income and Consumption:**
+        - OLS: Average effect across all income levels
+        - Quantile: Different effects for poor (Q10), middle (Q50), rich (Q90)
+
+        **Applications:**
+        - Risk analysis (tail behavior)
+        - Inequality studies
+        - Extreme event analysis
+        - Asymmetric market responses
+        """)
+
+        st.success("✅ **Key Insight**: Economic relationships often differ dramatically across the distribution!")
+
+        quantile.render("quantile-profile")
+
+    # Unit Root
+    with st.expander("📈 Quantile Unit Root Tests"):
+        static("""
+        ### Distribution-Specific Stationarity Testing
+
+        **Koenker-Xiao Quantile Autoregression:**
+        - Tests unit root at different quantiles
+        - Allows for quantile-dependent persistence
+        - Robust to distributional assumptions
+
+        **Quantile ADF with Fourier:**
+        - Combines quantile and Fourier advantages
+        - Structural breaks vary across distribution
+        - Enhanced power
+
+        **Applications:**
+        - Tail behavior of financial returns
+        - Asymmetric inflation persistence
+        - Distribution-dependent mean reversion
+        """)
+
+    # Cointegration
+    with st.expander("🔗 Quantile Cointegration"):
+        static("""
+        ### Heterogeneous Long-Run Relationships
+
+        **Xiao (2009) Quantile Cointegration:**
+        - Long-run relationships vary across quantiles
+        - Different equilibria for different states
+        - Quantile-specific error correction
+
+        **Fully-Modified Quantile Regression:**
+        - Addresses endogeneity in quantile framework
+        - Corrects for serial correlation
+        - Optimal inference properties
+
+        **Augmented Quantile Cointegration:**
+        - Enhanced efficiency
+        - Better finite sample performance
+        """)
+
+    # Q-ARDL
+    with st.expander("🚀 Quantile ARDL (Q-ARDL) 🔥", expanded=True):
+        static("""
+        ### Location-Specific Dynamics
+
+        **Cho et al. Q-ARDL Framework:**
+        Extends ARDL to quantile regression framework
+
+        **Key Components:**
+        - **Quantile-Specific Cointegration**: Different long-run relationships
+        - **Location-Dependent Error Correction**: Varying adjustment speeds
+        - **Quantile Bounds Testing**: Distribution-specific inference
+        - **Bootstrap Critical Values**: Robust inference
+
+        **Model Structure:**
+        """)
+
+        st.latex(r"""
+        Q_{\tau}(y_t | X_t) = \alpha(\tau) + \sum_{i=1}^p \beta_i(\tau) y_{t-i} + \sum_{j=0}^q \gamma_j(\tau) x_{t-j}
+        """)
+
+        static("""
+        **Advantages:**
+        - Complete distributional analysis
+        - Identifies heterogeneous effects
+        - Robust to outliers
+        - Better for extreme scenarios
+
+        **Applications:**
+        - Income-growth nexus across income distribution
+        - Financial stress transmission
+        - Environmental policy effectiveness
+        - Regional development heterogeneity
+        """)
+
+    # Quantile Causality
+    with st.expander("⚡ Granger Causality in Quantiles", expanded=True):
+        static("""
+        ### Tail-Dependent Causality
+
+        **Troster (2018) Quantile Causality Test:**
+        - Tests causality at different quantiles
+        - Reveals tail dependencies
+        - Non-parametric framework
+
+        **Hybrid Non-Parametric Quantile Causality:**
+        - Combines quantile and non-parametric methods
+        - Robust to model misspecification
+        - Captures complex nonlinear relationships
+
+        **Causality at Extreme Quantiles:**
+        - **Lower tail (Q10)**: Crisis and downturn causality
+        - **Median (Q50)**: Normal period causality
+        - **Upper tail (Q90)**: Boom period causality
+
+        **Why It Matters:**
+        - Different causal mechanisms in good vs. bad times
+        - Risk management insights
+        - Policy effectiveness varies by economic state
+        - Contagion analysis
+
+        **Example Applications:**
+        """)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            static("""
+            **Financial Markets:**
+            - Bear market contagion
+            - Bull market herding
+            - Volatility spillovers
+            - Tail risk transmission
+            """)
+        with col2:
+            static("""
+            **Macroeconomics:**
+            - Recession dynamics
+            - Expansion mechanisms
+            - Asymmetric policy effects
+            - Distributional impacts
+            """)
+        quantile_causality.render("quantile-causality")
+
+    # QQR
+    with st.expander("📊 Quantile-on-Quantile Regression (QQR) 🆕", expanded=True):
+        static("""
+        ### Complete Distributional Mapping
+
+        **QQ Regression Methodology:**
+        - Maps quantiles of X to quantiles of Y
+        - Shows how distribution of one variable affects distribution of another
+        - Local linear regression approach
+
+        **Key Features:**
+        - **Full Distributional Picture**: Not just mean effect
+        - **Heterogeneous Effects**: Different impacts across distributions
+        - **Nonlinear Relationships**: Captures complex patterns
+        - **Visual Interpretation**: Heat maps and contour plots
+
+        **Applications to Energy-Growth Nexus:**
+        - How does energy consumption at different levels (quantiles) affect growth at different levels?
+        - Identifies optimal energy-growth combinations
+        - Policy implications for different development stages
+
+        **Other Applications:**
+        - Income inequality dynamics
+        - Financial risk assessment
+        - Environmental quality-growth relationships
+        - Health-productivity linkages
+        """, """
+        <div class="highlight-box">
+        🎯 <strong>Visualization Power:</strong> QQR produces stunning heat maps showing 
+        the complete relationship landscape across distributions!
+        </div>
+        """)
+        qqr.render("quantile-qqr")
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **R Packages:**
+        - `quantreg`: Core quantile regression
+        - Custom Q-ARDL functions
+        - Causality implementations
+        """)
+    with col2:
+        static("""
+        **Python:**
+        - `statsmodels`: Quantile regression
+        - `scikit-learn`: Quantile forest
+        """)
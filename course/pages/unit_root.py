@@ -0,0 +1,95 @@
+"""Unit Root & Stationarity page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import fourier_adf, unit_root
+
+
+def render():
+    static('<p class="section-header">📈 Stationarity & Unit Root Testing</p>', """
+    <div class="info-box">
+        <strong>Module Overview:</strong> Master the fundamental tools for testing stationarity and unit roots, 
+        from classical methods to cutting-edge Fourier and Quantile approaches.
+    </div>
+    """, "---")
+
+    # Classical Tests
+    with st.expander("📊 Classical Unit Root Tests", expanded=True):
+        static("### Essential Foundation Methods", """
+        **Core Tests:**
+        - **ADF (Augmented Dickey-Fuller)**: Standard unit root testing
+        - **PP (Phillips-Perron)**: Non-parametric correction for serial correlation
+        - **KPSS (Kwiatkowski-Phillips-Schmidt-Shin)**: Testing stationarity (null hypothesis differs)
+
+        **Enhanced Tests:**
+        - **DF-GLS**: Generalized Least Squares detrending for improved power
+        - **Ng-Perron Tests**: Modified information criteria for lag selection
+
+        **Structural Break Tests:**
+        - **Zivot-Andrews Test**: Endogenous single structural break
+        - **Perron Tests**: Unit root with known/unknown break dates
+        """)
+
+        st.info("💡 **Key Insight**: Classical tests may fail to reject unit root in presence of structural breaks")
+
+        unit_root.render("unit-root-classical")
+
+    # Fourier Tests
+    with st.expander("🌊 Fourier Unit Root Tests 🆕", expanded=True):
+        static("### Next-Generation Break Modeling", """
+        **Revolutionary Approach:**
+        - **Enders-Lee Fourier ADF**: Captures smooth, gradual structural changes
+        - **Flexible Fourier Form**: Models unknown number and form of breaks
+        - **Fourier KPSS**: Stationarity testing with trigonometric trends
+        - **Fourier-GLS**: Enhanced power with Fourier approximations
+
+        **Advantages Over Classical Methods:**
+        - No need to specify break dates
+        - Captures multiple smooth transitions
+        - Superior power in presence of gradual shifts
+        - Flexible functional form for structural changes
+        """, """
+        <div class="highlight-box">
+        🔥 <strong>Why Fourier?</strong> Traditional dummy variables require knowing break dates. 
+        Fourier functions approximate structural changes without prior knowledge!
+        </div>
+        """)
+
+        fourier_adf.render("unit-root-fadf")
+
+    # Quantile Tests
+    with st.expander("📊 Quantile Unit Root Tests 🆕"):
+        static("### Distribution-Specific Testing", """
+        **Quantile-Based Approaches:**
+        - **Koenker-Xiao Quantile Autoregression**: Test unit roots at different quantiles
+        - **Quantile ADF with Fourier**: Combines quantile and Fourier advantages
+
+        **Key Applications:**
+        - Tail behavior analysis
+        - Asymmetric responses to shocks
+        - Distribution-dependent persistence
+        - Extreme value analysis
+
+        **Unique Benefits:**
+        - Robust to outliers
+        - Captures heterogeneous dynamics across distribution
+        - Identifies quantile-specific unit roots
+        """)
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **R Packages:**
+        - `urca`: Classical unit root tests
+        - `uroot`: Seasonal unit roots
+        - Custom Fourier functions
+        """)
+    with col2:
+        static("""
+        **Applications:**
+        - Macroeconomic time series
+        - Financial data analysis
+        - Climate change studies
+        """)
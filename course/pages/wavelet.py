@@ -0,0 +1,197 @@
+"""Wavelet Analysis page."""
+import streamlit as st
+
+from course.fragments import static
+from course.labs import coherence, modwt, partial_coherence
+
+
+def render():
+    static('<p class="section-header">🌊 Wavelet Analysis</p>', """
+    <div class="method-card">
+        <h3>🎯 Time-Frequency Domain Analysis</h3>
+        <p><strong>Revolutionary Feature:</strong> Wavelets decompose time series simultaneously 
+        in time AND frequency, revealing when and at what frequencies relationships occur.</p>
+    </div>
+    """)
+
+    # Fundamentals
+    with st.expander("📚 Wavelet Theory Fundamentals", expanded=True):
+        static("""
+        ### Why Wavelets?
+
+        **Limitations of Traditional Methods:**
+        - **Time Domain**: Loses frequency information
+        - **Fourier Analysis**: Loses time localization
+        - **Assumption**: Stationarity over entire sample
+
+        **Wavelet Solution:**
+        - ✅ Simultaneous time-frequency analysis
+        - ✅ Multi-scale decomposition
+        - ✅ Handles non-stationarity
+        - ✅ Localized in both time and frequency
+
+        **Types of Wavelet Transforms:**
+
+        **1. Continuous Wavelet Transform (CWT):**
+        - Smooth, continuous representation
+        - Best for visualization
+        - Cross-wavelet and coherence analysis
+
+        **2. Discrete Wavelet Transform (DWT):**
+        - Efficient computation
+        - Orthogonal decomposition
+        - Multi-resolution analysis
+
+        **3. Maximal Overlap DWT (MODWT):**
+        - Non-decimated (no information loss)
+        - Time-invariant
+        - Best for time series analysis
+        """, """
+        <div class="highlight-box">
+        🎓 <strong>Key Concept:</strong> Wavelets are "little waves" that oscillate for a short time, 
+        unlike sine waves that oscillate forever. This allows localization in time!
+        </div>
+        """)
+
+    # Decomposition
+    with st.expander("🔍 Wavelet Decomposition & Multi-Resolution", expanded=True):
+        static("""
+        ### Multi-Scale Time Series Analysis
+
+        **MODWT Decomposition Process:**
+        Original series decomposed into:
+        - **D1**: High frequency (2-4 periods) - Very short-run
+        - **D2**: Medium-high frequency (4-8 periods) - Short-run
+        - **D3**: Medium frequency (8-16 periods) - Business cycle
+        - **D4**: Medium-low frequency (16-32 periods) - Medium-run
+        - **D5**: Low frequency (32-64 periods) - Long-run
+        - **S5**: Smooth component (>64 periods) - Trend
+
+        **Multi-Resolution Advantages:**
+        - Separate noise from signal
+        - Identify dominant cycles
+        - Scale-specific modeling
+        - Better forecasting at each horizon
+
+        **Applications:**
+        - **Finance**: High-frequency trading vs. long-term investment
+        - **Macro**: Business cycles vs. structural trends
+        - **Energy**: Daily fluctuations vs. seasonal patterns
+        """)
+        modwt.render("wavelet-modwt")
+
+    # Correlation
+    with st.expander("📊 Wavelet Correlation & Covariance"):
+        static("""
+        ### Scale-Specific Relationships
+
+        **Wavelet Correlation Across Scales:**
+        - Measure correlation at each time scale
+        - Identify scale-dependent relationships
+        - Distinguish short-run vs. long-run co-movements
+
+        **Cross-Wavelet Correlation:**
+        - Bivariate wavelet analysis
+        - Reveals common features across series
+        - Identifies synchronized components
+
+        **Lead-Lag Relationships:**
+        - Time-scale dependent causality
+        - Which series leads at which frequencies
+        - Phase difference analysis
+
+        **Practical Uses:**
+        - Portfolio diversification strategies
+        - Economic indicator relationships
+        - Market microstructure analysis
+        """)
+
+    # Coherence
+    with st.expander("🌟 Wavelet Coherence Analysis 🔥", expanded=True):
+        static("""
+        ### Time-Frequency Co-Movement Analysis
+
+        **Continuous Wavelet Transform (CWT):**
+        - Smooth time-frequency representation
+        - Visualizes energy distribution
+        - Identifies dominant frequencies over time
+
+        **Cross-Wavelet Transform:**
+        - Common power between two series
+        - Reveals synchronized oscillations
+        - Time-varying cross-spectral analysis
+
+        **Wavelet Coherence (WCA):**
+        - "Correlation" in time-frequency space
+        - Values from 0 (no coherence) to 1 (perfect coherence)
+        - Statistical significance testing with bootstrapping
+
+        **Phase Differences Interpretation:**
+        - **In-phase (0°)**: Variables move together
+        - **Anti-phase (180°)**: Variables move opposite
+        - **Lead-lag (±90°)**: One variable leads the other
+
+        **Advanced Extensions:**
+        - **Partial Wavelet Coherence**: Controlling for other variables
+        - **Multiple Wavelet Coherence**: Multi-variate relationships
+
+        **Visualization:**
+        - Heat maps showing coherence over time and frequency
+        - Arrows indicating phase relationships
+        - Cone of influence marking reliable regions
+        """, """
+        <div class="highlight-box">
+        📈 <strong>Power of Visualization:</strong> Wavelet coherence plots reveal at a glance 
+        when, for how long, and at what frequencies two variables are related!
+        </div>
+        """)
+        coherence.render("wavelet-coherence")
+        partial_coherence.render("wavelet-partial")
+
+    # Applications
+    with st.expander("🌍 Wavelet Applications"):
+        static("""
+        ### Real-World Use Cases
+
+        **1. Financial Contagion:**
+        - Crisis period identification
+        - Cross-market spillovers
+        - Time-varying correlations
+        - Frequency-dependent contagion
+
+        **2. Energy-Economy Linkages:**
+        - Oil price-GDP relationships
+        - Renewable energy integration
+        - Energy efficiency dynamics
+        - Multi-scale policy effects
+
+        **3. Environmental Economics:**
+        - Climate-economy co-movements
+        - Carbon emission patterns
+        - Environmental Kuznets curve
+        - Sustainability transitions
+
+        **4. International Finance:**
+        - Exchange rate dynamics
+        - Capital flow synchronization
+        - Currency crisis analysis
+        - International trade cycles
+        """)
+
+    # Software
+    static("---", "### 🛠️ Software Implementation")
+    col1, col2 = st.columns(2)
+    with col1:
+        static("""
+        **R Packages:**
+        - `wavelets`: Basic wavelet analysis
+        - `waveslim`: Advanced methods
+        - `biwavelet`: Coherence analysis
+        """)
+    with col2:
+        static("""
+        **MATLAB:**
+        - Wavelet Toolbox
+        - Comprehensive functions
+        - Excellent visualization
+        """)
@@ -0,0 +1,26 @@
+"""Sidebar page registry.
+
+Maps each sidebar label to the module that renders it. Page modules are
+imported the first time they are selected and then stay in ``sys.modules``,
+so a rerun only executes the ``render()`` of the page on screen.
+"""
+import importlib
+
+PAGES = {
+    "🏠 Home": "course.pages.home",
+    "📈 Unit Root & Stationarity": "course.pages.unit_root",
+    "🔗 Cointegration Methods": "course.pages.cointegration",
+    "🌊 Fourier Methods": "course.pages.fourier",
+    "⚡ Causality & VECM": "course.pages.causality",
+    "🔄 Nonlinear ARDL": "course.pages.nardl",
+    "📊 Wavelet Analysis": "course.pages.wavelet",
+    "📉 Quantile Methods": "course.pages.quantile",
+    "📊 GARCH Models": "course.pages.garch",
+    "🚀 Hybrid Applications": "course.pages.hybrid",
+    "🎯 Course Overview": "course.pages.overview",
+}
+
+
+def render_page(label):
+    """Import (once) and render the page registered under ``label``."""
+    importlib.import_module(PAGES[label]).render()
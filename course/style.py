@@ -0,0 +1,20 @@
+"""Course stylesheet.
+
+The CSS lives in ``static/course.css`` and is served by Streamlit's static file
+route (``server.enableStaticServing``). Pages only emit a ``<link>`` to it, so
+the browser fetches and caches the stylesheet once instead of receiving the
+full ``<style>`` block over the websocket on every rerun. The content hash in
+the query string busts the browser cache whenever the file changes.
+"""
+import functools
+import hashlib
+from pathlib import Path
+
+STYLESHEET = Path(__file__).resolve().parent.parent / "static" / "course.css"
+
+
+@functools.lru_cache(maxsize=None)
+def stylesheet_link():
+    """``<link>`` tag for the course stylesheet, versioned by content hash."""
+    digest = hashlib.blake2b(STYLESHEET.read_bytes(), digest_size=8).hexdigest()
+    return f'<link rel="stylesheet" href="app/static/{STYLESHEET.name}?v={digest}">'
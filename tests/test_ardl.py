@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from course.engines.ardl import ardl, bounds_critical_values
+
+
+def _cointegrated(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.standard_normal(n))
+    y = np.zeros(n)
+    for t in range(1, n):
+        y[t] = 0.5 * y[t - 1] + 0.3 * x[t] + 0.2 * x[t - 1] + rng.standard_normal()
+    return y, x
+
+
+def test_bounds_f_matches_statsmodels_uecm():
+    ardl_module = pytest.importorskip("statsmodels.tsa.ardl")
+    y, x = _cointegrated()
+    pmax = qmax = 3
+    result = ardl(y, x, pmax, qmax)
+    p, q = result.order
+    # Drop observations so that statsmodels' sample is the common sample t = max(pmax, qmax)..n-1.
+    start = max(pmax, qmax) - max(p, q)
+    uecm = ardl_module.UECM(pd.Series(y[start:]), p, pd.DataFrame({"x": x[start:]}), {"x": q}, trend="c").fit()
+    assert uecm.nobs == result.nobs
+    assert result.f_stat == pytest.approx(uecm.bounds_test(case=3)[0], rel=1e-9)
+
+
+def test_simulated_bounds_do_not_grow_with_the_sample():
+    # PSS (2001) Table CI(iii), k = 2, 5%: I(0) 3.79, I(1) 4.85.
+    long_sample = bounds_critical_values(2, 50_000, reps=4_000)
+    lower, upper = (bounds[1] for bounds in long_sample["F"])
+    assert lower == pytest.approx(3.79, abs=0.25)
+    assert upper == pytest.approx(4.85, abs=0.25)
+    assert bounds_critical_values(2, 1_000, reps=4_000) is long_sample
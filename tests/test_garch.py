@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from course.engines.garch import garch, loglikelihood, standard_errors
+
+
+def _returns(n=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    e = np.empty(n)
+    s2 = 1.0
+    for t in range(n):
+        e[t] = np.sqrt(s2) * rng.standard_normal()
+        s2 = 0.05 + 0.08 * e[t] ** 2 + 0.9 * s2
+    return e + 0.1
+
+
+POINTS = {
+    ("garch", "normal"): [0.1, 0.05, 0.08, 0.9],
+    ("gjr", "normal"): [0.1, 0.05, 0.05, 0.06, 0.88],
+    ("egarch", "normal"): [0.1, 0.02, 0.15, -0.05, 0.95],
+    ("figarch", "normal"): [0.1, 0.1, 0.2, 0.4, 0.5],
+    ("garch", "t"): [0.1, 0.05, 0.08, 0.9, 7.0],
+}
+
+
+@pytest.mark.parametrize("model, dist", POINTS)
+def test_analytic_scores_match_finite_differences(model, dist):
+    x = _returns(800)
+    x = x / x.std()
+    params = np.array(POINTS[model, dist])
+    scores = loglikelihood(params, x, model, dist)[1].sum(axis=0)
+    numeric = np.empty_like(params)
+    for i in range(params.shape[0]):
+        h = 1e-6 * max(1.0, abs(params[i]))
+        up, down = params.copy(), params.copy()
+        up[i] += h
+        down[i] -= h
+        ll_up = loglikelihood(up, x, model, dist)[0].sum()
+        ll_down = loglikelihood(down, x, model, dist)[0].sum()
+        numeric[i] = (ll_up - ll_down) / (2 * h)
+    np.testing.assert_allclose(scores, numeric, rtol=1e-5, atol=1e-4)
+
+
+@pytest.mark.parametrize("model, vol, o", [("garch", "GARCH", 0), ("gjr", "GARCH", 1), ("egarch", "EGARCH", 1)])
+def test_fit_matches_arch(model, vol, o):
+    arch = pytest.importorskip("arch")
+    r = _returns()
+    ours = garch(r, model)
+    reference = arch.arch_model(r, mean="Constant", vol=vol, p=1, o=o, q=1, rescale=False).fit(disp="off")
+    # The variance recursions start from different backcasts, so the optima differ slightly.
+    assert ours.loglik == pytest.approx(reference.loglikelihood, abs=1.0)
+    np.testing.assert_allclose(ours.params, reference.params.to_numpy(), atol=0.01)
+
+
+def test_standard_errors_flag_a_covariance_that_is_not_positive_definite():
+    se = standard_errors(np.array([[4.0, 0.0], [0.0, -1.0]]))
+    assert se[0] == 2.0
+    assert np.isnan(se[1])
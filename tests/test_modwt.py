@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from course.engines.modwt import modwt, modwt_blocks
+
+
+@pytest.fixture
+def series():
+    return np.cumsum(np.random.default_rng(1).standard_normal(1500))
+
+
+@pytest.mark.parametrize("boundary", ["periodic", "reflection"])
+def test_mra_sums_to_the_series(series, boundary):
+    details = modwt(series, 5, "la8", boundary).details
+    np.testing.assert_allclose(details.sum(axis=-1), series, atol=1e-10)
+
+
+@pytest.mark.parametrize("boundary", ["periodic", "reflection"])
+@pytest.mark.parametrize("output", ["details", "coefficients"])
+def test_blocks_match_the_full_transform(series, boundary, output):
+    full = getattr(modwt(series, 4, "la8", boundary), output)
+    streamed = np.empty_like(full)
+    for start, block in modwt_blocks(series, 4, "la8", boundary, output, block=256):
+        streamed[start:start + block.shape[0]] = block
+    np.testing.assert_allclose(streamed, full, atol=1e-13 * np.abs(series).max())
+
+
+def test_stacked_series_match_separate_transforms(series):
+    other = np.random.default_rng(2).standard_normal(series.shape[0])
+    stacked = modwt(np.stack([series, other]), 3).coefficients
+    np.testing.assert_allclose(stacked[1], modwt(other, 3).coefficients, atol=1e-12)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from course.engines.nardl import decompose, nardl, partial_sums
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, -0.2])
+def test_partial_sums_add_up_to_the_change(threshold):
+    x = np.cumsum(np.random.default_rng(4).standard_normal(500))
+    positive, negative = partial_sums(x, threshold)
+    np.testing.assert_allclose(positive + negative, x - x[0], atol=1e-12)
+    up, down = np.diff(positive), np.diff(negative)
+    # Every change goes wholly to one side.
+    assert np.all((up == 0) | (down == 0))
+    assert np.all(up[up != 0] > threshold) and np.all(down <= max(threshold, 0.0))
+
+
+def test_decompose_interleaves_the_regressors():
+    X = np.cumsum(np.random.default_rng(5).standard_normal((200, 2)), axis=0)
+    sums = decompose(X)
+    np.testing.assert_allclose(sums[:, 0::2] + sums[:, 1::2], X - X[0], atol=1e-12)
+
+
+def _pass_through(n=600, seed=6):
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.standard_normal(n))
+    positive, negative = partial_sums(x)
+    y = np.zeros(n)
+    for t in range(1, n):
+        y[t] = 0.6 * y[t - 1] + 0.8 * positive[t] + 0.2 * negative[t] + rng.standard_normal()
+    return y, x
+
+
+def test_short_run_symmetry_is_tested_when_no_lags_are_kept():
+    # With qmax = 0 both sides keep only dx_t, so the test compares b0+ and b0-.
+    y, x = _pass_through()
+    result = nardl(y, x, pmax=2, qmax=0)
+    stat, pvalue = result.short_run_test[0]
+    assert np.isfinite(stat) and 0.0 <= pvalue <= 1.0
+    assert pvalue < 0.01
+
+
+def test_long_run_multipliers_converge_to_the_long_run_coefficients():
+    y, x = _pass_through()
+    result = nardl(y, x, pmax=2, qmax=2, horizon=200)
+    np.testing.assert_allclose(result.multipliers[..., -1], result.long_run, rtol=1e-6)
+    assert result.long_run[0, 0] == pytest.approx(2.0, abs=0.3)
+    assert result.long_run[0, 1] == pytest.approx(0.5, abs=0.3)
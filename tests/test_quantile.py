@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from course.engines.quantile import check_loss, frisch_newton, rq
+
+
+def _heteroskedastic(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0.0, 2.0, n)
+    X = np.column_stack([np.ones(n), x])
+    y = 1.0 + 0.5 * x + (0.5 + x) * rng.standard_normal(n)
+    return y, X
+
+
+@pytest.mark.parametrize("tau", [0.1, 0.5, 0.9])
+def test_check_loss_matches_statsmodels(tau):
+    regression = pytest.importorskip("statsmodels.regression.quantile_regression")
+    y, X = _heteroskedastic()
+    reference = regression.QuantReg(y, X).fit(q=tau).params
+    ours = frisch_newton(X, y, tau)
+    # QuantReg's IRLS stops near the optimum; the interior point may end slightly below it.
+    assert check_loss(y - X @ ours, tau) <= check_loss(y - X @ reference, tau) * (1.0 + 1e-7)
+
+
+def test_batched_taus_match_single_fits():
+    y, X = _heteroskedastic(500)
+    taus = np.array([0.25, 0.5, 0.75])
+    batched = frisch_newton(X, y, taus)
+    for tau, params in zip(taus, batched):
+        np.testing.assert_allclose(params, frisch_newton(X, y, tau), atol=1e-6)
+
+
+def test_preprocessing_reaches_the_full_optimum():
+    y, X = _heteroskedastic(20_000, seed=3)
+    params, reduced = rq(y, X, 0.3)
+    assert reduced < y.shape[0]
+    full = frisch_newton(X, y, 0.3)
+    # Both solves stop at a relative duality gap of 1e-6.
+    assert check_loss(y - X @ params, 0.3) == pytest.approx(check_loss(y - X @ full, 0.3), rel=1e-6)
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from course.engines.rolling import recursive_residuals, rolling_ols
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(9)
+    X = np.column_stack([np.ones(400), rng.standard_normal((400, 2))])
+    return X @ [1.0, 0.5, -0.3] + rng.standard_normal(400), X
+
+
+@pytest.mark.parametrize("window, min_nobs", [(50, None), (None, 10)])
+def test_updated_moments_match_direct_ols(data, window, min_nobs):
+    y, X = data
+    result = rolling_ols(y, X, window, min_nobs, chunk=64)
+    for i in (0, 63, 64, len(result.ends) - 1):
+        end = result.ends[i]
+        lo = 0 if window is None else end - window + 1
+        params = np.linalg.lstsq(X[lo:end + 1], y[lo:end + 1], rcond=None)[0]
+        np.testing.assert_allclose(result.params[i], params, atol=1e-10)
+
+
+@pytest.mark.parametrize("min_nobs", [1, 3, 401])
+def test_recursive_windows_need_more_observations_than_regressors(data, min_nobs):
+    y, X = data
+    with pytest.raises(ValueError, match="min_nobs"):
+        rolling_ols(y, X, min_nobs=min_nobs)
+
+
+def test_recursive_residuals_are_one_step_prediction_errors(data):
+    y, X = data
+    w = recursive_residuals(y, X, block=16)
+    for t in (3, 17, 399):
+        beta = np.linalg.lstsq(X[:t], y[:t], rcond=None)[0]
+        scale = np.sqrt(1.0 + X[t] @ np.linalg.solve(X[:t].T @ X[:t], X[t]))
+        assert w[t - 3] == pytest.approx((y[t] - X[t] @ beta) / scale, abs=1e-9)
+
+
+def test_collinear_start_is_reported(data):
+    y, X = data
+    X = X.copy()
+    X[:5, 2] = X[:5, 1]
+    with pytest.raises(ValueError, match="raise min_nobs"):
+        recursive_residuals(y, X, min_nobs=4)
@@ -0,0 +1,37 @@
+import os
+
+import numpy as np
+
+from course.engines import storage
+
+
+def test_pruning_keeps_the_newest_files_within_budget(tmp_path, monkeypatch):
+    monkeypatch.setenv("COURSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("COURSE_CACHE_BYTES", str(3 * 8_000 + 1_000))
+    directory = storage.cache_dir("test")
+    maps = []
+    for i in range(5):
+        path = directory / f"{i}.npy"
+        maps.append(storage.write_memmap(path, (1_000,), [(0, np.full(1_000, float(i)))]))
+        os.utime(path, (i, i))
+    assert sorted(p.name for p in directory.glob("*.npy")) == ["2.npy", "3.npy", "4.npy"]
+    # A pruned file stays readable through a map that is still open.
+    assert maps[0][0] == 0.0
+
+
+def test_a_new_file_over_budget_is_kept(tmp_path, monkeypatch):
+    monkeypatch.setenv("COURSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("COURSE_CACHE_BYTES", "100")
+    path = storage.cache_dir("test") / "big.npy"
+    storage.save_array(path, np.zeros(1_000))
+    assert [p.name for p in path.parent.iterdir()] == ["big.npy"]
+
+
+def test_explicit_paths_outside_the_cache_are_not_pruned(tmp_path, monkeypatch):
+    monkeypatch.setenv("COURSE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("COURSE_CACHE_BYTES", "100")
+    outside = tmp_path / "mine"
+    outside.mkdir()
+    storage.save_array(outside / "a.npy", np.zeros(1_000))
+    storage.save_array(outside / "b.npy", np.zeros(1_000))
+    assert sorted(p.name for p in outside.iterdir()) == ["a.npy", "b.npy"]
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from course.engines import critical_values, unit_root
+
+
+def test_tables_refuse_samples_below_the_simulated_range():
+    with pytest.raises(ValueError, match="too few"):
+        critical_values.pvalue(-3.0, "adf", "c", critical_values.SAMPLE_SIZES[0] - 1)
+
+
+def test_adf_critical_values_match_mackinnon():
+    # MacKinnon (2010), constant, T = 100: 1% -3.50, 5% -2.89, 10% -2.58.
+    values = critical_values.critical_values("adf", "c", 100)
+    np.testing.assert_allclose(values, [-3.50, -2.89, -2.58], atol=0.05)
+
+
+def test_pvalue_inverts_the_critical_values():
+    values = critical_values.critical_values("adf", "ct", 250)
+    np.testing.assert_allclose(
+        [critical_values.pvalue(v, "adf", "ct", 250) for v in values], [0.01, 0.05, 0.10], atol=1e-3
+    )
+
+
+def test_zivot_andrews_uses_the_tabulated_break_grid():
+    y = np.cumsum(np.random.default_rng(7).standard_normal(500))
+    step = unit_root.za_step(500)
+    assert step == 5
+    stat, where = unit_root.zivot_andrews(y, "c", step=step)
+    assert (where - int(0.15 * 500)) % step == 0
+    # A finer grid can only lower the minimum.
+    assert unit_root.zivot_andrews(y, "c", step=1)[0] <= stat
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from course.engines.bootstrap import run_bootstrap
+from course.engines.wavelet_causality import (
+    WaveletCausalityBootstrap,
+    bootstrap_pvalues,
+    var_causality,
+    wavelet_causality,
+)
+
+
+@pytest.fixture
+def pair():
+    rng = np.random.default_rng(8)
+    x = rng.standard_normal(600)
+    y = signal.lfilter([0.0, 0.0, 0.5], [1.0, -0.3], x) + rng.standard_normal(600)
+    return y, x
+
+
+@pytest.mark.parametrize("direction", [0, 1])
+def test_one_direction_matches_both(pair, direction):
+    y, x = pair
+    both = var_causality(y, x, 4, 1)
+    single = var_causality(y, x, 4, 1, direction=direction)
+    np.testing.assert_allclose(single[direction], both[direction])
+    assert np.isnan(single[1 - direction]).all()
+    assert single[2] == both[2]
+
+
+def test_bootstrap_draws_and_pvalues(pair):
+    y, x = pair
+    result = wavelet_causality(y, x, 3, pmax=2, workers=1)
+    draws = run_bootstrap(WaveletCausalityBootstrap(y, x, result), 19, seed=0, workers=1, batch_size=8)
+    assert draws.shape == (19, 2, 4, 2)
+    assert np.isfinite(draws).all()
+    p_xy, p_yx = bootstrap_pvalues(result, draws)
+    assert p_xy.shape == p_yx.shape == (4, 2)
+    assert ((p_xy >= 1 / 20) & (p_xy <= 1)).all()
+    # x drives y at the finest scales; the bootstrap must see it.
+    assert p_xy[0].max() == pytest.approx(1 / 20)
+
+
+def test_bootstrap_is_reproducible_for_a_seed(pair):
+    y, x = pair
+    result = wavelet_causality(y, x, 2, pmax=2, workers=1)
+    replicator = WaveletCausalityBootstrap(y, x, result)
+    first = run_bootstrap(replicator, 10, seed=3, workers=1, batch_size=4)
+    np.testing.assert_array_equal(first, run_bootstrap(replicator, 10, seed=3, workers=1, batch_size=4))